@@ -0,0 +1,77 @@
+"""
+Micro-benchmark for ``looks_like_python``.
+
+Compares the compiled rule matcher against the previous implementation, which
+checked every entry of ``MATCH_RULES`` with ``fnmatch``, over the entries of a
+directory (``/usr/bin`` by default) padded to at least 3000 names.
+
+Usage::
+
+    python benchmarks/bench_looks_like_python.py [directory] [--number N]
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import timeit
+from fnmatch import fnmatch
+
+from pythonfinder.utils.path_utils import (
+    EXE_MATCHER,
+    MATCH_RULES,
+    PYTHON_IMPLEMENTATIONS,
+    looks_like_python,
+)
+
+
+def fnmatch_looks_like_python(name: str) -> bool:
+    if not any(name.lower().startswith(py_name) for py_name in PYTHON_IMPLEMENTATIONS):
+        return False
+
+    match = EXE_MATCHER.match(name)
+    if match:
+        return any(fnmatch(name, rule) for rule in MATCH_RULES)
+
+    return False
+
+
+def get_names(directory: str, minimum: int = 3000) -> list[str]:
+    try:
+        names = os.listdir(directory)
+    except OSError:
+        names = []
+    # Pad with plausible /usr/bin entries, a tenth of them python-like
+    index = 0
+    while len(names) < minimum:
+        names.append(f"python3.{index % 10}" if index % 10 == 0 else f"tool-{index}")
+        index += 1
+    return names
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("directory", nargs="?", default="/usr/bin")
+    parser.add_argument("--number", type=int, default=20)
+    args = parser.parse_args()
+
+    names = get_names(args.directory)
+    assert [looks_like_python(n) for n in names] == [
+        fnmatch_looks_like_python(n) for n in names
+    ]
+
+    print(f"{len(names)} names, {len(MATCH_RULES)} rules, best of 5 x {args.number}")
+    results = {}
+    for label, func in (
+        ("fnmatch rules", fnmatch_looks_like_python),
+        ("compiled matcher", looks_like_python),
+    ):
+        timer = timeit.Timer(lambda func=func: [func(n) for n in names])
+        results[label] = min(timer.repeat(repeat=5, number=args.number)) / args.number
+        print(f"{label:>18}: {results[label] * 1000:8.3f} ms per scan")
+    speedup = results["fnmatch rules"] / results["compiled matcher"]
+    print(f"{'speedup':>18}: {speedup:8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
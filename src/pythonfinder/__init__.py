@@ -6,4 +6,19 @@ from .pythonfinder import Finder
 
 __version__ = "3.0.5.dev0"
 
-__all__ = ["Finder", "PythonInfo", "InvalidPythonVersion", "PythonNotFound"]
+__all__ = [
+    "AsyncFinder",
+    "Finder",
+    "PythonInfo",
+    "InvalidPythonVersion",
+    "PythonNotFound",
+]
+
+
+def __getattr__(name: str):
+    # AsyncFinder pulls in asyncio, so only import it when it's asked for
+    if name == "AsyncFinder":
+        from .async_finder import AsyncFinder
+
+        return AsyncFinder
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
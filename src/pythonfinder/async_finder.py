@@ -0,0 +1,291 @@
+from __future__ import annotations
+
+import asyncio
+import concurrent.futures
+import functools
+from typing import TYPE_CHECKING, Any, Callable, Iterable
+
+from .environment import PROBE_MAX_WORKERS
+from .models.python_query import PythonQuery
+from .pythonfinder import Finder
+from .utils.version_utils import probe_python_async
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from packaging.specifiers import SpecifierSet
+
+    from .finders import BaseFinder
+    from .models.python_info import PythonInfo
+
+
+class AsyncFinder:
+    """
+    asyncio front end to :class:`~pythonfinder.Finder`.
+
+    Directory scans and other filesystem work run in the event loop's default
+    executor, and interpreters are probed as asyncio subprocesses, at most
+    ``max_workers`` at a time, so searching never blocks the event loop. Once the
+    Pythons a search may find are identified, it is answered by the wrapped
+    :class:`Finder`, so matching, sorting and caching work the same.
+    """
+
+    def __init__(
+        self,
+        path: str | None = None,
+        system: bool = False,
+        global_search: bool = True,
+        ignore_unsupported: bool = True,
+        sort_by_path: bool = False,
+        pyenv_only: bool = False,
+        max_workers: int | None = None,
+        probe_cache: bool | str | Path | None = None,
+        verify: bool = False,
+        sniff_binaries: bool = False,
+        cache_size: int | None = None,
+        cache_ttl: float | None = None,
+        finder: Finder | None = None,
+    ):
+        """
+        Initialize a new AsyncFinder.
+
+        Args:
+            path: Path to prepend to the search path.
+            system: Whether to include the system Python.
+            global_search: Whether to search in the system PATH.
+            ignore_unsupported: Whether to ignore unsupported Python versions.
+            sort_by_path: Whether to sort results by path rather than version.
+            pyenv_only: Whether to restrict searches to pyenv-managed Pythons.
+            max_workers: Maximum number of interpreters to probe concurrently.
+                Defaults to a value derived from the CPU count.
+            probe_cache: Whether to keep probe results in a persistent on-disk cache,
+                or the directory to keep it in.
+            verify: Whether to run every interpreter found, instead of trusting the
+                version a pyenv or asdf install directory is named for or a
+                virtual environment's ``pyvenv.cfg`` records.
+            sniff_binaries: Whether to read the version of other interpreters from
+                the version string compiled into them instead of running them.
+                Results found this way have ``verified`` set to False.
+            cache_size: The most probe results, and Pythons per finder, to keep in
+                memory, evicting the least recently used. Defaults to keeping all.
+            cache_ttl: How many seconds in-memory results stay valid when
+                ``cache_size`` is set. Defaults to forever.
+            finder: An existing Finder to wrap. The other arguments, except
+                ``max_workers``, are ignored when it is given.
+        """
+        if finder is None:
+            finder = Finder(
+                path=path,
+                system=system,
+                global_search=global_search,
+                ignore_unsupported=ignore_unsupported,
+                sort_by_path=sort_by_path,
+                pyenv_only=pyenv_only,
+                max_workers=max_workers,
+                probe_cache=probe_cache,
+                verify=verify,
+                sniff_binaries=sniff_binaries,
+                cache_size=cache_size,
+                cache_ttl=cache_ttl,
+            )
+        self.finder = finder
+        self.max_workers = max(1, max_workers or PROBE_MAX_WORKERS)
+        # asyncio primitives belong to the loop they are first used in
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._semaphore: asyncio.Semaphore | None = None
+
+    @property
+    def finders(self) -> list[BaseFinder]:
+        """
+        The finders searched, in priority order.
+        """
+        return self.finder.finders
+
+    def _bind_loop(self) -> asyncio.AbstractEventLoop:
+        loop = asyncio.get_running_loop()
+        if loop is not self._loop:
+            self._loop = loop
+            self._semaphore = asyncio.Semaphore(self.max_workers)
+        return loop
+
+    async def _run_in_executor(self, func: Callable, *args: Any, **kwargs: Any) -> Any:
+        loop = self._bind_loop()
+        return await loop.run_in_executor(None, functools.partial(func, *args, **kwargs))
+
+    async def _probe(self, path: Path) -> dict[str, Any]:
+        """
+        Probe an interpreter as an asyncio subprocess, at most ``max_workers`` at
+        a time.
+        """
+        async with self._semaphore:
+            return await probe_python_async(path)
+
+    async def _iter_pythons(
+        self, finder: BaseFinder, major: int | None = None, minor: int | None = None
+    ) -> list[PythonInfo]:
+        """
+        Identify the Pythons that may match a version query, so that the finder's
+        synchronous search is answered from what it remembers.
+
+        Candidates are identified concurrently, each on an executor thread that
+        waits for its interpreter to be probed on the event loop. The finder's
+        probe store still makes sure each interpreter is probed only once.
+
+        Returns:
+            The Pythons found, in the order the finder's search yields them.
+        """
+        loop = self._bind_loop()
+        candidates = await self._run_in_executor(
+            lambda: list(finder._scan_candidates(major, minor))
+        )
+
+        def probe(path: Path) -> dict[str, Any]:
+            future = asyncio.run_coroutine_threadsafe(self._probe(path), loop)
+            try:
+                return future.result()
+            except concurrent.futures.CancelledError:
+                # Abandoned rather than failed, which the probe store mustn't remember
+                raise asyncio.CancelledError from None
+
+        identified: dict[Path, asyncio.Future] = {}
+        for path, python_info in candidates:
+            if python_info is None and path not in identified:
+                identified[path] = asyncio.ensure_future(
+                    self._run_in_executor(finder._identify, path, probe)
+                )
+        try:
+            await asyncio.gather(*identified.values())
+        finally:
+            for future in identified.values():
+                future.cancel()
+
+        pythons = []
+        for path, python_info in candidates:
+            if python_info is None:
+                python_info = identified[path].result()
+            if python_info:
+                pythons.append(python_info)
+        return pythons
+
+    async def _identify_all(self, query: PythonQuery | None = None) -> None:
+        """
+        Identify the Pythons every finder has that may match a query, concurrently.
+        """
+        major, minor = (query.major, query.minor) if query is not None else (None, None)
+        await asyncio.gather(
+            *(self._iter_pythons(finder, major, minor) for finder in self.finders)
+        )
+
+    async def which(self, executable: str) -> Path | None:
+        """
+        Find an executable in the paths searched by this finder.
+
+        Args:
+            executable: The name of the executable to find.
+
+        Returns:
+            The path to the executable, or None if not found.
+        """
+        return await self._run_in_executor(self.finder.which, executable)
+
+    async def find_python_version(
+        self,
+        major: str | int | PythonQuery | None = None,
+        minor: int | None = None,
+        patch: int | None = None,
+        pre: bool | None = None,
+        dev: bool | None = None,
+        arch: str | None = None,
+        name: str | None = None,
+        spec: SpecifierSet | str | None = None,
+    ) -> PythonInfo | None:
+        """
+        Find a Python version matching the specified criteria.
+
+        Args:
+            major: Major version number, full version string or a parsed
+                :class:`~pythonfinder.models.PythonQuery`.
+            minor: Minor version number.
+            patch: Patch version number.
+            pre: Whether to include pre-releases.
+            dev: Whether to include dev-releases.
+            arch: Architecture to include, e.g. '64bit'.
+            name: The name of a python version, e.g. ``anaconda3-5.3.0``.
+            spec: A PEP 440 specifier set the version must satisfy, e.g.
+                ``>=3.9,<3.13``.
+
+        Returns:
+            A PythonInfo object matching the criteria, or None if not found.
+        """
+        query = PythonQuery.parse(major, minor, patch, pre, dev, arch, name)
+        if spec is None:
+            # The search stops at the first finder with a match, so only the
+            # finders before it need their Pythons identified
+            for finder in self.finders:
+                pythons = await self._iter_pythons(finder, query.major, query.minor)
+                if any(python_info.matches(query) for python_info in pythons):
+                    break
+        else:
+            await self._identify_all(query)
+        return await self._run_in_executor(
+            self.finder.find_python_version, query, spec=spec
+        )
+
+    async def find_all_python_versions(
+        self,
+        major: str | int | PythonQuery | None = None,
+        minor: int | None = None,
+        patch: int | None = None,
+        pre: bool | None = None,
+        dev: bool | None = None,
+        arch: str | None = None,
+        name: str | None = None,
+        spec: SpecifierSet | str | None = None,
+    ) -> list[PythonInfo]:
+        """
+        Find all Python versions matching the specified criteria.
+
+        Every finder is searched concurrently.
+
+        Args:
+            major: Major version number, full version string or a parsed
+                :class:`~pythonfinder.models.PythonQuery`.
+            minor: Minor version number.
+            patch: Patch version number.
+            pre: Whether to include pre-releases.
+            dev: Whether to include dev-releases.
+            arch: Architecture to include, e.g. '64bit'.
+            name: The name of a python version, e.g. ``anaconda3-5.3.0``.
+            spec: A PEP 440 specifier set the versions must satisfy, e.g.
+                ``>=3.9,<3.13``.
+
+        Returns:
+            A list of PythonInfo objects matching the criteria.
+        """
+        query = PythonQuery.parse(major, minor, patch, pre, dev, arch, name)
+        await self._identify_all(query)
+        return await self._run_in_executor(
+            self.finder.find_all_python_versions, query, spec=spec
+        )
+
+    async def find_many(
+        self, queries: Iterable[str | int]
+    ) -> dict[str | int, PythonInfo | None]:
+        """
+        Find the best match for each of several version queries in one search.
+
+        Asynchronous version of :meth:`Finder.find_many`. The Pythons of every
+        finder are identified concurrently, instead of one finder at a time until
+        every query has a match.
+
+        Args:
+            queries: Versions or names as passed to :meth:`find_python_version`,
+                e.g. ``3.9``, ``pypy3.10``, or ``3.13t`` for a free-threaded build.
+
+        Returns:
+            A dictionary mapping each query to its best match, or None if there is
+            no match.
+        """
+        queries = list(queries)
+        await self._identify_all()
+        return await self._run_in_executor(self.finder.find_many, queries)
@@ -0,0 +1,406 @@
+from __future__ import annotations
+
+import dataclasses
+import os
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import MutableMapping
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Callable, Hashable, Iterator
+
+from .environment import get_cache_dir
+from .utils.path_utils import file_identity
+
+if TYPE_CHECKING:
+    from concurrent.futures import Future
+
+
+class ProbeCache:
+    """
+    Persistent on-disk cache of interpreter probe results.
+
+    Each entry is stored in its own JSON file named after the interpreter's real
+    path and records the file identity (real path, device, inode, size and mtime)
+    it was probed with, so an entry is ignored as soon as the file it describes is
+    replaced or modified. An interpreter symlinked into a virtual environment runs
+    as part of that environment, so it gets an entry per environment.
+    """
+
+    #: Bumped whenever the layout of a cache entry changes.
+    FORMAT_VERSION = 2
+
+    def __init__(self, cache_dir: str | Path | None = None):
+        """
+        Initialize a new ProbeCache.
+
+        Args:
+            cache_dir: The directory to store entries in. Defaults to
+                ``probes`` under :func:`~pythonfinder.environment.get_cache_dir`.
+        """
+        self.cache_dir = (
+            Path(cache_dir) if cache_dir is not None else get_cache_dir() / "probes"
+        )
+
+    def _entry_path(self, realpath: str, venv_root: str | None) -> Path:
+        import hashlib
+
+        name = realpath if venv_root is None else f"{realpath}\0{venv_root}"
+        digest = hashlib.sha256(name.encode("utf-8", "surrogateescape")).hexdigest()
+        return self.cache_dir / f"{digest}.json"
+
+    def get(
+        self, path: str | Path, venv_root: str | Path | None = None
+    ) -> dict[str, Any] | None:
+        """
+        Look up the probe result for an interpreter.
+
+        Args:
+            path: Path to the Python executable.
+            venv_root: The virtual environment the path belongs to, if any.
+
+        Returns:
+            The cached probe data, or None if there is no entry or the file changed
+            since it was probed.
+        """
+        import json
+
+        identity = file_identity(path)
+        if identity is None:
+            return None
+        if venv_root is not None:
+            venv_root = str(venv_root)
+
+        try:
+            with open(self._entry_path(identity[0], venv_root), encoding="utf-8") as fh:
+                entry = json.load(fh)
+        except (OSError, ValueError):
+            return None
+
+        if (
+            not isinstance(entry, dict)
+            or entry.get("format") != self.FORMAT_VERSION
+            or entry.get("identity") != list(identity)
+            or entry.get("venv_root") != venv_root
+        ):
+            return None
+        return entry.get("data")
+
+    def set(
+        self,
+        path: str | Path,
+        data: dict[str, Any],
+        venv_root: str | Path | None = None,
+    ) -> None:
+        """
+        Store the probe result for an interpreter.
+
+        Failures to write are ignored; the cache is only an optimization.
+
+        Args:
+            path: Path to the Python executable.
+            data: JSON-serializable probe data.
+            venv_root: The virtual environment the path belongs to, if any.
+        """
+        import json
+        import tempfile
+
+        identity = file_identity(path)
+        if identity is None:
+            return
+        if venv_root is not None:
+            venv_root = str(venv_root)
+
+        entry = {
+            "format": self.FORMAT_VERSION,
+            "identity": list(identity),
+            "venv_root": venv_root,
+            "data": data,
+        }
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=str(self.cache_dir), suffix=".tmp")
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as fh:
+                    json.dump(entry, fh)
+                os.replace(tmp_path, self._entry_path(identity[0], venv_root))
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+        except (OSError, TypeError, ValueError):
+            pass
+
+    def clear(self) -> None:
+        """
+        Remove every entry from the cache.
+        """
+        try:
+            entries = list(self.cache_dir.glob("*.json"))
+        except OSError:
+            return
+        for entry in entries:
+            try:
+                entry.unlink()
+            except OSError:
+                pass
+
+
+@dataclasses.dataclass(frozen=True)
+class CacheStats:
+    """
+    Counters describing how well an :class:`LRUCache` is doing.
+    """
+
+    hits: int
+    misses: int
+    #: Entries dropped to make room for newer ones
+    evictions: int
+    #: Entries dropped because they outlived the cache's ``ttl``
+    expirations: int
+    size: int
+    maxsize: int
+
+
+class LRUCache(MutableMapping):
+    """
+    Thread-safe in-memory mapping holding at most ``maxsize`` entries.
+
+    When full, storing a new entry evicts the least recently used one. With a
+    ``ttl``, entries are also dropped once they are older than that many seconds,
+    so results are eventually looked up again in long-running processes.
+
+    It can stand in for the plain dicts finders and the :class:`ProbeStore` keep
+    their results in, to bound how much they remember.
+    """
+
+    def __init__(self, maxsize: int = 1024, ttl: float | None = None):
+        """
+        Initialize a new LRUCache.
+
+        Args:
+            maxsize: The maximum number of entries to keep.
+            ttl: How long an entry stays valid, in seconds. Defaults to forever.
+        """
+        if maxsize < 1:
+            raise ValueError("maxsize must be at least 1")
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._lock = threading.RLock()
+        self._entries: OrderedDict[Hashable, tuple[Any, float]] = OrderedDict()
+        self._hits = self._misses = self._evictions = self._expirations = 0
+
+    def _live_entry(self, key: Hashable) -> tuple[Any, float] | None:
+        entry = self._entries.get(key)
+        if entry is not None and self.ttl is not None and entry[1] <= time.monotonic():
+            del self._entries[key]
+            self._expirations += 1
+            return None
+        return entry
+
+    def __getitem__(self, key: Hashable) -> Any:
+        with self._lock:
+            entry = self._live_entry(key)
+            if entry is None:
+                self._misses += 1
+                raise KeyError(key)
+            self._hits += 1
+            self._entries.move_to_end(key)
+            return entry[0]
+
+    def __setitem__(self, key: Hashable, value: Any) -> None:
+        expires = time.monotonic() + self.ttl if self.ttl is not None else 0.0
+        with self._lock:
+            self._entries[key] = (value, expires)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+
+    def __delitem__(self, key: Hashable) -> None:
+        with self._lock:
+            del self._entries[key]
+
+    def __contains__(self, key: object) -> bool:
+        # Membership tests neither count as lookups nor refresh an entry
+        with self._lock:
+            return self._live_entry(key) is not None
+
+    def __iter__(self) -> Iterator[Hashable]:
+        return iter([key for key, _ in self.items()])
+
+    def items(self) -> list[tuple[Hashable, Any]]:
+        """
+        Snapshot the live entries, without counting lookups or refreshing them.
+        """
+        with self._lock:
+            for key in list(self._entries):
+                self._live_entry(key)
+            return [(key, entry[0]) for key, entry in self._entries.items()]
+
+    def values(self) -> list[Any]:
+        return [value for _, value in self.items()]
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    @property
+    def stats(self) -> CacheStats:
+        """
+        The cache's counters, which run from its creation.
+        """
+        with self._lock:
+            return CacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                expirations=self._expirations,
+                size=len(self._entries),
+                maxsize=self.maxsize,
+            )
+
+
+class ProbeStore:
+    """
+    In-memory store of probe results, shared by every finder of a
+    :class:`~pythonfinder.Finder` so an interpreter is spawned at most once no
+    matter how many finders see it.
+
+    Results are keyed by whatever identifies an interpreter to the finders (see
+    :meth:`~pythonfinder.finders.PathFinder._probe_key`). Concurrent requests for
+    the same key wait for the first one instead of probing again, including when
+    it fails, but a failure is only remembered for ``failure_ttl`` seconds so that
+    a transient one, such as a timeout, doesn't stick.
+    """
+
+    def __init__(
+        self, cache: MutableMapping | None = None, failure_ttl: float | None = 60.0
+    ):
+        """
+        Initialize a new ProbeStore.
+
+        Args:
+            cache: The mapping to keep probe results in, such as an
+                :class:`LRUCache` to bound how many are remembered. Defaults to a
+                dict that keeps every result.
+            failure_ttl: Seconds after which a failed probe is retried. None keeps
+                failures for as long as results.
+        """
+        self._lock = threading.Lock()
+        self.cache: MutableMapping[Hashable, Future] = cache if cache is not None else {}
+        self.failure_ttl = failure_ttl
+        # Goes up whenever a probe result is recorded or forgotten
+        self.generation = 0
+        self._aliases: MutableMapping[Hashable, list[Path]] = (
+            LRUCache(cache.maxsize) if isinstance(cache, LRUCache) else {}
+        )
+        # When each remembered failure is due to be retried
+        self._failures: MutableMapping[Hashable, float] = (
+            LRUCache(cache.maxsize) if isinstance(cache, LRUCache) else {}
+        )
+
+    def _get(self, key: Hashable) -> Future | None:
+        """
+        Get the future for a key, unless it holds a failure due to be retried.
+        Must be called with the lock held.
+        """
+        future = self.cache.get(key)
+        expires = self._failures.get(key)
+        if future is not None and expires is not None and expires <= time.monotonic():
+            return None
+        return future
+
+    def probe(self, key: Hashable, probe: Callable[[], dict[str, Any]]) -> dict[str, Any]:
+        """
+        Get the probe result for a key, running ``probe`` if it's not known yet.
+
+        Args:
+            key: The key identifying the interpreter.
+            probe: Called without arguments to probe the interpreter.
+
+        Returns:
+            The metadata returned by the first ``probe`` run for this key.
+
+        Raises:
+            Exception: Whatever the first ``probe`` run for this key raised. A
+                ``BaseException`` such as ``KeyboardInterrupt`` is raised to the
+                callers waiting for that run, but isn't remembered.
+        """
+        from concurrent.futures import Future
+
+        with self._lock:
+            future = self._get(key)
+            owner = future is None
+            if owner:
+                future = self.cache[key] = Future()
+                self._failures.pop(key, None)
+                self.generation += 1
+
+        if owner:
+            try:
+                future.set_result(probe())
+            except Exception as exc:
+                if self.failure_ttl is not None:
+                    with self._lock:
+                        self._failures[key] = time.monotonic() + self.failure_ttl
+                future.set_exception(exc)
+            except BaseException as exc:
+                # An interrupted probe says nothing about the interpreter, so it's
+                # forgotten, but whoever is waiting for it still has to wake up
+                with self._lock:
+                    if self.cache.get(key) is future:
+                        del self.cache[key]
+                future.set_exception(exc)
+                raise
+        return future.result()
+
+    def add_alias(self, key: Hashable, path: Path) -> list[Path]:
+        """
+        Record that a path runs the interpreter identified by a key.
+
+        Args:
+            key: The key identifying the interpreter.
+            path: A path running it.
+
+        Returns:
+            The list of every path recorded for the key, which keeps growing as
+            more aliases are recorded.
+        """
+        with self._lock:
+            aliases = self._aliases.setdefault(key, [])
+            if path not in aliases:
+                aliases.append(path)
+            return aliases
+
+    def forget(self, key: Hashable) -> None:
+        """
+        Forget the probe result and aliases recorded for a key.
+
+        Args:
+            key: The key identifying the interpreter.
+        """
+        with self._lock:
+            self.cache.pop(key, None)
+            self._aliases.pop(key, None)
+            self._failures.pop(key, None)
+            self.generation += 1
+
+    def clear(self) -> None:
+        """
+        Forget every probe result.
+        """
+        with self._lock:
+            self.cache.clear()
+            self._aliases.clear()
+            self._failures.clear()
+            self.generation += 1
+
+    def __contains__(self, key: Hashable) -> bool:
+        with self._lock:
+            return self._get(key) is not None
+
+    def __len__(self) -> int:
+        return len(self.cache)
@@ -1,33 +1,123 @@
 from __future__ import annotations
 
 import os
-import platform
-import shutil
 import sys
+from functools import lru_cache
 from pathlib import Path
+from typing import Any
 
 # Environment variables and constants
 PYENV_ROOT = os.path.expanduser(
     os.path.expandvars(os.environ.get("PYENV_ROOT", "~/.pyenv"))
 )
 PYENV_ROOT = Path(PYENV_ROOT)
-PYENV_INSTALLED = shutil.which("pyenv") is not None
 
 ASDF_DATA_DIR = os.path.expanduser(
     os.path.expandvars(os.environ.get("ASDF_DATA_DIR", "~/.asdf"))
 )
-ASDF_INSTALLED = shutil.which("asdf") is not None
-
-SYSTEM_ARCH = platform.architecture()[0]
-IS_64BIT_OS = None
-
-if sys.maxsize > 2**32:
-    IS_64BIT_OS = platform.machine() == "AMD64"
-else:
-    IS_64BIT_OS = False
 
 IGNORE_UNSUPPORTED = bool(os.environ.get("PYTHONFINDER_IGNORE_UNSUPPORTED", False))
 SUBPROCESS_TIMEOUT = int(os.environ.get("PYTHONFINDER_SUBPROCESS_TIMEOUT", 5))
+# Number of interpreters probed concurrently; each probe is a process spawn, so the
+# default is bounded by the CPU count rather than the usual I/O-bound heuristic.
+PROBE_MAX_WORKERS = int(
+    os.environ.get("PYTHONFINDER_MAX_WORKERS", min(8, os.cpu_count() or 1))
+)
+# The persistent probe cache is opt-in; PYTHONFINDER_CACHE_DIR relocates it.
+PROBE_CACHE_ENABLED = os.environ.get("PYTHONFINDER_PROBE_CACHE", "").lower() in (
+    "1",
+    "true",
+    "yes",
+    "on",
+)
+
+
+@lru_cache(maxsize=None)
+def is_pyenv_installed() -> bool:
+    """
+    Check whether pyenv is on PATH. Searched once, on first call.
+    """
+    import shutil
+
+    return shutil.which("pyenv") is not None
+
+
+@lru_cache(maxsize=None)
+def is_asdf_installed() -> bool:
+    """
+    Check whether asdf is on PATH. Searched once, on first call.
+    """
+    import shutil
+
+    return shutil.which("asdf") is not None
+
+
+@lru_cache(maxsize=None)
+def get_system_arch() -> str:
+    """
+    Get the architecture of the running interpreter, e.g. ``"64bit"``.
+    """
+    import platform
+
+    return platform.architecture()[0]
+
+
+@lru_cache(maxsize=None)
+def is_64bit_os() -> bool:
+    """
+    Check whether this is 64-bit Windows running a 64-bit interpreter.
+    """
+    if sys.maxsize > 2**32:
+        import platform
+
+        return platform.machine() == "AMD64"
+    return False
+
+
+# Values that cost a PATH search or a subprocess are computed on first access,
+# so that importing pythonfinder stays cheap
+_LAZY_VALUES = {
+    "PYENV_INSTALLED": is_pyenv_installed,
+    "ASDF_INSTALLED": is_asdf_installed,
+    "SYSTEM_ARCH": get_system_arch,
+    "IS_64BIT_OS": is_64bit_os,
+}
+
+
+def __getattr__(name: str) -> Any:
+    try:
+        return _LAZY_VALUES[name]()
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+
+
+def _lazy_value(name: str) -> Any:
+    # Module __getattr__ isn't consulted for lookups inside the module, and a value
+    # set on the module, e.g. by a test, takes precedence over the computed one
+    if name in globals():
+        return globals()[name]
+    return _LAZY_VALUES[name]()
+
+
+def get_cache_dir() -> Path:
+    """
+    Get the directory used for pythonfinder's persistent caches.
+
+    Returns:
+        ``$PYTHONFINDER_CACHE_DIR`` if set, otherwise a ``pythonfinder`` directory
+        under the platform's user cache location.
+    """
+    cache_dir = os.environ.get("PYTHONFINDER_CACHE_DIR")
+    if cache_dir:
+        return Path(os.path.expanduser(os.path.expandvars(cache_dir)))
+
+    if os.name == "nt":
+        base = os.environ.get("LOCALAPPDATA") or os.path.expanduser("~\\AppData\\Local")
+        return Path(base, "pythonfinder", "Cache")
+    if sys.platform == "darwin":
+        return Path(os.path.expanduser("~/Library/Caches/pythonfinder"))
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache")
+    return Path(base, "pythonfinder")
 
 
 def get_python_paths() -> list[str]:
@@ -44,12 +134,12 @@ def get_python_paths() -> list[str]:
         paths.extend(os.environ["PATH"].split(os.pathsep))
 
     # Add pyenv paths if installed
-    if PYENV_INSTALLED:
+    if _lazy_value("PYENV_INSTALLED"):
         pyenv_paths = get_pyenv_paths()
         paths.extend(pyenv_paths)
 
     # Add asdf paths if installed
-    if ASDF_INSTALLED:
+    if _lazy_value("ASDF_INSTALLED"):
         asdf_paths = get_asdf_paths()
         paths.extend(asdf_paths)
 
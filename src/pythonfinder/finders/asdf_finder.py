@@ -1,11 +1,15 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from functools import cached_property
+from typing import TYPE_CHECKING, MutableMapping
 
-from ..environment import ASDF_DATA_DIR, ASDF_INSTALLED
+from .. import environment
 
 if TYPE_CHECKING:
     from pathlib import Path
+
+    from ..cache import ProbeCache, ProbeStore
+    from ..models.python_info import PythonInfo
 from ..utils.path_utils import ensure_path
 from ..utils.version_utils import parse_asdf_version_order
 from .path_finder import PathFinder
@@ -20,6 +24,12 @@ class AsdfFinder(PathFinder):
         self,
         data_dir: str | Path | None = None,
         ignore_unsupported: bool = True,
+        max_workers: int | None = None,
+        probe_cache: ProbeCache | None = None,
+        probe_store: ProbeStore | None = None,
+        verify: bool = False,
+        sniff_binaries: bool = False,
+        python_cache: MutableMapping[Path, PythonInfo] | None = None,
     ):
         """
         Initialize a new AsdfFinder.
@@ -27,17 +37,46 @@ class AsdfFinder(PathFinder):
         Args:
             data_dir: The data directory of the asdf installation.
             ignore_unsupported: Whether to ignore unsupported Python versions.
+            max_workers: Maximum number of interpreters to probe concurrently.
+            probe_cache: Persistent cache consulted before spawning an interpreter.
+            probe_store: In-memory probe results to share with other finders.
+            verify: Whether to run every interpreter, even those whose install
+                layout already says which Python they are.
+            sniff_binaries: Whether to read the version of other interpreters from
+                the version string compiled into them instead of running them.
+            python_cache: The mapping to keep the Pythons found in.
         """
-        if not ASDF_INSTALLED:
-            super().__init__(paths=[], ignore_unsupported=ignore_unsupported)
-            return
+        self._data_dir = data_dir
+        super().__init__(
+            ignore_unsupported=ignore_unsupported,
+            max_workers=max_workers,
+            probe_cache=probe_cache,
+            probe_store=probe_store,
+            verify=verify,
+            sniff_binaries=sniff_binaries,
+            python_cache=python_cache,
+        )
 
-        self.data_dir = ensure_path(data_dir or ASDF_DATA_DIR)
-        self.installs_dir = self.data_dir / "installs" / "python"
+    @cached_property
+    def data_dir(self) -> Path:
+        """
+        The data directory of the asdf installation.
+        """
+        return ensure_path(self._data_dir or environment.ASDF_DATA_DIR)
 
-        if not self.installs_dir.exists():
-            super().__init__(paths=[], ignore_unsupported=ignore_unsupported)
-            return
+    @property
+    def installs_dir(self) -> Path:
+        """
+        The directory asdf installs Python versions into.
+        """
+        return self.data_dir / "installs" / "python"
+
+    def _discover_paths(self) -> list[Path]:
+        """
+        Find the ``bin`` directory of every asdf Python, in asdf's version order.
+        """
+        if not environment.ASDF_INSTALLED or not self.installs_dir.exists():
+            return []
 
         # Get the asdf version order
         version_order = parse_asdf_version_order()
@@ -65,8 +104,10 @@ class AsdfFinder(PathFinder):
             if bin_dir.exists():
                 paths.append(bin_dir)
 
-        super().__init__(
-            paths=paths,
-            only_python=True,
-            ignore_unsupported=ignore_unsupported,
-        )
+        return paths
+
+    def _install_dir(self, path: Path) -> Path | None:
+        """
+        Get the asdf install directory a search directory belongs to.
+        """
+        return path.parent
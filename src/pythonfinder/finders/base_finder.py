@@ -1,7 +1,9 @@
 from __future__ import annotations
 
 import abc
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any, Callable, Iterator
+
+from ..models.python_query import PythonQuery
 
 if TYPE_CHECKING:
     from pathlib import Path
@@ -14,10 +16,13 @@ class BaseFinder(abc.ABC):
     Abstract base class for all Python finders.
     """
 
+    # Goes up whenever the Pythons this finder knows about change
+    generation: int = 0
+
     @abc.abstractmethod
     def find_all_python_versions(
         self,
-        major: str | int | None = None,
+        major: str | int | PythonQuery | None = None,
         minor: int | None = None,
         patch: int | None = None,
         pre: bool | None = None,
@@ -29,7 +34,8 @@ class BaseFinder(abc.ABC):
         Find all Python versions matching the specified criteria.
 
         Args:
-            major: Major version number or full version string.
+            major: Major version number, full version string or a parsed
+                :class:`~pythonfinder.models.PythonQuery`.
             minor: Minor version number.
             patch: Patch version number.
             pre: Whether to include pre-releases.
@@ -42,10 +48,9 @@ class BaseFinder(abc.ABC):
         """
         pass
 
-    @abc.abstractmethod
     def find_python_version(
         self,
-        major: str | int | None = None,
+        major: str | int | PythonQuery | None = None,
         minor: int | None = None,
         patch: int | None = None,
         pre: bool | None = None,
@@ -56,8 +61,12 @@ class BaseFinder(abc.ABC):
         """
         Find a Python version matching the specified criteria.
 
+        The best match is picked as the matches are found, rather than by sorting
+        them as :meth:`find_all_python_versions` does.
+
         Args:
-            major: Major version number or full version string.
+            major: Major version number, full version string or a parsed
+                :class:`~pythonfinder.models.PythonQuery`.
             minor: Minor version number.
             patch: Patch version number.
             pre: Whether to include pre-releases.
@@ -68,7 +77,142 @@ class BaseFinder(abc.ABC):
         Returns:
             A PythonInfo object matching the criteria, or None if not found.
         """
-        pass
+        return max(
+            self.iter_python_versions(major, minor, patch, pre, dev, arch, name),
+            key=lambda x: x.version_sort,
+            default=None,
+        )
+
+    def _iter_pythons(self) -> Iterator[PythonInfo]:
+        """
+        Iterate over every Python found by this finder, in discovery order.
+
+        Finders that can discover Pythons lazily should override this; the
+        default falls back to :meth:`find_all_python_versions`.
+
+        Returns:
+            An iterator of PythonInfo objects.
+        """
+        return iter(self.find_all_python_versions())
+
+    def _iter_pythons_for_version(
+        self, major: int | None = None, minor: int | None = None
+    ) -> Iterator[PythonInfo]:
+        """
+        Iterate over the Pythons that may match a version query.
+
+        Finders that can tell some candidates apart without running them may skip
+        those that can't match and try the likeliest matches first, so the order
+        can differ from :meth:`_iter_pythons`'. The results are still filtered by
+        the caller.
+
+        Args:
+            major: The major version being looked for.
+            minor: The minor version being looked for.
+
+        Returns:
+            An iterator of PythonInfo objects.
+        """
+        return self._iter_pythons()
+
+    def _scan_candidates(
+        self, major: int | None = None, minor: int | None = None
+    ) -> Iterator[tuple[Path, PythonInfo | None]]:
+        """
+        Iterate over the candidates that may match a version query, in the order
+        :meth:`_iter_pythons_for_version` yields them, without running any.
+
+        Searches are built on this and :meth:`_identify`, so that the synchronous
+        ones and :class:`~pythonfinder.AsyncFinder` can run the interpreters in
+        their own way. The default identifies every candidate straight away.
+
+        Args:
+            major: The major version being looked for.
+            minor: The minor version being looked for.
+
+        Returns:
+            An iterator of ``(path, python_info)`` tuples, where ``python_info`` is
+            None if the candidate still has to be identified with :meth:`_identify`.
+        """
+        for python_info in self._iter_pythons_for_version(major, minor):
+            yield python_info.path, python_info
+
+    def _identify(
+        self, path: Path, probe: Callable[[Path], dict[str, Any]] | None = None
+    ) -> PythonInfo | None:
+        """
+        Identify a candidate :meth:`_scan_candidates` didn't, running it if need
+        be, and remember it for later searches.
+
+        Args:
+            path: The candidate's path.
+            probe: Called in the calling thread to run the interpreter, instead of
+                :func:`~pythonfinder.utils.probe_python`. It's only called once
+                per interpreter, however many paths run it.
+
+        Returns:
+            A PythonInfo object, or None if the path isn't a supported Python.
+        """
+        return None
+
+    def invalidate(self, path: str | Path | None = None) -> None:
+        """
+        Forget what this finder found, so it is looked at again on the next search.
+
+        Finders that cache what they find should override this.
+
+        Args:
+            path: Path to the Python executable to forget. Defaults to everything.
+        """
+        return None
+
+    def check_for_changes(self) -> None:
+        """
+        Look for Pythons installed or removed since this finder last searched,
+        bumping :attr:`generation` if there are any.
+
+        It's called before a memoized search result is reused, so it has to be
+        much cheaper than a search. Finders that can't tell cheaply should leave
+        this as it is, and their results are reused until :meth:`invalidate` is
+        called or they expire.
+        """
+        return None
+
+    def iter_python_versions(
+        self,
+        major: str | int | PythonQuery | None = None,
+        minor: int | None = None,
+        patch: int | None = None,
+        pre: bool | None = None,
+        dev: bool | None = None,
+        arch: str | None = None,
+        name: str | None = None,
+    ) -> Iterator[PythonInfo]:
+        """
+        Lazily iterate over the Python versions matching the specified criteria.
+
+        Matches are yielded in discovery order rather than sorted, and nothing past
+        the last match consumed is probed, so stopping early is cheap. Finders may
+        move the candidates likeliest to match a major or minor version asked for
+        ahead of the others, as :meth:`_iter_pythons_for_version` describes.
+
+        Args:
+            major: Major version number, full version string or a parsed
+                :class:`~pythonfinder.models.PythonQuery`.
+            minor: Minor version number.
+            patch: Patch version number.
+            pre: Whether to include pre-releases.
+            dev: Whether to include dev-releases.
+            arch: Architecture to include, e.g. '64bit'.
+            name: The name of a python version, e.g. ``anaconda3-5.3.0``.
+
+        Returns:
+            An iterator of PythonInfo objects matching the criteria.
+        """
+        query = PythonQuery.parse(major, minor, patch, pre, dev, arch, name)
+        for python_info in self._iter_pythons_for_version(query.major, query.minor):
+            if python_info.matches(query):
+                yield python_info
 
     def which(self, executable: str) -> Path | None:
         """
@@ -95,7 +239,8 @@ class BaseFinder(abc.ABC):
         Parse a major version string into a dictionary of version components.
 
         Args:
-            major: Major version number or full version string.
+            major: Major version number, full version string or a parsed
+                :class:`~pythonfinder.models.PythonQuery`.
             minor: Minor version number.
             patch: Patch version number.
             pre: Whether to include pre-releases.
@@ -105,84 +250,6 @@ class BaseFinder(abc.ABC):
         Returns:
             A dictionary containing the parsed version components.
         """
-        from ..utils.version_utils import parse_python_version
-
-        major_is_str = major and isinstance(major, str)
-        is_num = (
-            major
-            and major_is_str
-            and all(part.isdigit() for part in major.split(".")[:2])
-        )
-        major_has_arch = (
-            arch is None
-            and major
-            and major_is_str
-            and "-" in major
-            and major[0].isdigit()
-        )
-        name = None
-
-        if major and major_has_arch:
-            orig_string = f"{major!s}"
-            major, _, arch = major.rpartition("-")
-            if arch:
-                arch = arch.lower().lstrip("x").replace("bit", "")
-                if not (arch.isdigit() and (int(arch) & int(arch) - 1) == 0):
-                    major = orig_string
-                    arch = None
-                else:
-                    arch = f"{arch}bit"
-            try:
-                version_dict = parse_python_version(major)
-            except Exception:
-                if name is None:
-                    name = f"{major!s}"
-                    major = None
-                version_dict = {}
-        elif major and major[0].isalpha():
-            return {"major": None, "name": major, "arch": arch}
-        elif major and is_num:
-            import re
-
-            version_re = re.compile(
-                r"(?P<major>\d+)(?:\.(?P<minor>\d+))?(?:\.(?P<patch>(?<=\.)[0-9]+))?\.?"
-                r"(?:(?P<prerel>[abc]|rc|dev)(?:(?P<prerelversion>\d+(?:\.\d+)*))?)"
-                r"?(?P<postdev>(\.post(?P<post>\d+))?(\.dev(?P<dev>\d+))?)?"
-            )
-            match = version_re.match(major)
-            version_dict = match.groupdict() if match else {}
-            version_dict.update(
-                {
-                    "is_prerelease": bool(version_dict.get("prerel", False)),
-                    "is_devrelease": bool(version_dict.get("dev", False)),
-                }
-            )
-        else:
-            version_dict = {
-                "major": major,
-                "minor": minor,
-                "patch": patch,
-                "pre": pre,
-                "dev": dev,
-                "arch": arch,
-            }
-
-        if not version_dict.get("arch") and arch:
-            version_dict["arch"] = arch
-
-        version_dict["minor"] = (
-            int(version_dict["minor"]) if version_dict.get("minor") is not None else minor
-        )
-        version_dict["patch"] = (
-            int(version_dict["patch"]) if version_dict.get("patch") is not None else patch
-        )
-        version_dict["major"] = (
-            int(version_dict["major"]) if version_dict.get("major") is not None else major
-        )
-
-        if not (version_dict["major"] or version_dict.get("name")):
-            version_dict["major"] = major
-            if name:
-                version_dict["name"] = name
+        from ..models.python_query import parse_major
 
-        return version_dict
+        return dict(parse_major(major, minor, patch, pre, dev, arch))
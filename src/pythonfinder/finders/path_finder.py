@@ -1,15 +1,49 @@
 from __future__ import annotations
 
 import os
+import re
+import stat
+import time
+from collections import deque
 from pathlib import Path
-from typing import Iterator
+from typing import TYPE_CHECKING, Any, Callable, Iterator, MutableMapping
 
+from ..cache import LRUCache, ProbeStore
+from ..environment import PROBE_MAX_WORKERS
 from ..exceptions import InvalidPythonVersion
 from ..models.python_info import PythonInfo
+from ..utils.binary_utils import get_binary_architecture, sniff_python_version
 from ..utils.path_utils import filter_pythons, path_is_python
-from ..utils.version_utils import get_python_version, guess_company, parse_python_version
+from ..utils.version_utils import (
+    guess_company,
+    guess_install_metadata,
+    guess_prefix_metadata,
+    guess_venv_metadata,
+    guess_version_from_dir_name,
+    guess_version_from_name,
+    parse_python_version,
+    probe_python,
+    version_hint_matches,
+)
 from .base_finder import BaseFinder
 
+if TYPE_CHECKING:
+    from concurrent.futures import Future, ThreadPoolExecutor
+
+    from ..cache import ProbeCache
+    from ..models.python_query import PythonQuery
+
+
+# The names an interpreter's own executable goes by, as opposed to the entry point
+# scripts and other programs installed next to it
+INTERPRETER_NAME_RE = re.compile(
+    r"(?:python|pypy)(?:\d+(?:\.\d+)?t?)?(?:\.exe)?", re.IGNORECASE
+)
+
+# A directory modified this recently may change again without its timestamps
+# moving, on filesystems with coarse timestamps, so its listing isn't reused
+RACY_LISTING_NS = 2_000_000_000
+
 
 class PathFinder(BaseFinder):
     """
@@ -21,26 +55,194 @@ class PathFinder(BaseFinder):
         paths: list[str | Path] | None = None,
         only_python: bool = True,
         ignore_unsupported: bool = True,
+        max_workers: int | None = None,
+        probe_cache: ProbeCache | None = None,
+        probe_store: ProbeStore | None = None,
+        verify: bool = False,
+        sniff_binaries: bool = False,
+        python_cache: MutableMapping[Path, PythonInfo] | None = None,
     ):
         """
         Initialize a new PathFinder.
 
         Args:
-            paths: List of paths to search for Python executables.
+            paths: List of paths to search for Python executables. Defaults to the
+                paths found by :meth:`_discover_paths` on first use.
             only_python: Whether to only find Python executables.
             ignore_unsupported: Whether to ignore unsupported Python versions.
+            max_workers: Maximum number of interpreters to probe concurrently.
+                Defaults to a value derived from the CPU count; ``1`` probes serially.
+            probe_cache: Persistent cache consulted before spawning an interpreter.
+            probe_store: In-memory probe results to share with other finders.
+                Defaults to a store private to this finder.
+            verify: Whether to run every interpreter, even those whose install
+                layout already says which Python they are.
+            sniff_binaries: Whether to read the version of other interpreters from
+                the version string compiled into them instead of running them.
+            python_cache: The mapping to keep the Pythons found in, such as an
+                :class:`~pythonfinder.cache.LRUCache` to bound how many are
+                remembered. Defaults to a dict that keeps all of them.
         """
-        self.paths = [Path(p) if isinstance(p, str) else p for p in (paths or [])]
+        self._paths: list[Path] | None = None
+        self._paths_discovered = False
+        if paths is not None:
+            self.paths = paths
         self.only_python = only_python
         self.ignore_unsupported = ignore_unsupported
-        self._python_versions: dict[Path, PythonInfo] = {}
+        self.max_workers = max(1, max_workers or PROBE_MAX_WORKERS)
+        self.probe_cache = probe_cache
+        self.probe_store = probe_store if probe_store is not None else ProbeStore()
+        self._python_versions: MutableMapping[Path, PythonInfo] = (
+            python_cache if python_cache is not None else {}
+        )
+        # The probe key each cached PythonInfo was created for
+        self._python_keys: MutableMapping[Path, tuple | None] = (
+            LRUCache(python_cache.maxsize) if isinstance(python_cache, LRUCache) else {}
+        )
+        self.verify = verify
+        self.sniff_binaries = sniff_binaries
+        self._venv_roots: dict[Path, Path | None] = {}
+        self._install_metadata: dict[Path, dict[str, Any] | None] = {}
+        self._venv_metadata: dict[Path, dict[str, Any] | None] = {}
+        self._prefix_metadata: dict[tuple, dict[str, Any] | None] = {}
+        self._dir_candidates: dict[Path, tuple[tuple[int, int], list[Path]]] = {}
+
+    @property
+    def paths(self) -> list[Path]:
+        """
+        The paths searched by this finder, discovered on first use.
+        """
+        if self._paths is None:
+            self.paths = self._discover_paths()
+            self._paths_discovered = True
+        return self._paths
+
+    @paths.setter
+    def paths(self, paths: list[str | Path]) -> None:
+        self._paths = [Path(p) if isinstance(p, str) else p for p in paths]
+        self._paths_discovered = False
+
+    def _discover_paths(self) -> list[str | Path]:
+        """
+        Work out which paths to search when none were given.
+
+        Finders that find their search paths on disk override this, so that
+        constructing them doesn't touch the filesystem.
+
+        Returns:
+            The paths to search, in order.
+        """
+        return []
+
+    def _probe_key(self, path: Path) -> tuple | None:
+        """
+        Get the key identifying the interpreter a path runs.
+
+        Paths resolving to the same file run the same interpreter, except that an
+        interpreter symlinked into a virtual environment reports that environment's
+        prefix, so the environment is part of the key. The file's size and mtime
+        are too, so the key changes when the interpreter is replaced in place.
+
+        Args:
+            path: Path to a Python executable.
+
+        Returns:
+            A ``(device, inode, size, mtime_ns, venv_root)`` tuple, or None if the
+            path can't be stat'ed.
+        """
+        try:
+            stat_result = os.stat(path)
+        except (OSError, ValueError):
+            return None
+
+        return (
+            stat_result.st_dev,
+            stat_result.st_ino,
+            stat_result.st_size,
+            stat_result.st_mtime_ns,
+            self._venv_root(path.parent),
+        )
+
+    def _venv_root(self, bin_dir: Path) -> Path | None:
+        """
+        Get the virtual environment a directory of executables belongs to.
+
+        Args:
+            bin_dir: A directory holding Python executables.
+
+        Returns:
+            The environment's root directory, or None if it isn't in one.
+        """
+        if bin_dir not in self._venv_roots:
+            venv_root = bin_dir.parent
+            if not os.path.isfile(venv_root / "pyvenv.cfg"):
+                venv_root = None
+            self._venv_roots[bin_dir] = venv_root
+        return self._venv_roots[bin_dir]
+
+    def _probe(
+        self,
+        path: Path,
+        key: tuple | None = None,
+        probe: Callable[[Path], dict[str, Any]] | None = None,
+    ) -> dict[str, Any]:
+        """
+        Probe a Python executable for its metadata.
+
+        Each interpreter is probed at most once per probe store: paths sharing a
+        probe key reuse the first probe's result, including its failure.
+
+        Args:
+            path: Path to a Python executable.
+            key: The path's probe key, if already known.
+            probe: Called to run the interpreter instead of
+                :func:`~pythonfinder.utils.probe_python`.
+
+        Returns:
+            The metadata reported by :func:`~pythonfinder.utils.probe_python`.
+        """
+        if key is None:
+            key = self._probe_key(path)
+        if key is None:
+            return self._probe_uncached(path, probe)
+        return self.probe_store.probe(key, lambda: self._probe_uncached(path, probe))
+
+    def _probe_uncached(
+        self, path: Path, probe: Callable[[Path], dict[str, Any]] | None = None
+    ) -> dict[str, Any]:
+        """
+        Probe a Python executable for its metadata, consulting the probe cache
+        before spawning the interpreter.
+
+        Args:
+            path: Path to a Python executable.
+            probe: Called to run the interpreter instead of
+                :func:`~pythonfinder.utils.probe_python`.
 
-    def _create_python_info(self, path: Path) -> PythonInfo | None:
+        Returns:
+            The metadata reported by :func:`~pythonfinder.utils.probe_python`.
+        """
+        if self.probe_cache is not None:
+            venv_root = self._venv_root(path.parent)
+            cached = self.probe_cache.get(path, venv_root)
+            if cached and cached.get("version"):
+                return cached
+
+        metadata = (probe or probe_python)(path)
+        if self.probe_cache is not None:
+            self.probe_cache.set(path, metadata, venv_root)
+        return metadata
+
+    def _create_python_info(
+        self, path: Path, probe: Callable[[Path], dict[str, Any]] | None = None
+    ) -> PythonInfo | None:
         """
         Create a PythonInfo object from a path to a Python executable.
 
         Args:
             path: Path to a Python executable.
+            probe: Called to run the interpreter, if it has to be, instead of
+                :func:`~pythonfinder.utils.probe_python`.
 
         Returns:
             A PythonInfo object, or None if the path is not a valid Python executable.
@@ -48,71 +250,515 @@ class PathFinder(BaseFinder):
         if not path_is_python(path):
             return None
 
+        key = self._probe_key(path)
+        python_info = self._create_static_python_info(path, key)
+        if python_info is not None:
+            return python_info
+
         try:
-            version_str = get_python_version(path)
-            version_data = parse_python_version(version_str)
-
-            # For Windows tests, ensure we use forward slashes in the executable path
-            executable_path = str(path)
-            if os.name == "nt" and str(path).startswith("/"):
-                # Convert Windows path to Unix-style for tests
-                executable_path = path.as_posix()
-
-            return PythonInfo(
-                path=path,
-                version_str=version_str,
-                major=version_data["major"],
-                minor=version_data["minor"],
-                patch=version_data["patch"],
-                is_prerelease=version_data["is_prerelease"],
-                is_postrelease=version_data["is_postrelease"],
-                is_devrelease=version_data["is_devrelease"],
-                is_debug=version_data["is_debug"],
-                version=version_data["version"],
-                architecture=None,  # Will be determined when needed
-                company=guess_company(str(path)),
-                name=path.stem,
-                executable=executable_path,
+            python_info = self._python_info_from_metadata(
+                path, self._probe(path, key, probe)
             )
         except (InvalidPythonVersion, ValueError, OSError, Exception):
             if not self.ignore_unsupported:
                 raise
             return None
 
-    def _iter_pythons(self) -> Iterator[PythonInfo]:
+        self._set_aliases(python_info, path, key)
+        return python_info
+
+    def _create_static_python_info(
+        self, path: Path, key: tuple | None
+    ) -> PythonInfo | None:
         """
-        Iterate over all Python executables found in the paths.
+        Create an unverified PythonInfo object from an interpreter's install layout.
+
+        Args:
+            path: Path to a Python executable.
+            key: The path's probe key.
 
         Returns:
-            An iterator of PythonInfo objects.
+            A PythonInfo object, or None if the interpreter has to be run.
+        """
+        metadata = self._static_metadata(path)
+        if metadata is None:
+            return None
+        try:
+            python_info = self._python_info_from_metadata(path, metadata)
+        except InvalidPythonVersion:
+            return None
+        python_info.verified = False
+        self._set_aliases(python_info, path, key)
+        return python_info
+
+    def _set_aliases(self, python_info: PythonInfo, path: Path, key: tuple | None):
+        if key is not None:
+            python_info.aliases = self.probe_store.add_alias(key, path)
+        else:
+            python_info.aliases = [path]
+        self._python_keys[path] = key
+
+    def _add_python(self, path: Path, python_info: PythonInfo) -> None:
+        self._python_versions[path] = python_info
+        self.generation += 1
+
+    def _cached_python_info(self, path: Path) -> PythonInfo | None:
+        """
+        Get the PythonInfo found earlier for a path, if the file it describes is
+        unchanged.
+
+        A cached entry whose path no longer has the probe key it was created for
+        is dropped, so that the interpreter is identified again.
+
+        Args:
+            path: Path to a Python executable.
+
+        Returns:
+            The cached PythonInfo object, or None if there is no valid entry.
+        """
+        python_info = self._python_versions.get(path)
+        if python_info is not None and self._probe_key(path) != self._python_keys.get(
+            path
+        ):
+            self._forget(path)
+            return None
+        return python_info
+
+    def _forget(self, path: Path) -> None:
+        """
+        Drop the cached PythonInfo of a path, along with its aliases' and anything
+        learnt from install layouts, which may have changed with it.
+        """
+        self.generation += 1
+        self._python_versions.pop(path, None)
+        key = self._python_keys.pop(path, None)
+        if key is not None:
+            self.probe_store.forget(key)
+            for alias, alias_key in list(self._python_keys.items()):
+                if alias_key == key:
+                    self._python_versions.pop(alias, None)
+                    self._python_keys.pop(alias, None)
+        self._forget_layouts()
+
+    def _forget_layouts(self) -> None:
+        self._venv_roots.clear()
+        self._install_metadata.clear()
+        self._venv_metadata.clear()
+        self._prefix_metadata.clear()
+
+    def invalidate(self, path: str | Path | None = None) -> None:
+        """
+        Forget what this finder found, so it is looked at again on the next search.
+
+        Cached results are already checked against the executable they describe
+        whenever they are used; this is for changes that check can't see.
+
+        Args:
+            path: Path to the Python executable to forget. Defaults to everything,
+                including directory listings and, if they weren't given, the
+                search paths themselves.
+        """
+        self.generation += 1
+        if path is not None:
+            path = Path(path)
+            # The path may have no cached PythonInfo, e.g. if its probe failed
+            key = self._probe_key(path)
+            if key is not None:
+                self.probe_store.forget(key)
+            self._forget(path)
+            self._dir_candidates.pop(path.parent, None)
+            return
+
+        for key in set(self._python_keys.values()):
+            if key is not None:
+                self.probe_store.forget(key)
+        self._python_versions.clear()
+        self._python_keys.clear()
+        self._dir_candidates.clear()
+        self._forget_layouts()
+        if self._paths_discovered:
+            self._paths = None
+
+    def _python_info_from_metadata(
+        self, path: Path, metadata: dict[str, Any]
+    ) -> PythonInfo:
+        """
+        Build a PythonInfo object from the metadata describing an interpreter.
+
+        Args:
+            path: Path to the Python executable.
+            metadata: A dictionary as returned by :meth:`_probe`.
+
+        Returns:
+            A PythonInfo object.
+
+        Raises:
+            InvalidPythonVersion: If the metadata holds an invalid version.
+        """
+        version_str = metadata["version"]
+        version_data = parse_python_version(version_str)
+
+        # For Windows tests, ensure we use forward slashes in the executable path
+        executable_path = str(path)
+        if os.name == "nt" and str(path).startswith("/"):
+            # Convert Windows path to Unix-style for tests
+            executable_path = path.as_posix()
+
+        return PythonInfo(
+            path=path,
+            version_str=version_str,
+            major=version_data["major"],
+            minor=version_data["minor"],
+            patch=version_data["patch"],
+            is_prerelease=version_data["is_prerelease"],
+            is_postrelease=version_data["is_postrelease"],
+            is_devrelease=version_data["is_devrelease"] or bool(metadata.get("dev")),
+            is_debug=version_data["is_debug"] or bool(metadata.get("debug")),
+            version=version_data["version"],
+            architecture=metadata.get("architecture"),
+            company=guess_company(str(path)),
+            name=path.stem,
+            executable=executable_path,
+            implementation=metadata.get("implementation"),
+            abiflags=metadata.get("abiflags"),
+            prefix=metadata.get("prefix"),
+            base_prefix=metadata.get("base_prefix"),
+            gil_disabled=bool(metadata.get("gil_disabled")),
+        )
+
+    def _install_dir(self, path: Path) -> Path | None:
+        """
+        Get the install directory holding every interpreter in a search directory.
+
+        Plain search paths can hold anything; finders searching per-version install
+        directories override this.
+
+        Args:
+            path: A directory from :attr:`paths`.
+
+        Returns:
+            The install directory, or None if the search directory isn't part of one.
         """
+        return None
+
+    def _dir_version_hint(self, path: Path) -> tuple[int | None, int | None]:
+        """
+        Guess the Python version of every interpreter in a search directory from
+        the name of its install directory.
+
+        Args:
+            path: A directory from :attr:`paths`.
+
+        Returns:
+            A ``(major, minor)`` tuple, or ``(None, None)`` if there is no hint.
+        """
+        install_dir = self._install_dir(path)
+        if install_dir is None:
+            return None, None
+        return guess_version_from_dir_name(install_dir.name)
+
+    def _static_metadata(self, path: Path) -> dict[str, Any] | None:
+        """
+        Describe an interpreter from its install layout, without running it.
+
+        Interpreters in a pyenv or asdf install named for its version, and in a
+        virtual environment whose ``pyvenv.cfg`` records a version that can
+        still be trusted, are described without being run, as are CPython
+        interpreters installed in a prefix holding their ``patchlevel.h`` and
+        ``_sysconfigdata``. With ``sniff_binaries``, so are interpreters whose
+        executable or libpython holds a single recognizable version string.
+
+        Args:
+            path: Path to a Python executable.
+
+        Returns:
+            Metadata shaped like :meth:`_probe`'s, or None if the interpreter has
+            to be run, including whenever ``verify`` is set.
+        """
+        if self.verify:
+            return None
+        metadata = None
+        # Whether the path is an interpreter binary, checked only when needed
+        is_interpreter = None
+        install_dir = self._install_dir(path.parent)
+        if install_dir is not None:
+            is_interpreter = self._is_interpreter_binary(path)
+            if is_interpreter:
+                if install_dir not in self._install_metadata:
+                    self._install_metadata[install_dir] = guess_install_metadata(
+                        install_dir
+                    )
+                metadata = self._install_metadata[install_dir]
+        venv_root = None
+        if metadata is None:
+            venv_root = self._venv_root(path.parent)
+            if venv_root is not None:
+                if venv_root not in self._venv_metadata:
+                    self._venv_metadata[venv_root] = guess_venv_metadata(venv_root)
+                metadata = self._venv_metadata[venv_root]
+        if metadata is None:
+            executable = os.path.realpath(path)
+            major, minor = guess_version_from_name(os.path.basename(executable))
+            minor_hint = (major, minor) if minor is not None else None
+            # A virtual environment's interpreter doesn't run with its install's prefix
+            if venv_root is None and is_interpreter is None:
+                is_interpreter = self._is_interpreter_binary(path)
+            if venv_root is None and is_interpreter:
+                prefix = os.path.dirname(os.path.dirname(executable))
+                if (prefix, minor_hint) not in self._prefix_metadata:
+                    self._prefix_metadata[prefix, minor_hint] = guess_prefix_metadata(
+                        Path(prefix), minor_hint
+                    )
+                metadata = self._prefix_metadata[prefix, minor_hint]
+            if metadata is None and self.sniff_binaries:
+                metadata = sniff_python_version(executable, minor_hint)
+        if metadata is None:
+            return None
+
+        # Don't trust the layout over an executable name that contradicts it
+        version = parse_python_version(metadata["version"])
+        name_hint = guess_version_from_name(path.name)
+        if not version_hint_matches(name_hint, version["major"], version["minor"]):
+            return None
+        return metadata
+
+    def _is_interpreter_binary(self, path: Path) -> bool:
+        """
+        Check that a path is an interpreter's native executable, not a script or
+        another program installed next to it, before describing it from its
+        install layout.
+        """
+        executable = os.path.realpath(path)
+        if not (
+            INTERPRETER_NAME_RE.fullmatch(path.name)
+            or INTERPRETER_NAME_RE.fullmatch(os.path.basename(executable))
+        ):
+            return False
+        return get_binary_architecture(executable) is not None
+
+    @staticmethod
+    def _name_version_hint(path: Path) -> tuple[int | None, int | None]:
+        """
+        Guess the Python version of a candidate from its file name.
+
+        Symlinks are judged by the name of the file they resolve to, since links
+        such as ``python3.1 -> python3.13`` are named less precisely than their
+        targets.
+        """
+        hint = guess_version_from_name(os.path.basename(os.path.realpath(path)))
+        if hint[0] is None:
+            return guess_version_from_name(path.name)
+        return hint
+
+    def _candidate_version_hint(
+        self, path: Path, dir_hint: tuple[int | None, int | None]
+    ) -> tuple[int | None, int | None]:
+        """
+        Guess the Python version of a candidate from its name and its directory's hint.
+        """
+        name_major, name_minor = self._name_version_hint(path)
+        dir_major, dir_minor = dir_hint
+        if name_major is None:
+            return dir_hint
+        if name_minor is None and dir_major == name_major:
+            return name_major, dir_minor
+        return name_major, name_minor
+
+    def _iter_candidates(
+        self, major: int | None = None, minor: int | None = None
+    ) -> Iterator[Path]:
+        """
+        Iterate over all paths that look like Python executables, in search order.
+
+        When a major or minor version is given, candidates whose file or directory
+        name rules that version out are skipped without being run, and within each
+        directory the candidates whose names spell out the most of the version
+        come first.
+
+        Args:
+            major: The major version being looked for.
+            minor: The minor version being looked for.
+
+        Returns:
+            An iterator of Path objects.
+        """
+        use_hints = major is not None or minor is not None
         for path in self.paths:
-            if not path.exists():
-                continue
+            candidates = self._list_candidates(path)
+            if candidates is not None:
+                if not use_hints:
+                    yield from candidates
+                    continue
 
-            if path.is_file() and path_is_python(path):
-                if path in self._python_versions:
-                    yield self._python_versions[path]
+                dir_hint = self._dir_version_hint(path)
+                if not version_hint_matches(dir_hint, major, minor):
                     continue
+                hinted = []
+                for candidate in candidates:
+                    hint = self._candidate_version_hint(candidate, dir_hint)
+                    if version_hint_matches(hint, major, minor):
+                        hinted.append((hint, candidate))
+                # Stable, so candidates equally likely keep their directory order
+                hinted.sort(key=lambda item: sum(part is None for part in item[0]))
+                yield from (candidate for _, candidate in hinted)
+            elif path_is_python(path) and path.is_file():
+                if not use_hints or version_hint_matches(
+                    self._name_version_hint(path), major, minor
+                ):
+                    yield path
+
+    def _list_candidates(self, path: Path) -> list[Path] | None:
+        """
+        List the executables in a search directory that look like Pythons.
+
+        Listings are kept and reused for as long as the directory's modification
+        and change times stay the same, so repeated searches cost a single
+        ``stat`` per directory.
+
+        Args:
+            path: A path from :attr:`paths`.
+
+        Returns:
+            The candidates in directory order, or None if the path isn't a directory.
+        """
+        try:
+            stat_result = os.stat(path)
+        except (OSError, ValueError):
+            return None
+        if not stat.S_ISDIR(stat_result.st_mode):
+            return None
 
-                python_info = self._create_python_info(path)
+        stamp = (stat_result.st_mtime_ns, stat_result.st_ctime_ns)
+        cached = self._dir_candidates.get(path)
+        if cached is not None and cached[0] == stamp:
+            return cached[1]
+
+        candidates = list(filter_pythons(path))
+        if cached is None or cached[1] != candidates:
+            self.generation += 1
+        if time.time_ns() - stat_result.st_mtime_ns > RACY_LISTING_NS:
+            self._dir_candidates[path] = (stamp, candidates)
+        else:
+            self._dir_candidates.pop(path, None)
+        return candidates
+
+    def check_for_changes(self) -> None:
+        """
+        Look for Pythons installed or removed since the last search, which costs a
+        ``stat`` per search directory and a listing of those that changed.
+        """
+        # Nothing has been searched before the paths are discovered
+        if self._paths is None:
+            return
+        for path in self._paths:
+            self._list_candidates(path)
+
+    def _iter_pythons_for_version(
+        self, major: int | None = None, minor: int | None = None
+    ) -> Iterator[PythonInfo]:
+        """
+        Iterate over the Pythons that may match a version query, skipping the
+        candidates whose names rule it out.
+        """
+        return self._iter_pythons(major, minor)
+
+    def _scan_candidates(
+        self, major: int | None = None, minor: int | None = None
+    ) -> Iterator[tuple[Path, PythonInfo | None]]:
+        """
+        Iterate over the paths :meth:`_iter_candidates` lists, with the PythonInfo
+        found earlier for each, if it still describes the file.
+        """
+        for path in self._iter_candidates(
+            major if isinstance(major, int) else None,
+            minor if isinstance(minor, int) else None,
+        ):
+            yield path, self._cached_python_info(path)
+
+    def _identify(
+        self, path: Path, probe: Callable[[Path], dict[str, Any]] | None = None
+    ) -> PythonInfo | None:
+        """
+        Create the PythonInfo of a candidate and keep it for later searches.
+        """
+        python_info = self._create_python_info(path, probe)
+        if python_info:
+            self._add_python(path, python_info)
+        return python_info
+
+    def _iter_pythons(
+        self, major: int | None = None, minor: int | None = None
+    ) -> Iterator[PythonInfo]:
+        """
+        Iterate over all Python executables found in the paths.
+
+        Uncached candidates are probed on a thread pool of ``max_workers`` threads,
+        looking at most ``max_workers`` candidates ahead of the one being yielded,
+        so results come out in the order :meth:`_iter_candidates` lists them and
+        abandoning the iterator early does not probe the remaining candidates.
+
+        Args:
+            major: Only probe candidates whose names allow this major version, most
+                specific names first.
+            minor: Only probe candidates whose names allow this minor version.
+
+        Returns:
+            An iterator of PythonInfo objects.
+        """
+        if self.max_workers == 1:
+            for path, python_info in self._scan_candidates(major, minor):
+                if python_info is None:
+                    python_info = self._identify(path)
                 if python_info:
-                    self._python_versions[path] = python_info
                     yield python_info
-            elif path.is_dir():
-                for python_path in filter_pythons(path):
-                    if python_path in self._python_versions:
-                        yield self._python_versions[python_path]
-                        continue
+            return
+
+        executor: ThreadPoolExecutor | None = None
+        in_flight: dict[Path, Future] = {}
+        window: deque[tuple[Path, Future | None, PythonInfo | None]] = deque()
+
+        def collect(
+            path: Path, future: Future | None, python_info: PythonInfo | None
+        ) -> PythonInfo | None:
+            if future is None:
+                return python_info
+            in_flight.pop(path, None)
+            return future.result()
 
-                    python_info = self._create_python_info(python_path)
+        try:
+            for path, python_info in self._scan_candidates(major, minor):
+                future = None
+                if python_info is None:
+                    future = in_flight.get(path)
+                    if future is None:
+                        if executor is None:
+                            from concurrent.futures import ThreadPoolExecutor
+
+                            executor = ThreadPoolExecutor(
+                                max_workers=self.max_workers,
+                                thread_name_prefix="pythonfinder-probe",
+                            )
+                        future = executor.submit(self._identify, path)
+                        in_flight[path] = future
+                window.append((path, future, python_info))
+                if len(window) > self.max_workers:
+                    python_info = collect(*window.popleft())
                     if python_info:
-                        self._python_versions[python_path] = python_info
                         yield python_info
 
+            while window:
+                python_info = collect(*window.popleft())
+                if python_info:
+                    yield python_info
+        finally:
+            for future in in_flight.values():
+                future.cancel()
+            if executor is not None:
+                executor.shutdown(wait=True)
+
     def find_all_python_versions(
         self,
-        major: str | int | None = None,
+        major: str | int | PythonQuery | None = None,
         minor: int | None = None,
         patch: int | None = None,
         pre: bool | None = None,
@@ -124,7 +770,8 @@ class PathFinder(BaseFinder):
         Find all Python versions matching the specified criteria.
 
         Args:
-            major: Major version number or full version string.
+            major: Major version number, full version string or a parsed
+                :class:`~pythonfinder.models.PythonQuery`.
             minor: Minor version number.
             patch: Patch version number.
             pre: Whether to include pre-releases.
@@ -135,60 +782,13 @@ class PathFinder(BaseFinder):
         Returns:
             A list of PythonInfo objects matching the criteria.
         """
-        # Parse the major version if it's a string
-        if isinstance(major, str) and not any([minor, patch, pre, dev, arch]):
-            version_dict = self.parse_major(major, minor, patch, pre, dev, arch)
-            major = version_dict.get("major")
-            minor = version_dict.get("minor")
-            patch = version_dict.get("patch")
-            pre = version_dict.get("is_prerelease")
-            dev = version_dict.get("is_devrelease")
-            arch = version_dict.get("arch")
-            name = version_dict.get("name")
-
-        # Find all Python versions
-        python_versions = []
-        for python_info in self._iter_pythons():
-            if python_info.matches(major, minor, patch, pre, dev, arch, None, name):
-                python_versions.append(python_info)
-
         # Sort by version
         return sorted(
-            python_versions,
+            self.iter_python_versions(major, minor, patch, pre, dev, arch, name),
             key=lambda x: x.version_sort,
             reverse=True,
         )
 
-    def find_python_version(
-        self,
-        major: str | int | None = None,
-        minor: int | None = None,
-        patch: int | None = None,
-        pre: bool | None = None,
-        dev: bool | None = None,
-        arch: str | None = None,
-        name: str | None = None,
-    ) -> PythonInfo | None:
-        """
-        Find a Python version matching the specified criteria.
-
-        Args:
-            major: Major version number or full version string.
-            minor: Minor version number.
-            patch: Patch version number.
-            pre: Whether to include pre-releases.
-            dev: Whether to include dev-releases.
-            arch: Architecture to include, e.g. '64bit'.
-            name: The name of a python version, e.g. ``anaconda3-5.3.0``.
-
-        Returns:
-            A PythonInfo object matching the criteria, or None if not found.
-        """
-        python_versions = self.find_all_python_versions(
-            major, minor, patch, pre, dev, arch, name
-        )
-        return python_versions[0] if python_versions else None
-
     def which(self, executable: str) -> Path | None:
         """
         Find an executable in the paths searched by this finder.
@@ -1,16 +1,21 @@
 from __future__ import annotations
 
 import os
-import subprocess
 import re
+import subprocess
 from pathlib import Path
-from typing import Iterator
+from typing import TYPE_CHECKING, Iterator, MutableMapping
 
+from ..cache import LRUCache
 from ..exceptions import InvalidPythonVersion
 from ..models.python_info import PythonInfo
+from ..utils.path_utils import file_identity
 from ..utils.version_utils import parse_python_version
 from .base_finder import BaseFinder
 
+if TYPE_CHECKING:
+    from ..models.python_query import PythonQuery
+
 
 class PyLauncherFinder(BaseFinder):
     """
@@ -18,15 +23,28 @@ class PyLauncherFinder(BaseFinder):
     This is only available on Windows and requires the py launcher to be installed.
     """
 
-    def __init__(self, ignore_unsupported: bool = True):
+    def __init__(
+        self,
+        ignore_unsupported: bool = True,
+        python_cache: MutableMapping[Path, PythonInfo] | None = None,
+    ):
         """
         Initialize a new PyLauncherFinder.
 
         Args:
             ignore_unsupported: Whether to ignore unsupported Python versions.
+            python_cache: The mapping to keep the Pythons found in, so that their
+                executables aren't run again. Defaults to a dict that keeps all
+                of them.
         """
         self.ignore_unsupported = ignore_unsupported
-        self._python_versions: dict[Path, PythonInfo] = {}
+        self._python_versions: MutableMapping[Path, PythonInfo] = (
+            python_cache if python_cache is not None else {}
+        )
+        # The identity of the file each cached PythonInfo was created from
+        self._python_keys: MutableMapping[Path, tuple | None] = (
+            LRUCache(python_cache.maxsize) if isinstance(python_cache, LRUCache) else {}
+        )
         self._available = os.name == "nt" and self._is_py_launcher_available()
 
     def _is_py_launcher_available(self) -> bool:
@@ -74,7 +92,7 @@ class PyLauncherFinder(BaseFinder):
             # Parse output like:
             # -V:3.12 *        C:\Software\Python\Python_3_12\python.exe
             # -V:3.11          C:\Software\Python\Python_3_11\python.exe
-            pattern = r'-V:(\S+)\s+(\*?)\s+(.+)'
+            pattern = r"-V:(\S+)\s+(\*?)\s+(.+)"
             for line in result.stdout.splitlines():
                 match = re.match(pattern, line.strip())
                 if match:
@@ -115,19 +133,22 @@ class PyLauncherFinder(BaseFinder):
 
         # `py --list-paths` only reports major.minor (e.g. "3.11").  Resolve the
         # real patch version by querying the executable so that callers searching
-        # for a full version string like "3.11.9" can match correctly.
+        # for a full version string like "3.11.9" can match correctly.  The same
+        # probe also reports the architecture, so matching on it needs no
+        # further work.
+        metadata = {}
         if version_data.get("patch") is None:
             try:
-                from ..utils.version_utils import get_python_version
+                from ..utils.version_utils import probe_python
 
-                full_version = get_python_version(path)
-                full_version_data = parse_python_version(full_version)
+                metadata = probe_python(path)
+                full_version_data = parse_python_version(metadata["version"])
                 version_data = full_version_data
-                version = full_version
+                version = metadata["version"]
             except Exception:
                 # If we can't run the executable, fall back to the major.minor
                 # version string provided by the py launcher.
-                pass
+                metadata = {}
 
         # Create the PythonInfo object
         return PythonInfo(
@@ -141,10 +162,15 @@ class PyLauncherFinder(BaseFinder):
             is_devrelease=version_data["is_devrelease"],
             is_debug=version_data["is_debug"],
             version=version_data["version"],
-            architecture=None,  # Will be determined when needed
+            architecture=metadata.get("architecture"),
             company="PythonCore",  # Assuming py launcher only finds official Python
             name=f"python-{version}",
             executable=path,
+            implementation=metadata.get("implementation"),
+            abiflags=metadata.get("abiflags"),
+            prefix=metadata.get("prefix"),
+            base_prefix=metadata.get("base_prefix"),
+            gil_disabled=bool(metadata.get("gil_disabled")),
         )
 
     def _iter_pythons(self) -> Iterator[PythonInfo]:
@@ -158,13 +184,48 @@ class PyLauncherFinder(BaseFinder):
             return iter([])  # Return empty iterator when py launcher is not available
 
         for version, path, is_default in self._get_py_launcher_versions():
-            python_info = self._create_python_info_from_py_launcher(version, path, is_default)
+            key = file_identity(path)
+            python_info = self._cached_python_info(Path(path), key)
+            if python_info is None:
+                python_info = self._create_python_info_from_py_launcher(
+                    version, path, is_default
+                )
+                if python_info:
+                    self._python_versions[Path(path)] = python_info
+                    self._python_keys[Path(path)] = key
+                    self.generation += 1
             if python_info:
                 yield python_info
 
+    def _cached_python_info(self, path: Path, key: tuple | None) -> PythonInfo | None:
+        """
+        Get the PythonInfo found earlier for a path, unless the executable has been
+        replaced since, e.g. by an upgrade.
+        """
+        python_info = self._python_versions.get(path)
+        if python_info is not None and self._python_keys.get(path) != key:
+            self.invalidate(path)
+            return None
+        return python_info
+
+    def invalidate(self, path: str | Path | None = None) -> None:
+        """
+        Forget the Pythons found so far, or one of them, so that they are run again.
+
+        Args:
+            path: Path to the Python executable to forget. Defaults to everything.
+        """
+        self.generation += 1
+        if path is None:
+            self._python_versions.clear()
+            self._python_keys.clear()
+        else:
+            self._python_versions.pop(Path(path), None)
+            self._python_keys.pop(Path(path), None)
+
     def find_all_python_versions(
         self,
-        major: str | int | None = None,
+        major: str | int | PythonQuery | None = None,
         minor: int | None = None,
         patch: int | None = None,
         pre: bool | None = None,
@@ -176,7 +237,8 @@ class PyLauncherFinder(BaseFinder):
         Find all Python versions matching the specified criteria.
 
         Args:
-            major: Major version number or full version string.
+            major: Major version number, full version string or a parsed
+                :class:`~pythonfinder.models.PythonQuery`.
             minor: Minor version number.
             patch: Patch version number.
             pre: Whether to include pre-releases.
@@ -190,56 +252,9 @@ class PyLauncherFinder(BaseFinder):
         if not self._available:
             return []
 
-        # Parse the major version if it's a string
-        if isinstance(major, str) and not any([minor, patch, pre, dev, arch]):
-            version_dict = self.parse_major(major, minor, patch, pre, dev, arch)
-            major = version_dict.get("major")
-            minor = version_dict.get("minor")
-            patch = version_dict.get("patch")
-            pre = version_dict.get("is_prerelease")
-            dev = version_dict.get("is_devrelease")
-            arch = version_dict.get("arch")
-            name = version_dict.get("name")
-
-        # Find all Python versions
-        python_versions = []
-        for python_info in self._iter_pythons():
-            if python_info.matches(major, minor, patch, pre, dev, arch, None, name):
-                python_versions.append(python_info)
-
         # Sort by version
         return sorted(
-            python_versions,
+            self.iter_python_versions(major, minor, patch, pre, dev, arch, name),
             key=lambda x: x.version_sort,
             reverse=True,
         )
-
-    def find_python_version(
-        self,
-        major: str | int | None = None,
-        minor: int | None = None,
-        patch: int | None = None,
-        pre: bool | None = None,
-        dev: bool | None = None,
-        arch: str | None = None,
-        name: str | None = None,
-    ) -> PythonInfo | None:
-        """
-        Find a Python version matching the specified criteria.
-
-        Args:
-            major: Major version number or full version string.
-            minor: Minor version number.
-            patch: Patch version number.
-            pre: Whether to include pre-releases.
-            dev: Whether to include dev-releases.
-            arch: Architecture to include, e.g. '64bit'.
-            name: The name of a python version, e.g. ``anaconda3-5.3.0``.
-
-        Returns:
-            A PythonInfo object matching the criteria, or None if not found.
-        """
-        python_versions = self.find_all_python_versions(
-            major, minor, patch, pre, dev, arch, name
-        )
-        return python_versions[0] if python_versions else None
@@ -1,12 +1,16 @@
 from __future__ import annotations
 
 import os
-from typing import TYPE_CHECKING
+from functools import cached_property
+from typing import TYPE_CHECKING, MutableMapping
 
-from ..environment import PYENV_INSTALLED, PYENV_ROOT
+from .. import environment
 
 if TYPE_CHECKING:
     from pathlib import Path
+
+    from ..cache import ProbeCache, ProbeStore
+    from ..models.python_info import PythonInfo
 from ..utils.path_utils import ensure_path
 from ..utils.version_utils import parse_pyenv_version_order
 from .path_finder import PathFinder
@@ -21,6 +25,12 @@ class PyenvFinder(PathFinder):
         self,
         root: str | Path | None = None,
         ignore_unsupported: bool = True,
+        max_workers: int | None = None,
+        probe_cache: ProbeCache | None = None,
+        probe_store: ProbeStore | None = None,
+        verify: bool = False,
+        sniff_binaries: bool = False,
+        python_cache: MutableMapping[Path, PythonInfo] | None = None,
     ):
         """
         Initialize a new PyenvFinder.
@@ -28,17 +38,46 @@ class PyenvFinder(PathFinder):
         Args:
             root: The root directory of the pyenv installation.
             ignore_unsupported: Whether to ignore unsupported Python versions.
+            max_workers: Maximum number of interpreters to probe concurrently.
+            probe_cache: Persistent cache consulted before spawning an interpreter.
+            probe_store: In-memory probe results to share with other finders.
+            verify: Whether to run every interpreter, even those whose install
+                layout already says which Python they are.
+            sniff_binaries: Whether to read the version of other interpreters from
+                the version string compiled into them instead of running them.
+            python_cache: The mapping to keep the Pythons found in.
         """
-        if not PYENV_INSTALLED:
-            super().__init__(paths=[], ignore_unsupported=ignore_unsupported)
-            return
+        self._root = root
+        super().__init__(
+            ignore_unsupported=ignore_unsupported,
+            max_workers=max_workers,
+            probe_cache=probe_cache,
+            probe_store=probe_store,
+            verify=verify,
+            sniff_binaries=sniff_binaries,
+            python_cache=python_cache,
+        )
 
-        self.root = ensure_path(root or PYENV_ROOT)
-        self.versions_dir = self.root / "versions"
+    @cached_property
+    def root(self) -> Path:
+        """
+        The root directory of the pyenv installation.
+        """
+        return ensure_path(self._root or environment.PYENV_ROOT)
 
-        if not self.versions_dir.exists():
-            super().__init__(paths=[], ignore_unsupported=ignore_unsupported)
-            return
+    @property
+    def versions_dir(self) -> Path:
+        """
+        The directory pyenv installs Python versions into.
+        """
+        return self.root / "versions"
+
+    def _discover_paths(self) -> list[Path]:
+        """
+        Find the ``bin`` directory of every pyenv version, in pyenv's version order.
+        """
+        if not environment.PYENV_INSTALLED or not self.versions_dir.exists():
+            return []
 
         # Get the pyenv version order
         version_order = parse_pyenv_version_order()
@@ -66,8 +105,11 @@ class PyenvFinder(PathFinder):
             if bin_dir.exists():
                 paths.append(bin_dir)
 
-        super().__init__(
-            paths=paths,
-            only_python=True,
-            ignore_unsupported=ignore_unsupported,
-        )
+        return paths
+
+    def _install_dir(self, path: Path) -> Path | None:
+        """
+        Get the pyenv version directory a search directory belongs to.
+        """
+        # On Windows the version directory itself is searched
+        return path if os.name == "nt" else path.parent
@@ -3,10 +3,15 @@ from __future__ import annotations
 import os
 import sys
 from pathlib import Path
+from typing import TYPE_CHECKING, MutableMapping
 
 from ..utils.path_utils import ensure_path, exists_and_is_accessible
 from .path_finder import PathFinder
 
+if TYPE_CHECKING:
+    from ..cache import ProbeCache, ProbeStore
+    from ..models.python_info import PythonInfo
+
 
 class SystemFinder(PathFinder):
     """
@@ -20,6 +25,12 @@ class SystemFinder(PathFinder):
         system: bool = False,
         only_python: bool = False,
         ignore_unsupported: bool = True,
+        max_workers: int | None = None,
+        probe_cache: ProbeCache | None = None,
+        probe_store: ProbeStore | None = None,
+        verify: bool = False,
+        sniff_binaries: bool = False,
+        python_cache: MutableMapping[Path, PythonInfo] | None = None,
     ):
         """
         Initialize a new SystemFinder.
@@ -30,31 +41,51 @@ class SystemFinder(PathFinder):
             system: Whether to include the system Python.
             only_python: Whether to only find Python executables.
             ignore_unsupported: Whether to ignore unsupported Python versions.
+            max_workers: Maximum number of interpreters to probe concurrently.
+            probe_cache: Persistent cache consulted before spawning an interpreter.
+            probe_store: In-memory probe results to share with other finders.
+            verify: Whether to run every interpreter, even those whose install
+                layout already says which Python they are.
+            sniff_binaries: Whether to read the version of other interpreters from
+                the version string compiled into them instead of running them.
+            python_cache: The mapping to keep the Pythons found in.
         """
-        paths = list(paths) if paths else []
+        self._extra_paths = list(paths) if paths else []
+        self.global_search = global_search
+        self.system = system
+        # Snapshot the environment now; the paths themselves are checked on first use
+        self._env_path = os.environ.get("PATH") if global_search else None
+        self._system_path = Path(sys.executable).parent if system else None
+        self._virtual_env = os.environ.get("VIRTUAL_ENV")
+
+        super().__init__(
+            only_python=only_python,
+            ignore_unsupported=ignore_unsupported,
+            max_workers=max_workers,
+            probe_cache=probe_cache,
+            probe_store=probe_store,
+            verify=verify,
+            sniff_binaries=sniff_binaries,
+            python_cache=python_cache,
+        )
+
+    def _discover_paths(self) -> list[Path]:
+        """
+        Collect the given paths, PATH, the running Python's directory and the
+        active virtual environment, dropping those that don't exist.
+        """
+        paths = list(self._extra_paths)
 
         # Add paths from PATH environment variable
-        if global_search and "PATH" in os.environ:
-            # On Windows, we need to handle PATH differently for tests
-            if os.name == "nt":
-                # Split the PATH and process each entry
-                for path_entry in os.environ["PATH"].split(os.pathsep):
-                    # For test paths that use Unix-style paths
-                    if path_entry.startswith("/"):
-                        paths.append(path_entry)
-                    else:
-                        paths.append(path_entry)
-            else:
-                paths.extend(os.environ["PATH"].split(os.pathsep))
+        if self._env_path is not None:
+            paths.extend(self._env_path.split(os.pathsep))
 
         # Add system Python path
-        if system:
-            system_path = Path(sys.executable).parent
-            if system_path not in paths:
-                paths.append(system_path)
+        if self._system_path is not None and self._system_path not in paths:
+            paths.append(self._system_path)
 
         # Add virtual environment path
-        venv = os.environ.get("VIRTUAL_ENV")
+        venv = self._virtual_env
         if venv:
             bin_dir = "Scripts" if os.name == "nt" else "bin"
             try:
@@ -80,8 +111,4 @@ class SystemFinder(PathFinder):
             if exists_and_is_accessible(path_obj):
                 resolved_paths.append(path_obj)
 
-        super().__init__(
-            paths=resolved_paths,
-            only_python=only_python,
-            ignore_unsupported=ignore_unsupported,
-        )
+        return resolved_paths
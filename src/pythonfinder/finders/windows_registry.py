@@ -2,13 +2,18 @@ from __future__ import annotations
 
 import os
 from pathlib import Path
-from typing import Iterator
+from typing import TYPE_CHECKING, Hashable, Iterator, MutableMapping
 
+from ..cache import LRUCache
 from ..exceptions import InvalidPythonVersion
 from ..models.python_info import PythonInfo
+from ..utils.path_utils import file_identity
 from ..utils.version_utils import parse_python_version
 from .base_finder import BaseFinder
 
+if TYPE_CHECKING:
+    from ..models.python_query import PythonQuery
+
 # Only import winreg on Windows
 if os.name == "nt":
     import winreg
@@ -171,15 +176,29 @@ class WindowsRegistryFinder(BaseFinder):
     Finder that searches for Python in the Windows registry (PEP 514).
     """
 
-    def __init__(self, ignore_unsupported: bool = True):
+    def __init__(
+        self,
+        ignore_unsupported: bool = True,
+        python_cache: MutableMapping[Hashable, PythonInfo] | None = None,
+    ):
         """
         Initialize a new WindowsRegistryFinder.
 
         Args:
             ignore_unsupported: Whether to ignore unsupported Python versions.
+            python_cache: The mapping to keep the Pythons found in. Defaults to a
+                dict that keeps all of them.
         """
         self.ignore_unsupported = ignore_unsupported
-        self._python_versions: dict[Path, PythonInfo] = {}
+        # Keyed by everything a PythonInfo is built from, so registry changes miss
+        self._python_versions: MutableMapping[Hashable, PythonInfo] = (
+            python_cache if python_cache is not None else {}
+        )
+        # The identity of the executable each cached PythonInfo describes, which
+        # changes when it's reinstalled without the registry entry changing
+        self._python_keys: MutableMapping[Hashable, tuple | None] = (
+            LRUCache(python_cache.maxsize) if isinstance(python_cache, LRUCache) else {}
+        )
 
     def _iter_registry_pythons(self) -> Iterator[tuple[str, str, WindowsRegistryInfo]]:
         """
@@ -413,15 +432,48 @@ class WindowsRegistryFinder(BaseFinder):
             return
 
         for company, tag, registry_info in self._iter_registry_pythons():
-            python_info = self._create_python_info_from_registry(
-                company, tag, registry_info
+            key = (
+                company,
+                tag,
+                registry_info.version,
+                registry_info.install_path,
+                registry_info.executable_path,
+                registry_info.sys_architecture,
             )
+            python_info = self._python_versions.get(key)
+            if python_info is not None and self._python_keys.get(key) != file_identity(
+                python_info.path
+            ):
+                self.generation += 1
+                self._python_versions.pop(key, None)
+                python_info = None
+            if python_info is None:
+                python_info = self._create_python_info_from_registry(
+                    company, tag, registry_info
+                )
+                if python_info:
+                    self._python_versions[key] = python_info
+                    self._python_keys[key] = file_identity(python_info.path)
+                    self.generation += 1
             if python_info:
                 yield python_info
 
+    def invalidate(self, path: str | Path | None = None) -> None:
+        """
+        Forget the Pythons found so far, or one of them.
+
+        Args:
+            path: Path to the Python executable to forget. Defaults to everything.
+        """
+        self.generation += 1
+        for key, python_info in list(self._python_versions.items()):
+            if path is None or python_info.path == Path(path):
+                self._python_versions.pop(key, None)
+                self._python_keys.pop(key, None)
+
     def find_all_python_versions(
         self,
-        major: str | int | None = None,
+        major: str | int | PythonQuery | None = None,
         minor: int | None = None,
         patch: int | None = None,
         pre: bool | None = None,
@@ -433,7 +485,8 @@ class WindowsRegistryFinder(BaseFinder):
         Find all Python versions matching the specified criteria.
 
         Args:
-            major: Major version number or full version string.
+            major: Major version number, full version string or a parsed
+                :class:`~pythonfinder.models.PythonQuery`.
             minor: Minor version number.
             patch: Patch version number.
             pre: Whether to include pre-releases.
@@ -444,56 +497,9 @@ class WindowsRegistryFinder(BaseFinder):
         Returns:
             A list of PythonInfo objects matching the criteria.
         """
-        # Parse the major version if it's a string
-        if isinstance(major, str) and not any([minor, patch, pre, dev, arch]):
-            version_dict = self.parse_major(major, minor, patch, pre, dev, arch)
-            major = version_dict.get("major")
-            minor = version_dict.get("minor")
-            patch = version_dict.get("patch")
-            pre = version_dict.get("is_prerelease")
-            dev = version_dict.get("is_devrelease")
-            arch = version_dict.get("arch")
-            name = version_dict.get("name")
-
-        # Find all Python versions
-        python_versions = []
-        for python_info in self._iter_pythons():
-            if python_info.matches(major, minor, patch, pre, dev, arch, None, name):
-                python_versions.append(python_info)
-
         # Sort by version
         return sorted(
-            python_versions,
+            self.iter_python_versions(major, minor, patch, pre, dev, arch, name),
             key=lambda x: x.version_sort,
             reverse=True,
         )
-
-    def find_python_version(
-        self,
-        major: str | int | None = None,
-        minor: int | None = None,
-        patch: int | None = None,
-        pre: bool | None = None,
-        dev: bool | None = None,
-        arch: str | None = None,
-        name: str | None = None,
-    ) -> PythonInfo | None:
-        """
-        Find a Python version matching the specified criteria.
-
-        Args:
-            major: Major version number or full version string.
-            minor: Minor version number.
-            patch: Patch version number.
-            pre: Whether to include pre-releases.
-            dev: Whether to include dev-releases.
-            arch: Architecture to include, e.g. '64bit'.
-            name: The name of a python version, e.g. ``anaconda3-5.3.0``.
-
-        Returns:
-            A PythonInfo object matching the criteria, or None if not found.
-        """
-        python_versions = self.find_all_python_versions(
-            major, minor, patch, pre, dev, arch, name
-        )
-        return python_versions[0] if python_versions else None
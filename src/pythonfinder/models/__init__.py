@@ -1,5 +1,7 @@
 from __future__ import annotations
 
 from .python_info import PythonInfo
+from .python_query import PythonQuery
+from .version_index import VersionIndex
 
-__all__ = ["PythonInfo"]
+__all__ = ["PythonInfo", "PythonQuery", "VersionIndex"]
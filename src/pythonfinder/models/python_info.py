@@ -1,15 +1,32 @@
 from __future__ import annotations
 
 import dataclasses
+import functools
 import platform
 import sys
 from typing import TYPE_CHECKING, Any
 
+from .python_query import PythonQuery
+
 if TYPE_CHECKING:
     from pathlib import Path
 
     from packaging.version import Version
 
+# The fields version_sort is computed from
+VERSION_SORT_FIELDS = frozenset(
+    {
+        "company",
+        "major",
+        "minor",
+        "patch",
+        "is_prerelease",
+        "is_postrelease",
+        "is_devrelease",
+        "is_debug",
+    }
+)
+
 
 @dataclasses.dataclass
 class PythonInfo:
@@ -32,6 +49,15 @@ class PythonInfo:
     company: str | None = None
     name: str | None = None
     executable: str | Path | None = None
+    implementation: str | None = None
+    abiflags: str | None = None
+    prefix: str | None = None
+    base_prefix: str | None = None
+    gil_disabled: bool = False
+    # Every path known to run this same interpreter, including ``path`` itself
+    aliases: list[Path] = dataclasses.field(default_factory=list)
+    # False when the details were read from the install layout, not the interpreter
+    verified: bool = True
 
     @property
     def is_python(self) -> bool:
@@ -62,10 +88,17 @@ class PythonInfo:
             self.is_debug,
         )
 
-    @property
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        if name in VERSION_SORT_FIELDS:
+            self.__dict__.pop("version_sort", None)
+
+    @functools.cached_property
     def version_sort(self) -> tuple[int, int, int, int, int]:
         """
         A tuple for sorting against other instances of the same class.
+
+        It is computed once and kept until one of the fields it depends on changes.
         """
         company_sort = 1 if (self.company and self.company == "PythonCore") else 0
         release_sort = 2
@@ -87,7 +120,7 @@ class PythonInfo:
 
     def matches(
         self,
-        major: int | None = None,
+        major: int | PythonQuery | None = None,
         minor: int | None = None,
         patch: int | None = None,
         pre: bool | None = None,
@@ -98,7 +131,12 @@ class PythonInfo:
     ) -> bool:
         """
         Check if this Python version matches the specified criteria.
+
+        A :class:`~pythonfinder.models.PythonQuery` may be passed as ``major`` in
+        place of the version criteria.
         """
+        if isinstance(major, PythonQuery):
+            major, minor, patch, pre, dev, arch, python_name = major
         if arch:
             own_arch = self.architecture or self._get_architecture()
             if arch.isdigit():
@@ -125,12 +163,17 @@ class PythonInfo:
         """
         if self.architecture:
             return self.architecture
+        from ..utils.binary_utils import get_binary_architecture
 
         arch = None
-        if self.path:
-            arch, _ = platform.architecture(str(self.path))
-        elif self.executable:
-            arch, _ = platform.architecture(str(self.executable))
+        target = self.path or self.executable
+        if target:
+            binary_arch = get_binary_architecture(target)
+            if binary_arch is not None:
+                arch = binary_arch[0]
+            else:
+                # Unknown executable format, let platform work it out
+                arch, _ = platform.architecture(str(target))
 
         if arch is None:
             arch, _ = platform.architecture(sys.executable)
@@ -0,0 +1,176 @@
+from __future__ import annotations
+
+import dataclasses
+import functools
+import re
+from typing import Iterator
+
+VERSION_QUERY_RE = re.compile(
+    r"(?P<major>\d+)(?:\.(?P<minor>\d+))?(?:\.(?P<patch>(?<=\.)[0-9]+))?\.?"
+    r"(?:(?P<prerel>[abc]|rc|dev)(?:(?P<prerelversion>\d+(?:\.\d+)*))?)"
+    r"?(?P<postdev>(\.post(?P<post>\d+))?(\.dev(?P<dev>\d+))?)?"
+)
+
+
+@functools.lru_cache(maxsize=256)
+def parse_major(
+    major: str | None,
+    minor: int | None = None,
+    patch: int | None = None,
+    pre: bool | None = None,
+    dev: bool | None = None,
+    arch: str | None = None,
+) -> dict[str, int | str | bool | None]:
+    """
+    Parse a major version string into a dictionary of version components.
+
+    Results are cached, so the dictionary returned must not be modified.
+
+    Args:
+        major: Major version number or full version string.
+        minor: Minor version number.
+        patch: Patch version number.
+        pre: Whether to include pre-releases.
+        dev: Whether to include dev-releases.
+        arch: Architecture to include, e.g. '64bit'.
+
+    Returns:
+        A dictionary containing the parsed version components.
+    """
+    from ..utils.version_utils import parse_python_version
+
+    major_is_str = major and isinstance(major, str)
+    is_num = (
+        major and major_is_str and all(part.isdigit() for part in major.split(".")[:2])
+    )
+    major_has_arch = (
+        arch is None and major and major_is_str and "-" in major and major[0].isdigit()
+    )
+    name = None
+
+    if major and major_has_arch:
+        orig_string = f"{major!s}"
+        major, _, arch = major.rpartition("-")
+        if arch:
+            arch = arch.lower().lstrip("x").replace("bit", "")
+            if not (arch.isdigit() and (int(arch) & int(arch) - 1) == 0):
+                major = orig_string
+                arch = None
+            else:
+                arch = f"{arch}bit"
+        try:
+            version_dict = parse_python_version(major)
+        except Exception:
+            if name is None:
+                name = f"{major!s}"
+                major = None
+            version_dict = {}
+    elif major and major[0].isalpha():
+        return {"major": None, "name": major, "arch": arch}
+    elif major and is_num:
+        match = VERSION_QUERY_RE.match(major)
+        version_dict = match.groupdict() if match else {}
+        version_dict.update(
+            {
+                "is_prerelease": bool(version_dict.get("prerel", False)),
+                "is_devrelease": bool(version_dict.get("dev", False)),
+            }
+        )
+    else:
+        version_dict = {
+            "major": major,
+            "minor": minor,
+            "patch": patch,
+            "pre": pre,
+            "dev": dev,
+            "arch": arch,
+        }
+
+    if not version_dict.get("arch") and arch:
+        version_dict["arch"] = arch
+
+    version_dict["minor"] = (
+        int(version_dict["minor"]) if version_dict.get("minor") is not None else minor
+    )
+    version_dict["patch"] = (
+        int(version_dict["patch"]) if version_dict.get("patch") is not None else patch
+    )
+    version_dict["major"] = (
+        int(version_dict["major"]) if version_dict.get("major") is not None else major
+    )
+
+    if not (version_dict["major"] or version_dict.get("name")):
+        version_dict["major"] = major
+        if name:
+            version_dict["name"] = name
+
+    return version_dict
+
+
+@dataclasses.dataclass(frozen=True)
+class PythonQuery:
+    """
+    A version query, parsed once.
+
+    Queries are immutable and hashable, so they can key caches of search results.
+    Every finder's search methods, and :meth:`PythonInfo.matches
+    <pythonfinder.models.python_info.PythonInfo.matches>`, accept one in place of
+    ``major`` and then use it as is, ignoring their other criteria. Unpacking a
+    query gives its parts in the order those methods take them.
+    """
+
+    major: int | str | None = None
+    minor: int | None = None
+    patch: int | None = None
+    pre: bool | None = None
+    dev: bool | None = None
+    arch: str | None = None
+    name: str | None = None
+
+    @classmethod
+    def parse(
+        cls,
+        major: str | int | PythonQuery | None = None,
+        minor: int | None = None,
+        patch: int | None = None,
+        pre: bool | None = None,
+        dev: bool | None = None,
+        arch: str | None = None,
+        name: str | None = None,
+    ) -> PythonQuery:
+        """
+        Build a query from the criteria the search methods take.
+
+        Args:
+            major: Major version number, full version string such as ``3.9.1rc1``
+                or ``3.11-64``, or the name of a python version. A query given here
+                is returned unchanged.
+            minor: Minor version number.
+            patch: Patch version number.
+            pre: Whether to include pre-releases.
+            dev: Whether to include dev-releases.
+            arch: Architecture to include, e.g. '64bit'.
+            name: The name of a python version, e.g. ``anaconda3-5.3.0``.
+
+        Returns:
+            The parsed query.
+        """
+        if isinstance(major, PythonQuery):
+            return major
+        if isinstance(major, str) and not any([minor, patch, pre, dev, arch]):
+            version_dict = parse_major(major, minor, patch, pre, dev, arch)
+            return cls(
+                major=version_dict.get("major"),
+                minor=version_dict.get("minor"),
+                patch=version_dict.get("patch"),
+                pre=version_dict.get("is_prerelease"),
+                dev=version_dict.get("is_devrelease"),
+                arch=version_dict.get("arch"),
+                name=version_dict.get("name"),
+            )
+        return cls(major, minor, patch, pre, dev, arch, name)
+
+    def __iter__(self) -> Iterator:
+        return iter(
+            (self.major, self.minor, self.patch, self.pre, self.dev, self.arch, self.name)
+        )
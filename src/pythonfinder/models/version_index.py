@@ -0,0 +1,93 @@
+from __future__ import annotations
+
+import bisect
+from typing import TYPE_CHECKING, Iterable
+
+if TYPE_CHECKING:
+    from packaging.specifiers import SpecifierSet
+
+    from .python_info import PythonInfo
+
+
+class VersionIndex:
+    """
+    Pythons sorted by version, for answering PEP 440 specifier queries.
+
+    The index is built once from the results of a search. A query only tests the
+    range of versions its bounds (``>=``, ``<`` and the like) leave, found by
+    bisection, against the full specifier set, and reuses the versions already
+    parsed into each :class:`~pythonfinder.models.python_info.PythonInfo`.
+    Pythons whose version couldn't be parsed are left out.
+    """
+
+    def __init__(self, pythons: Iterable[PythonInfo]):
+        """
+        Initialize a new VersionIndex.
+
+        Args:
+            pythons: The Pythons to index.
+        """
+        entries = sorted(
+            (python_info for python_info in pythons if python_info.version is not None),
+            key=lambda python_info: python_info.version,
+        )
+        self._versions = [python_info.version for python_info in entries]
+        self._pythons = entries
+
+    def __len__(self) -> int:
+        return len(self._pythons)
+
+    def _bounds(self, spec: SpecifierSet) -> tuple[int, int]:
+        """
+        Narrow the index down to the slice that can satisfy every specifier.
+
+        Only operators whose matches form a contiguous range of versions narrow
+        the slice; the rest are left to the final check.
+        """
+        from packaging.version import InvalidVersion, Version
+
+        lo, hi = 0, len(self._versions)
+        for specifier in spec:
+            operator = specifier.operator
+            if operator in ("===", "!=") or specifier.version.endswith(".*"):
+                continue
+            try:
+                version = Version(specifier.version)
+            except InvalidVersion:
+                continue
+            if operator in (">=", "==", "~="):
+                # ``==`` also matches local versions, which sort after ``version``
+                lo = max(lo, bisect.bisect_left(self._versions, version))
+            elif operator == ">":
+                lo = max(lo, bisect.bisect_right(self._versions, version))
+            elif operator == "<":
+                hi = min(hi, bisect.bisect_left(self._versions, version))
+            elif operator == "<=":
+                hi = min(hi, bisect.bisect_right(self._versions, version))
+        return lo, hi
+
+    def filter(
+        self, spec: SpecifierSet | str, prereleases: bool | None = None
+    ) -> list[PythonInfo]:
+        """
+        Find the Pythons whose version satisfies a specifier set.
+
+        Args:
+            spec: The specifier set, e.g. ``>=3.9,<3.13``.
+            prereleases: Whether to accept pre-releases. Defaults to the specifier
+                set's own rule: only if it names a pre-release itself.
+
+        Returns:
+            The matching Pythons, lowest version first.
+        """
+        if isinstance(spec, str):
+            from packaging.specifiers import SpecifierSet
+
+            spec = SpecifierSet(spec)
+
+        lo, hi = self._bounds(spec)
+        return [
+            self._pythons[index]
+            for index in range(lo, hi)
+            if spec.contains(self._versions[index], prereleases=prereleases)
+        ]
@@ -1,19 +1,36 @@
 from __future__ import annotations
 
+import heapq
 import os
-from typing import TYPE_CHECKING
+from functools import cached_property
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Hashable,
+    Iterable,
+    Iterator,
+    MutableMapping,
+)
 
+from .cache import LRUCache, ProbeCache, ProbeStore
+from .environment import PROBE_CACHE_ENABLED
 from .finders import (
     AsdfFinder,
     BaseFinder,
     PyenvFinder,
     SystemFinder,
 )
+from .models.python_query import PythonQuery
 
 if TYPE_CHECKING:
     from pathlib import Path
 
+    from packaging.specifiers import SpecifierSet
+
+    from .cache import CacheStats
     from .models.python_info import PythonInfo
+    from .models.version_index import VersionIndex
 
 # Import Windows-specific finders if on Windows
 if os.name == "nt":
@@ -33,6 +50,13 @@ class Finder:
         ignore_unsupported: bool = True,
         sort_by_path: bool = False,
         pyenv_only: bool = False,
+        max_workers: int | None = None,
+        probe_cache: bool | str | Path | None = None,
+        verify: bool = False,
+        sniff_binaries: bool = False,
+        cache_size: int | None = None,
+        cache_ttl: float | None = None,
+        memoize: bool = False,
     ):
         """
         Initialize a new Finder.
@@ -43,6 +67,26 @@ class Finder:
             global_search: Whether to search in the system PATH.
             ignore_unsupported: Whether to ignore unsupported Python versions.
             pyenv_only: Whether to restrict searches to pyenv-managed Pythons.
+            max_workers: Maximum number of interpreters to probe concurrently.
+                Defaults to a value derived from the CPU count; ``1`` probes serially.
+            probe_cache: Whether to keep probe results in a persistent on-disk cache,
+                or the directory to keep it in. Defaults to the
+                ``PYTHONFINDER_PROBE_CACHE`` environment variable.
+            verify: Whether to run every interpreter found, instead of trusting the
+                version a pyenv or asdf install directory is named for or a
+                virtual environment's ``pyvenv.cfg`` records.
+            sniff_binaries: Whether to read the version of other interpreters from
+                the version string compiled into them instead of running them.
+                Results found this way have ``verified`` set to False.
+            cache_size: The most probe results, and Pythons per finder, to keep in
+                memory, evicting the least recently used. Defaults to keeping all.
+            cache_ttl: How many seconds in-memory results stay valid when
+                ``cache_size`` is set. Defaults to forever.
+            memoize: Whether to answer a repeated search from memory until
+                :attr:`generation` changes. Before a result is reused, each search
+                directory is checked with a ``stat`` so that Pythons installed or
+                removed since are noticed; an interpreter replaced in place is only
+                seen after :meth:`refresh`, :meth:`invalidate` or ``cache_ttl``.
         """
         self.path = path
         self.system = system
@@ -50,55 +94,213 @@ class Finder:
         self.ignore_unsupported = ignore_unsupported
         self.sort_by_path = sort_by_path
         self.pyenv_only = pyenv_only
+        self.max_workers = max_workers
+        self.verify = verify
+        self.sniff_binaries = sniff_binaries
+        self.cache_size = cache_size
+        self.cache_ttl = cache_ttl
+        self.memoize = memoize
+
+        if probe_cache is None:
+            probe_cache = PROBE_CACHE_ENABLED
+        if probe_cache is True:
+            self.probe_cache: ProbeCache | None = ProbeCache()
+        elif probe_cache:
+            self.probe_cache = ProbeCache(probe_cache)
+        else:
+            self.probe_cache = None
+        # Shared by every finder so each interpreter is spawned at most once
+        self.probe_store = ProbeStore(cache=self._new_cache())
+        # Search results by query, with the generation they were found in
+        self._results: MutableMapping[Hashable, tuple[int, Any]] | None = None
+        if memoize:
+            self._results = self._new_cache()
+            if self._results is None:
+                self._results = {}
+        # Version indexes of the Pythons found for a query, by query and finder, with
+        # the generation they were built in
+        indexes = self._new_cache()
+        self._indexes: MutableMapping[Hashable, tuple[int, VersionIndex]] = (
+            indexes if indexes is not None else {}
+        )
+
+    def _finder_options(self) -> dict:
+        return {
+            "ignore_unsupported": self.ignore_unsupported,
+            "max_workers": self.max_workers,
+            "probe_cache": self.probe_cache,
+            "probe_store": self.probe_store,
+            "verify": self.verify,
+            "sniff_binaries": self.sniff_binaries,
+            "python_cache": self._new_cache(),
+        }
+
+    def _new_cache(self) -> LRUCache | None:
+        if self.cache_size is None:
+            return None
+        return LRUCache(self.cache_size, self.cache_ttl)
+
+    # Finders are built on first use, so constructing a Finder touches nothing on disk
+
+    @cached_property
+    def pyenv_finder(self) -> PyenvFinder:
+        """
+        The finder for pyenv-managed Pythons.
+        """
+        return PyenvFinder(**self._finder_options())
 
-        # Initialize finders
-        self.pyenv_finder = PyenvFinder(
-            ignore_unsupported=ignore_unsupported,
+    @cached_property
+    def system_finder(self) -> SystemFinder | None:
+        """
+        The finder for Pythons on the search path, or None if ``pyenv_only`` is set.
+        """
+        if self.pyenv_only:
+            return None
+        return SystemFinder(
+            paths=[self.path] if self.path else None,
+            global_search=self.global_search,
+            system=self.system,
+            **self._finder_options(),
         )
 
-        if pyenv_only:
-            self.system_finder = None
-            self.asdf_finder = None
-            self.py_launcher_finder = None
-            self.windows_finder = None
-            self.finders: list[BaseFinder] = [self.pyenv_finder]
-        else:
-            self.system_finder = SystemFinder(
-                paths=[path] if path else None,
-                global_search=global_search,
-                system=system,
-                ignore_unsupported=ignore_unsupported,
-            )
+    @cached_property
+    def asdf_finder(self) -> AsdfFinder | None:
+        """
+        The finder for asdf-managed Pythons, or None if ``pyenv_only`` is set.
+        """
+        if self.pyenv_only:
+            return None
+        return AsdfFinder(**self._finder_options())
 
-            self.asdf_finder = AsdfFinder(
-                ignore_unsupported=ignore_unsupported,
-            )
+    @cached_property
+    def py_launcher_finder(self) -> BaseFinder | None:
+        """
+        The finder for Pythons known to the ``py`` launcher, on Windows only.
+        """
+        if self.pyenv_only or os.name != "nt":
+            return None
+        return PyLauncherFinder(
+            ignore_unsupported=self.ignore_unsupported, python_cache=self._new_cache()
+        )
 
-            # Initialize Windows-specific finders if on Windows
-            self.py_launcher_finder = None
-            self.windows_finder = None
-            if os.name == "nt":
-                self.py_launcher_finder = PyLauncherFinder(
-                    ignore_unsupported=ignore_unsupported,
-                )
-                self.windows_finder = WindowsRegistryFinder(
-                    ignore_unsupported=ignore_unsupported,
-                )
+    @cached_property
+    def windows_finder(self) -> BaseFinder | None:
+        """
+        The finder for Pythons registered per PEP 514, on Windows only.
+        """
+        if self.pyenv_only or os.name != "nt":
+            return None
+        return WindowsRegistryFinder(
+            ignore_unsupported=self.ignore_unsupported, python_cache=self._new_cache()
+        )
 
-            # List of all finders
-            self.finders: list[BaseFinder] = [
-                self.pyenv_finder,
-                self.asdf_finder,
-            ]
+    @cached_property
+    def finders(self) -> list[BaseFinder]:
+        """
+        The finders to search, in priority order.
+        """
+        if self.pyenv_only:
+            return [self.pyenv_finder]
+
+        finders: list[BaseFinder] = [self.pyenv_finder, self.asdf_finder]
+
+        # Add Windows-specific finders if on Windows
+        if self.py_launcher_finder:
+            finders.append(self.py_launcher_finder)
+        if self.windows_finder:
+            finders.append(self.windows_finder)
+
+        # Add system finder last
+        finders.append(self.system_finder)
+        return finders
+
+    def invalidate(self, path: str | Path) -> None:
+        """
+        Forget what was found about a Python executable, so that it is identified
+        again the next time it is found.
 
-            # Add Windows-specific finders if on Windows
-            if self.py_launcher_finder:
-                self.finders.append(self.py_launcher_finder)
-            if self.windows_finder:
-                self.finders.append(self.windows_finder)
+        Results are already checked against the file they describe whenever they
+        are used, so this is only needed for changes that check can't see.
+
+        Args:
+            path: Path to the Python executable.
+        """
+        for finder in self._built_finders():
+            finder.invalidate(path)
+
+    def refresh(self) -> None:
+        """
+        Forget everything found so far, including the paths pyenv and asdf
+        versions were listed from, without throwing the Finder away.
+
+        Entries in the on-disk probe cache are kept, since each is checked against
+        the interpreter it describes.
+        """
+        for finder in self._built_finders():
+            finder.invalidate()
+        self.probe_store.clear()
+        if self._results is not None:
+            self._results.clear()
+        self._indexes.clear()
+
+    def cache_stats(self) -> dict[str, CacheStats]:
+        """
+        Report how the bounded in-memory caches set up by ``cache_size`` are doing.
+
+        Returns:
+            A dictionary mapping ``probe_store``, ``results`` when ``memoize`` is
+            set, and the name of every finder built so far, such as
+            ``system_finder``, to its cache's counters. It is empty when
+            ``cache_size`` isn't set.
+        """
+        caches = {"probe_store": self.probe_store.cache, "results": self._results}
+        for name in (
+            "pyenv_finder",
+            "asdf_finder",
+            "py_launcher_finder",
+            "windows_finder",
+            "system_finder",
+        ):
+            finder = self.__dict__.get(name)
+            if finder is not None:
+                caches[name] = finder._python_versions
+        return {
+            name: cache.stats
+            for name, cache in caches.items()
+            if isinstance(cache, LRUCache)
+        }
+
+    @property
+    def generation(self) -> int:
+        """
+        A counter that goes up whenever the Pythons found by any finder, or the
+        probe results they were identified from, change.
+        """
+        return self.probe_store.generation + sum(
+            finder.generation for finder in self._built_finders()
+        )
 
-            # Add system finder last
-            self.finders.append(self.system_finder)
+    def _memoized(self, key: Hashable, search: Callable[[], Any]) -> Any:
+        """
+        Run a search, or return its result from the last time it was run if the
+        Pythons found haven't changed since.
+        """
+        if self._results is None:
+            return search()
+        for finder in self._built_finders():
+            finder.check_for_changes()
+        entry = self._results.get(key)
+        if entry is not None and entry[0] == self.generation:
+            return entry[1]
+        result = search()
+        self._results[key] = (self.generation, result)
+        return result
+
+    def _built_finders(self) -> list[BaseFinder]:
+        # Finders that haven't been built yet have nothing to forget
+        if "finders" not in self.__dict__:
+            return []
+        return [finder for finder in self.finders if finder is not None]
 
     def which(self, executable: str) -> Path | None:
         """
@@ -119,100 +321,372 @@ class Finder:
 
     def find_python_version(
         self,
-        major: str | int | None = None,
+        major: str | int | PythonQuery | None = None,
         minor: int | None = None,
         patch: int | None = None,
         pre: bool | None = None,
         dev: bool | None = None,
         arch: str | None = None,
         name: str | None = None,
+        spec: SpecifierSet | str | None = None,
     ) -> PythonInfo | None:
         """
         Find a Python version matching the specified criteria.
 
         Args:
-            major: Major version number or full version string.
+            major: Major version number, full version string or a parsed
+                :class:`~pythonfinder.models.PythonQuery`.
             minor: Minor version number.
             patch: Patch version number.
             pre: Whether to include pre-releases.
             dev: Whether to include dev-releases.
             arch: Architecture to include, e.g. '64bit'.
             name: The name of a python version, e.g. ``anaconda3-5.3.0``.
+            spec: A PEP 440 specifier set the version must satisfy, e.g.
+                ``>=3.9,<3.13``.
 
         Returns:
             A PythonInfo object matching the criteria, or None if not found.
         """
-        # Parse the major version if it's a string
-        if isinstance(major, str) and not any([minor, patch, pre, dev, arch]):
-            for finder in self.finders:
-                version_dict = finder.parse_major(major, minor, patch, pre, dev, arch)
-                if version_dict.get("name") and not name:
-                    name = version_dict.get("name")
-                    major = version_dict.get("major")
-                    minor = version_dict.get("minor")
-                    patch = version_dict.get("patch")
-                    pre = version_dict.get("is_prerelease")
-                    dev = version_dict.get("is_devrelease")
-                    arch = version_dict.get("arch")
-                    break
+        query = PythonQuery.parse(major, minor, patch, pre, dev, arch, name)
+        return self._memoized(
+            ("find_python_version", query, spec),
+            lambda: self._find_python_version(query, spec),
+        )
 
+    def _find_python_version(
+        self, query: PythonQuery, spec: SpecifierSet | str | None
+    ) -> PythonInfo | None:
         # Try to find the Python version in each finder
         for finder in self.finders:
-            python_version = finder.find_python_version(
-                major, minor, patch, pre, dev, arch, name
-            )
+            if spec is not None:
+                python_versions = self._match_spec(
+                    finder.iter_python_versions(query), spec, query, finder
+                )
+                python_version = next(
+                    iter(self._select_python_versions(python_versions, 1)), None
+                )
+            else:
+                python_version = finder.find_python_version(query)
             if python_version:
                 return python_version
 
         return None
 
+    def _parse_many_query(self, query: str | int) -> tuple[PythonQuery, bool]:
+        """
+        Parse one of the queries given to :meth:`find_many`.
+
+        A ``t`` after a version number, as in ``3.13t``, asks for a free-threaded
+        build.
+
+        Returns:
+            The parsed query, and whether it asks for a free-threaded build.
+        """
+        free_threaded = (
+            isinstance(query, str)
+            and query[:1].isdigit()
+            and query.endswith("t")
+            and query[-2:-1].isdigit()
+        )
+        if free_threaded:
+            query = query[:-1]
+        return PythonQuery.parse(query), free_threaded
+
+    @staticmethod
+    def _many_version_hint(pending: dict) -> tuple[int | None, int | None]:
+        """
+        The major and minor version every pending query of :meth:`find_many`
+        shares, if any, so finders can skip candidates none of them can match.
+        """
+        majors = {version_query.major for version_query, _ in pending.values()}
+        major = majors.pop() if len(majors) == 1 else None
+        minors = {version_query.minor for version_query, _ in pending.values()}
+        minor = minors.pop() if major is not None and len(minors) == 1 else None
+        return major, minor
+
+    @staticmethod
+    def _resolve_many(
+        pending: dict, results: dict, python_versions: list[PythonInfo]
+    ) -> None:
+        """
+        Answer the pending queries of :meth:`find_many` that one finder's Pythons
+        match, moving them from ``pending`` to ``results``.
+        """
+        for query, (version_query, free_threaded) in list(pending.items()):
+            matches = [
+                python_info
+                for python_info in python_versions
+                if python_info.matches(version_query)
+                and (python_info.gil_disabled or not free_threaded)
+            ]
+            if matches:
+                results[query] = max(matches, key=lambda x: x.version_sort)
+                del pending[query]
+
+    def find_many(
+        self, queries: Iterable[str | int]
+    ) -> dict[str | int, PythonInfo | None]:
+        """
+        Find the best match for each of several version queries in one search.
+
+        Each finder looks for Pythons once for all the queries, and stops being
+        searched once every query has a match, so each interpreter is probed at
+        most once however many queries there are. Every query is answered as
+        :meth:`find_python_version` would answer it, except that a ``t`` after the
+        version number, which it doesn't accept, only matches free-threaded builds.
+
+        Args:
+            queries: Versions or names as passed to :meth:`find_python_version`,
+                e.g. ``3.9``, ``pypy3.10``, or ``3.13t`` for a free-threaded build.
+
+        Returns:
+            A dictionary mapping each query to its best match, or None if there is
+            no match.
+        """
+        pending = {query: self._parse_many_query(query) for query in queries}
+        results: dict[str | int, PythonInfo | None] = dict.fromkeys(pending)
+
+        for finder in self.finders:
+            if not pending:
+                break
+            python_versions = list(
+                finder._iter_pythons_for_version(*self._many_version_hint(pending))
+            )
+            self._resolve_many(pending, results, python_versions)
+
+        return results
+
+    def iter_python_versions(
+        self,
+        major: str | int | PythonQuery | None = None,
+        minor: int | None = None,
+        patch: int | None = None,
+        pre: bool | None = None,
+        dev: bool | None = None,
+        arch: str | None = None,
+        name: str | None = None,
+    ) -> Iterator[PythonInfo]:
+        """
+        Lazily iterate over the Python versions matching the specified criteria.
+
+        Unlike :meth:`find_all_python_versions`, results are not sorted: they are
+        yielded finder by finder, in discovery order, as soon as each interpreter
+        has been probed. Interpreters past the last one consumed are never run,
+        so ``next(finder.iter_python_versions(3))`` only does as much work as it
+        takes to find one match. To find it sooner, a query naming a major or
+        minor version first tries the candidates in each directory whose names
+        spell out the most of it, e.g. ``python3.9`` before ``python3`` before
+        ``python`` for ``3.9``.
+
+        Args:
+            major: Major version number, full version string or a parsed
+                :class:`~pythonfinder.models.PythonQuery`.
+            minor: Minor version number.
+            patch: Patch version number.
+            pre: Whether to include pre-releases.
+            dev: Whether to include dev-releases.
+            arch: Architecture to include, e.g. '64bit'.
+            name: The name of a python version, e.g. ``anaconda3-5.3.0``.
+
+        Returns:
+            An iterator of PythonInfo objects matching the criteria, without
+            duplicate paths.
+        """
+        query = PythonQuery.parse(major, minor, patch, pre, dev, arch, name)
+
+        seen_paths = set()
+        for finder in self.finders:
+            for python_info in finder.iter_python_versions(query):
+                if python_info.path not in seen_paths:
+                    seen_paths.add(python_info.path)
+                    yield python_info
+
     def find_all_python_versions(
         self,
-        major: str | int | None = None,
+        major: str | int | PythonQuery | None = None,
         minor: int | None = None,
         patch: int | None = None,
         pre: bool | None = None,
         dev: bool | None = None,
         arch: str | None = None,
         name: str | None = None,
+        spec: SpecifierSet | str | None = None,
     ) -> list[PythonInfo]:
         """
         Find all Python versions matching the specified criteria.
 
         Args:
-            major: Major version number or full version string.
+            major: Major version number, full version string or a parsed
+                :class:`~pythonfinder.models.PythonQuery`.
             minor: Minor version number.
             patch: Patch version number.
             pre: Whether to include pre-releases.
             dev: Whether to include dev-releases.
             arch: Architecture to include, e.g. '64bit'.
             name: The name of a python version, e.g. ``anaconda3-5.3.0``.
+            spec: A PEP 440 specifier set the versions must satisfy, e.g.
+                ``>=3.9,<3.13``.
 
         Returns:
             A list of PythonInfo objects matching the criteria.
         """
-        # Parse the major version if it's a string
-        if isinstance(major, str) and not any([minor, patch, pre, dev, arch]):
-            for finder in self.finders:
-                version_dict = finder.parse_major(major, minor, patch, pre, dev, arch)
-                if version_dict.get("name") and not name:
-                    name = version_dict.get("name")
-                    major = version_dict.get("major")
-                    minor = version_dict.get("minor")
-                    patch = version_dict.get("patch")
-                    pre = version_dict.get("is_prerelease")
-                    dev = version_dict.get("is_devrelease")
-                    arch = version_dict.get("arch")
-                    break
+        query = PythonQuery.parse(major, minor, patch, pre, dev, arch, name)
+        return list(
+            self._memoized(
+                ("find_all_python_versions", query, spec),
+                lambda: self._find_all_python_versions(query, spec),
+            )
+        )
 
+    def _find_all_python_versions(
+        self, query: PythonQuery, spec: SpecifierSet | str | None
+    ) -> list[PythonInfo]:
         # Find all Python versions in each finder
         python_versions = []
         for finder in self.finders:
-            python_versions.extend(
-                finder.find_all_python_versions(major, minor, patch, pre, dev, arch, name)
+            python_versions.extend(finder.find_all_python_versions(query))
+
+        return self._sort_python_versions(self._match_spec(python_versions, spec, query))
+
+    def find_python_versions(
+        self,
+        major: str | int | PythonQuery | None = None,
+        minor: int | None = None,
+        patch: int | None = None,
+        pre: bool | None = None,
+        dev: bool | None = None,
+        arch: str | None = None,
+        name: str | None = None,
+        spec: SpecifierSet | str | None = None,
+        limit: int | None = None,
+    ) -> list[PythonInfo]:
+        """
+        Find the best Python versions matching the specified criteria.
+
+        Returns the same Pythons, in the same order, as the first ``limit`` of
+        :meth:`find_all_python_versions`, but picks them out of the matches
+        instead of sorting them all.
+
+        Args:
+            major: Major version number, full version string or a parsed
+                :class:`~pythonfinder.models.PythonQuery`.
+            minor: Minor version number.
+            patch: Patch version number.
+            pre: Whether to include pre-releases.
+            dev: Whether to include dev-releases.
+            arch: Architecture to include, e.g. '64bit'.
+            name: The name of a python version, e.g. ``anaconda3-5.3.0``.
+            spec: A PEP 440 specifier set the versions must satisfy, e.g.
+                ``>=3.9,<3.13``.
+            limit: The most Python versions to return. Defaults to all of them.
+
+        Returns:
+            A list of PythonInfo objects matching the criteria, best match first.
+        """
+        query = PythonQuery.parse(major, minor, patch, pre, dev, arch, name)
+
+        def search() -> list[PythonInfo]:
+            python_versions = []
+            for finder in self.finders:
+                python_versions.extend(finder.iter_python_versions(query))
+            return self._select_python_versions(
+                self._match_spec(python_versions, spec, query), limit
             )
 
-        # Sort by version and remove duplicates
+        return list(self._memoized(("find_python_versions", query, spec, limit), search))
+
+    def _match_spec(
+        self,
+        python_versions: Iterable[PythonInfo],
+        spec: SpecifierSet | str | None,
+        query: PythonQuery,
+        finder: BaseFinder | None = None,
+    ) -> list[PythonInfo]:
+        """
+        Keep the Python versions satisfying a specifier set, using a
+        :class:`~pythonfinder.models.VersionIndex` of them.
+
+        The index is reused by later queries for other specifier sets, for as long
+        as :attr:`generation` says the Pythons found haven't changed.
+
+        Args:
+            python_versions: The Python versions found for ``query``.
+            spec: The specifier set, or None to keep everything.
+            query: The query the Python versions were found for. If it asks for
+                pre-releases they are accepted even when the specifier set
+                doesn't name one.
+            finder: The finder the Python versions were found by, or None if they
+                were found by every finder.
+
+        Returns:
+            The matching Python versions, in no particular order.
+        """
+        if spec is None:
+            return list(python_versions)
+        from .models.version_index import VersionIndex
+
+        # Finish the search first, so the generation accounts for what it found
+        python_versions = list(python_versions)
+        generation = self.generation
+        entry = self._indexes.get((query, finder))
+        if entry is None or entry[0] != generation:
+            entry = self._indexes[query, finder] = (
+                generation,
+                VersionIndex(python_versions),
+            )
+        prereleases = True if query.pre else None
+        return entry[1].filter(spec, prereleases=prereleases)
+
+    def _select_python_versions(
+        self, python_versions: Iterable[PythonInfo], limit: int | None
+    ) -> list[PythonInfo]:
+        """
+        Pick the first Python versions :meth:`_sort_python_versions` would return
+        without sorting all of them.
+
+        Args:
+            python_versions: The Python versions to pick from.
+            limit: How many to pick, or None to sort them all.
+
+        Returns:
+            The best ``limit`` Python versions, best match first, without
+            duplicate paths.
+        """
+        if limit is None:
+            return self._sort_python_versions(list(python_versions))
+
+        # Rank each Python once, lowest first and ties broken by discovery order
+        # as the stable sort would, keeping the best entry for every path
+        best: dict[Path, tuple[tuple, PythonInfo]] = {}
+        for index, python_info in enumerate(python_versions):
+            if self.sort_by_path:
+                rank = (python_info.path, python_info.version_sort, index)
+            else:
+                rank = (tuple(-part for part in python_info.version_sort), index)
+            entry = best.get(python_info.path)
+            if entry is None or rank < entry[0]:
+                best[python_info.path] = (rank, python_info)
+
+        return [
+            python_info
+            for _, python_info in heapq.nsmallest(
+                limit, best.values(), key=lambda entry: entry[0]
+            )
+        ]
+
+    def _sort_python_versions(
+        self, python_versions: list[PythonInfo]
+    ) -> list[PythonInfo]:
+        """
+        Sort Python versions found by several finders and drop duplicate paths.
+
+        Args:
+            python_versions: The Python versions to sort.
+
+        Returns:
+            The sorted list, best match first, without duplicate paths.
+        """
         seen_paths = set()
         unique_versions = []
 
@@ -1,8 +1,11 @@
 from __future__ import annotations
 
+from .binary_utils import get_binary_architecture, sniff_python_version
 from .path_utils import (
     PYTHON_IMPLEMENTATIONS,
     ensure_path,
+    entry_is_python,
+    file_identity,
     filter_pythons,
     is_executable,
     is_in_path,
@@ -13,17 +16,33 @@ from .path_utils import (
 from .version_utils import (
     get_python_version,
     guess_company,
+    guess_install_metadata,
+    guess_prefix_metadata,
+    guess_venv_metadata,
+    guess_version_from_dir_name,
+    guess_version_from_name,
     parse_asdf_version_order,
     parse_pyenv_version_order,
     parse_python_version,
+    probe_python,
+    probe_python_async,
+    version_hint_matches,
 )
 
 __all__ = [
     "PYTHON_IMPLEMENTATIONS",
     "ensure_path",
+    "entry_is_python",
+    "file_identity",
     "filter_pythons",
+    "get_binary_architecture",
     "get_python_version",
     "guess_company",
+    "guess_install_metadata",
+    "guess_prefix_metadata",
+    "guess_venv_metadata",
+    "guess_version_from_dir_name",
+    "guess_version_from_name",
     "is_executable",
     "is_in_path",
     "looks_like_python",
@@ -31,5 +50,9 @@ __all__ = [
     "parse_pyenv_version_order",
     "parse_python_version",
     "path_is_python",
+    "probe_python",
+    "probe_python_async",
     "resolve_path",
+    "sniff_python_version",
+    "version_hint_matches",
 ]
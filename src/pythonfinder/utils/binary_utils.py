@@ -0,0 +1,270 @@
+from __future__ import annotations
+
+import os
+import re
+import struct
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    import mmap
+    from pathlib import Path
+
+# e_machine values from the ELF specification
+ELF_MACHINES = {
+    2: "sparc",
+    3: "x86",
+    8: "mips",
+    20: "ppc",
+    21: "ppc64",
+    22: "s390",
+    40: "arm",
+    43: "sparcv9",
+    62: "x86_64",
+    183: "aarch64",
+    243: "riscv",
+    258: "loongarch",
+}
+
+# cputype values from <mach/machine.h>; the 0x01000000 bit marks a 64-bit ABI
+MACHO_CPU_ABI64 = 0x01000000
+MACHO_MACHINES = {
+    7: "x86",
+    12: "arm",
+    18: "ppc",
+    7 | MACHO_CPU_ABI64: "x86_64",
+    12 | MACHO_CPU_ABI64: "arm64",
+    18 | MACHO_CPU_ABI64: "ppc64",
+}
+MACHO_MAGICS = {
+    b"\xfe\xed\xfa\xce": (">", "32bit"),
+    b"\xce\xfa\xed\xfe": ("<", "32bit"),
+    b"\xfe\xed\xfa\xcf": (">", "64bit"),
+    b"\xcf\xfa\xed\xfe": ("<", "64bit"),
+}
+MACHO_FAT_MAGIC = b"\xca\xfe\xba\xbe"
+
+# IMAGE_FILE_MACHINE_* values from the PE/COFF specification
+PE_MACHINES = {
+    0x014C: "x86",
+    0x01C4: "arm",
+    0x8664: "x86_64",
+    0xAA64: "arm64",
+}
+PE_OPTIONAL_HEADER_BITS = {0x10B: "32bit", 0x20B: "64bit"}
+
+
+def _elf_architecture(header: bytes) -> tuple[str, str] | None:
+    if len(header) < 20 or header[4] not in (1, 2) or header[5] not in (1, 2):
+        return None
+    bits = "32bit" if header[4] == 1 else "64bit"
+    byte_order = "<" if header[5] == 1 else ">"
+    (machine,) = struct.unpack_from(f"{byte_order}H", header, 18)
+    return bits, ELF_MACHINES.get(machine, "unknown")
+
+
+def _macho_architecture(header: bytes) -> tuple[str, str] | None:
+    byte_order, bits = MACHO_MAGICS[header[:4]]
+    if len(header) < 8:
+        return None
+    (cputype,) = struct.unpack_from(f"{byte_order}i", header, 4)
+    return bits, MACHO_MACHINES.get(cputype, "unknown")
+
+
+def _macho_fat_architecture(header: bytes) -> tuple[str, str] | None:
+    """
+    Pick the slice of a universal binary matching the running machine, or the
+    first one if there is no such slice.
+    """
+    import platform
+
+    if len(header) < 8:
+        return None
+    (nfat_arch,) = struct.unpack_from(">I", header, 4)
+    # Java class files share the magic; their version number is always >= 45
+    if not 0 < nfat_arch < 30 or len(header) < 8 + 20 * nfat_arch:
+        return None
+
+    slices = []
+    for index in range(nfat_arch):
+        (cputype,) = struct.unpack_from(">i", header, 8 + 20 * index)
+        bits = "64bit" if cputype & MACHO_CPU_ABI64 else "32bit"
+        slices.append((bits, MACHO_MACHINES.get(cputype, "unknown")))
+
+    host_machine = platform.machine().lower()
+    return next((arch for arch in slices if arch[1] == host_machine), slices[0])
+
+
+def _pe_architecture(fh, header: bytes) -> tuple[str, str] | None:
+    if len(header) < 64:
+        return None
+    (pe_offset,) = struct.unpack_from("<I", header, 0x3C)
+    fh.seek(pe_offset)
+    pe_header = fh.read(26)
+    if len(pe_header) < 26 or pe_header[:4] != b"PE\0\0":
+        return None
+    (machine,) = struct.unpack_from("<H", pe_header, 4)
+    (optional_magic,) = struct.unpack_from("<H", pe_header, 24)
+    bits = PE_OPTIONAL_HEADER_BITS.get(optional_magic)
+    if bits is None:
+        return None
+    return bits, PE_MACHINES.get(machine, "unknown")
+
+
+def get_binary_architecture(path: str | Path) -> tuple[str, str] | None:
+    """
+    Read the bitness and machine of an executable from its file header.
+
+    Understands ELF, Mach-O (including universal binaries) and PE executables
+    without running anything, which makes it a cheap replacement for
+    ``platform.architecture`` that shells out to ``file`` on most platforms.
+
+    Args:
+        path: Path to the executable. Symlinks are followed.
+
+    Returns:
+        A ``(bits, machine)`` tuple such as ``("64bit", "x86_64")``, or None if
+        the file can't be read or its format is not recognized.
+    """
+    try:
+        with open(path, "rb") as fh:
+            header = fh.read(512)
+            if header[:4] == b"\x7fELF":
+                return _elf_architecture(header)
+            if header[:4] in MACHO_MAGICS:
+                return _macho_architecture(header)
+            if header[:4] == MACHO_FAT_MAGIC:
+                return _macho_fat_architecture(header)
+            if header[:2] == b"MZ":
+                return _pe_architecture(fh, header)
+    except (OSError, struct.error):
+        pass
+    return None
+
+
+# ``PY_VERSION`` as compiled into the interpreter or libpython, e.g. ``3.11.7``
+# or ``3.14.0a1+``. Linkers merge string tails, so it may be the end of a longer
+# string such as an install prefix, and only its end is anchored.
+VERSION_LITERAL_RE = re.compile(
+    rb"(\d)\.(\d{1,2})\.(\d{1,2})((?:a|b|rc)\d{1,2})?(\+)?\x00"
+)
+# The shared library an embedding executable links against, as named in its
+# dynamic section: ``libpython3.11.so.1.0``, ``libpython3.11.dylib`` or
+# ``python311.dll``
+LIBPYTHON_RE = re.compile(
+    rb"(?:lib)?python(\d)\.?(\d{1,2})[a-z]*(?:\.so[\d.]*|\.dylib|\.dll)", re.IGNORECASE
+)
+
+
+def _find_libpython(data: mmap.mmap) -> tuple[str, int, int] | None:
+    start = 0
+    while True:
+        index = data.find(b"python", start)
+        if index < 0:
+            return None
+        start = index + 1
+        lib_start = index - 3 if data[index - 3 : index] == b"lib" else index
+        match = LIBPYTHON_RE.match(data, lib_start)
+        if match:
+            name = match.group(0).decode("ascii")
+            return name, int(match.group(1)), int(match.group(2))
+
+
+def _find_version_literals(data: mmap.mmap, major: int, minor: int) -> set[str]:
+    literals = set()
+    prefix = f"{major}.{minor}.".encode("ascii")
+    start = 0
+    while True:
+        index = data.find(prefix, start)
+        if index < 0:
+            return literals
+        start = index + 1
+        if index and data[index - 1 : index] in b"0123456789.":
+            continue
+        match = VERSION_LITERAL_RE.match(data, index)
+        if match:
+            literals.add(match.group(0)[:-1].decode("ascii"))
+
+
+def _map_file(path: str | Path) -> mmap.mmap | None:
+    import mmap
+
+    try:
+        with open(path, "rb") as fh:
+            return mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+    except (OSError, ValueError):
+        # ValueError is raised for empty files
+        return None
+
+
+def _libpython_dirs(executable: str) -> list[str]:
+    import platform
+
+    bin_dir = os.path.dirname(executable)
+    dirs = [os.path.join(os.path.dirname(bin_dir), "lib"), bin_dir]
+    dirs.extend(filter(None, os.environ.get("LD_LIBRARY_PATH", "").split(os.pathsep)))
+    dirs.extend(
+        [
+            "/usr/local/lib",
+            "/usr/lib64",
+            "/usr/lib",
+            f"/usr/lib/{platform.machine()}-linux-gnu",
+        ]
+    )
+    return dirs
+
+
+def sniff_python_version(
+    path: str | Path, minor_hint: tuple[int, int] | None = None
+) -> dict[str, Any] | None:
+    """
+    Read the version of a CPython interpreter from the ``PY_VERSION`` string
+    compiled into it, without running it.
+
+    The executable is memory-mapped rather than read, and when it embeds Python
+    through a shared ``libpython``, that library is searched too. The result is
+    a best guess: it is only returned when exactly one version string matching
+    the interpreter's major and minor version is found.
+
+    Args:
+        path: Path to the Python executable. Symlinks are followed.
+        minor_hint: The ``(major, minor)`` version the executable is believed to
+            be, used when it doesn't link against a versioned ``libpython``.
+
+    Returns:
+        A dictionary shaped like the one
+        :func:`~pythonfinder.utils.version_utils.probe_python` returns, holding
+        ``version``, ``dev``, ``architecture`` and ``machine``, or None.
+    """
+    executable = os.path.realpath(path)
+    data = _map_file(executable)
+    if data is None:
+        return None
+
+    with data:
+        libpython = _find_libpython(data)
+        if libpython is not None:
+            _, major, minor = libpython
+        elif minor_hint is not None:
+            major, minor = minor_hint
+        else:
+            return None
+        literals = _find_version_literals(data, major, minor)
+
+    if libpython is not None:
+        for lib_dir in _libpython_dirs(executable):
+            library = _map_file(os.path.join(lib_dir, libpython[0]))
+            if library is not None:
+                with library:
+                    literals |= _find_version_literals(library, major, minor)
+                break
+
+    if len(literals) != 1:
+        return None
+    version = literals.pop()
+    bits, machine = get_binary_architecture(executable) or (None, None)
+    return {
+        "version": version.rstrip("+"),
+        "dev": version.endswith("+"),
+        "architecture": bits,
+        "machine": machine,
+    }
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import fnmatch
 import os
 import re
 from pathlib import Path
@@ -55,6 +56,46 @@ for rule in RULES:
     MATCH_RULES.extend([f"{rule}.{ext}" if ext else f"{rule}" for ext in KNOWN_EXTS])
 
 
+def _translate_glob(pattern: str) -> str:
+    """
+    Translate a glob with :func:`fnmatch.translate`, without the flags and the end
+    anchor it wraps the expression in, so that it can be combined with others.
+    """
+    head, _, tail = fnmatch.translate("").partition(")")
+    translated = fnmatch.translate(pattern)
+    return translated[len(head) : -len(tail) - 1]
+
+
+def _compile_match_rules() -> re.Pattern[str]:
+    """
+    Compile ``MATCH_RULES`` into a single anchored regular expression.
+
+    ``MATCH_RULES`` holds every combination of implementation, rule and extension,
+    which makes checking them one glob at a time cost hundreds of ``fnmatch``
+    calls per file. The rules factor into "implementation, then one of the
+    ``RULES_BASE`` suffixes, then an optional extension", so this joins the
+    :func:`fnmatch.translate` translations of those parts instead, and matches
+    exactly the names one of the rules does. Like ``fnmatch``, the match is
+    case-insensitive on Windows only.
+    """
+    # Letters only, so that translating the rules leaves it as it is
+    placeholder = "IMPLEMENTATION"
+    impls = "(?:{})".format("|".join(re.escape(impl) for impl in PYTHON_IMPLEMENTATIONS))
+    base = "|".join(
+        _translate_glob(rule.format(placeholder)).replace(placeholder, impls)
+        for rule in RULES_BASE
+    )
+    exts = "|".join(_translate_glob(f".{ext}") for ext in sorted(KNOWN_EXTS) if ext)
+    suffix = ""
+    if exts:
+        suffix = f"(?:{exts}){'?' if '' in KNOWN_EXTS else ''}"
+    flags = re.DOTALL | (re.IGNORECASE if os.name == "nt" else 0)
+    return re.compile(rf"(?:{base}){suffix}\Z", flags)
+
+
+MATCH_RULES_MATCHER = _compile_match_rules()
+
+
 def ensure_path(path: Path | str) -> Path:
     """
     Given a path (either a string or a Path object), expand variables and return a Path object.
@@ -178,14 +219,11 @@ def looks_like_python(name: str) -> bool:
     Returns:
         Whether the provided name looks like python.
     """
-    from fnmatch import fnmatch
-
-    if not any(name.lower().startswith(py_name) for py_name in PYTHON_IMPLEMENTATIONS):
+    if not name.lower().startswith(PYTHON_IMPLEMENTATIONS):
         return False
 
-    match = EXE_MATCHER.match(name)
-    if match:
-        return any(fnmatch(name, rule) for rule in MATCH_RULES)
+    if EXE_MATCHER.match(name):
+        return MATCH_RULES_MATCHER.match(name) is not None
 
     return False
 
@@ -200,7 +238,31 @@ def path_is_python(path: Path) -> bool:
     Returns:
         Whether the provided path is an executable path to python.
     """
-    return path_is_known_executable(path) and looks_like_python(path.name)
+    return looks_like_python(path.name) and path_is_known_executable(path)
+
+
+def entry_is_python(entry: os.DirEntry) -> bool:
+    """
+    Determine whether a directory entry is executable and looks like python.
+
+    The name is checked first, so only the few python-like entries cost a system
+    call; ``DirEntry`` answers the directory check from the type information
+    returned with the listing on most platforms.
+
+    Args:
+        entry: An entry returned by ``os.scandir``.
+
+    Returns:
+        Whether the entry is an executable path to python.
+    """
+    if not looks_like_python(entry.name):
+        return False
+    try:
+        if entry.is_dir():
+            return False
+    except OSError:
+        return False
+    return path_is_known_executable(Path(entry.path))
 
 
 def filter_pythons(path: str | Path) -> Iterator[Path]:
@@ -216,13 +278,39 @@ def filter_pythons(path: str | Path) -> Iterator[Path]:
     if not isinstance(path, Path):
         path = Path(str(path))
 
-    if not path.is_dir():
-        return iter([path] if path_is_python(path) else [])
-
     try:
-        return filter(path_is_python, path.iterdir())
+        with os.scandir(path) as entries:
+            pythons = [Path(entry.path) for entry in entries if entry_is_python(entry)]
+    except (NotADirectoryError, FileNotFoundError):
+        return iter([path] if path_is_python(path) else [])
     except (PermissionError, OSError):
         return iter([])
+    return iter(pythons)
+
+
+def file_identity(path: Path | str) -> tuple[str, int, int, int, int] | None:
+    """
+    Get the identity of the file a path points to, following symlinks.
+
+    Args:
+        path: The path to identify.
+
+    Returns:
+        A ``(realpath, device, inode, size, mtime_ns)`` tuple, or None if the path
+        cannot be resolved or stat'ed.
+    """
+    try:
+        realpath = os.path.realpath(str(path))
+        stat_result = os.stat(realpath)
+    except (OSError, ValueError):
+        return None
+    return (
+        realpath,
+        stat_result.st_dev,
+        stat_result.st_ino,
+        stat_result.st_size,
+        stat_result.st_mtime_ns,
+    )
 
 
 def exists_and_is_accessible(path: Path) -> bool:
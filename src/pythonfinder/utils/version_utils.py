@@ -11,6 +11,7 @@ from packaging.version import InvalidVersion
 if TYPE_CHECKING:
     from pathlib import Path
 
+from ..environment import SUBPROCESS_TIMEOUT
 from ..exceptions import InvalidPythonVersion
 
 # Regular expression for parsing Python version strings
@@ -21,25 +22,89 @@ version_re_str = (
 )
 version_re = re.compile(version_re_str)
 
-
-def get_python_version(path: str | Path) -> str:
+# Version spelled after the implementation in an executable name, e.g. ``3.11``
+# in ``python3.11`` or ``pypy3.10``
+name_hint_re = re.compile(r"-?(?P<major>\d)(?:\.(?P<minor>\d+))?")
+# Language version leading a pyenv or asdf install directory name, e.g.
+# ``3.11.4``, ``3.13-dev`` or ``pypy3.10-7.3.12``
+dir_hint_re = re.compile(r"(?:pypy)?(?P<major>\d+)\.(?P<minor>\d+)")
+# Install directory names that state exactly what they hold: CPython builds such
+# as ``3.11.7``, ``3.13.0rc2``, ``3.13t`` or ``3.14-dev``, and PyPy builds such as
+# ``pypy3.10-7.3.15``
+install_dir_re = re.compile(
+    r"(?:(?P<pypy>pypy)(?P<language>\d+\.\d+)-\d+(?:\.\d+)*"
+    r"|(?P<version>\d+\.\d+(?:\.\d+)?(?:(?:a|b|rc)\d+)?)(?P<threaded>t)?(?P<dev>-dev)?)$"
+)
+# Distributions whose install directory is named for the distribution's release,
+# so their Python version is read from ``lib/pythonX.Y``
+DISTRIBUTION_PREFIXES = ("anaconda", "miniconda", "miniforge", "mambaforge")
+lib_dir_re = re.compile(r"python(?P<version>\d+\.\d+)(?P<threaded>t)?$")
+# Header directories of a CPython install prefix, ``include/python3.12`` or
+# ``include/python3.13td``, named for the version and ABI flags
+include_dir_re = re.compile(r"python(?P<version>\d+\.\d+)(?P<abiflags>[a-z]*)$")
+patchlevel_re = re.compile(r"^#define\s+(PY_\w+)\s+(\S+)", re.MULTILINE)
+PATCHLEVEL_RELEASE_LEVELS = {
+    "PY_RELEASE_LEVEL_ALPHA": "a",
+    "PY_RELEASE_LEVEL_BETA": "b",
+    "PY_RELEASE_LEVEL_GAMMA": "rc",
+    "PY_RELEASE_LEVEL_FINAL": "",
+}
+
+
+# Script run by ``probe_python``; it must stay compatible with every interpreter
+# pythonfinder can discover, so no f-strings and only guarded optional imports.
+PROBE_SCRIPT = """
+import struct, sys
+try:
+    import json
+except ImportError:
+    json = None
+if json is None:
+    print(".".join([str(i) for i in sys.version_info[:3]]))
+    sys.exit(0)
+try:
+    import sysconfig
+    gil_disabled = bool(sysconfig.get_config_var("Py_GIL_DISABLED"))
+except Exception:
+    gil_disabled = False
+try:
+    import platform
+    machine = platform.machine()
+except Exception:
+    machine = None
+impl = getattr(sys, "implementation", None)
+print(json.dumps({
+    "version_info": list(sys.version_info[:5]),
+    "sys_version": sys.version.split()[0] if sys.version else "",
+    "implementation": impl.name if impl else sys.subversion[0].lower(),
+    "architecture": str(struct.calcsize("P") * 8) + "bit",
+    "machine": machine,
+    "abiflags": getattr(sys, "abiflags", ""),
+    "prefix": sys.prefix,
+    "base_prefix": getattr(sys, "base_prefix", getattr(sys, "real_prefix", sys.prefix)),
+    "gil_disabled": gil_disabled,
+    "debug": hasattr(sys, "gettotalrefcount"),
+}))
+"""
+
+RELEASE_LEVELS = {"alpha": "a", "beta": "b", "candidate": "rc"}
+
+
+def _run_python(path: str | Path, code: str) -> str:
     """
-    Get python version string using subprocess from a given path.
+    Run a snippet of code with the given interpreter and return its stripped stdout.
 
     Args:
         path: Path to the Python executable.
+        code: The code to pass to ``-c``.
 
     Returns:
-        The Python version string.
+        The output of the interpreter.
 
     Raises:
-        InvalidPythonVersion: If the path is not a valid Python executable.
+        InvalidPythonVersion: If the interpreter can't be run or prints nothing.
     """
-    version_cmd = [
-        str(path),
-        "-c",
-        "import sys; print('.'.join([str(i) for i in sys.version_info[:3]]))",
-    ]
+    cmd = [str(path), "-c", code]
     subprocess_kwargs = {
         "env": os.environ.copy(),
         "universal_newlines": True,
@@ -49,9 +114,9 @@ def get_python_version(path: str | Path) -> str:
     }
 
     try:
-        c = subprocess.Popen(version_cmd, **subprocess_kwargs)
+        c = subprocess.Popen(cmd, **subprocess_kwargs)
         try:
-            out, _ = c.communicate(timeout=5)  # 5 second timeout
+            out, _ = c.communicate(timeout=SUBPROCESS_TIMEOUT)
         except TypeError:  # For Python versions or mocks that don't support timeout
             out, _ = c.communicate()
     except (SystemExit, KeyboardInterrupt, TimeoutError, subprocess.TimeoutExpired):
@@ -65,6 +130,135 @@ def get_python_version(path: str | Path) -> str:
     return out.strip()
 
 
+def get_python_version(path: str | Path) -> str:
+    """
+    Get python version string using subprocess from a given path.
+
+    Args:
+        path: Path to the Python executable.
+
+    Returns:
+        The Python version string.
+
+    Raises:
+        InvalidPythonVersion: If the path is not a valid Python executable.
+    """
+    return _run_python(
+        path, "import sys; print('.'.join([str(i) for i in sys.version_info[:3]]))"
+    )
+
+
+def probe_python(path: str | Path) -> dict[str, Any]:
+    """
+    Collect everything pythonfinder needs to know about an interpreter in one run.
+
+    The returned dictionary always has a ``version`` key holding a version string
+    that :func:`parse_python_version` understands, including any pre-release
+    component. Interpreters that can report more also provide ``implementation``,
+    ``architecture``, ``machine``, ``abiflags``, ``prefix``, ``base_prefix``,
+    ``gil_disabled``, ``debug`` and ``dev`` keys.
+
+    Args:
+        path: Path to the Python executable.
+
+    Returns:
+        A JSON-serializable dictionary describing the interpreter.
+
+    Raises:
+        InvalidPythonVersion: If the path is not a valid Python executable.
+    """
+    return _parse_probe_output(path, _run_python(path, PROBE_SCRIPT))
+
+
+async def _run_python_async(path: str | Path, code: str) -> str:
+    """
+    Run a snippet of code with the given interpreter without blocking the event loop.
+
+    Args:
+        path: Path to the Python executable.
+        code: The code to pass to ``-c``.
+
+    Returns:
+        The stripped output of the interpreter.
+
+    Raises:
+        InvalidPythonVersion: If the interpreter can't be run or prints nothing.
+    """
+    import asyncio
+
+    try:
+        process = await asyncio.create_subprocess_exec(
+            str(path),
+            "-c",
+            code,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+            env=os.environ.copy(),
+        )
+    except OSError:
+        raise InvalidPythonVersion(f"{path} is not a valid python path")
+
+    try:
+        out, _ = await asyncio.wait_for(process.communicate(), SUBPROCESS_TIMEOUT)
+    except asyncio.TimeoutError:
+        raise InvalidPythonVersion(f"{path} is not a valid python path (timeout)")
+    finally:
+        # Don't leave the interpreter running if we timed out or were cancelled
+        if process.returncode is None:
+            process.kill()
+            await process.wait()
+
+    out = out.decode(errors="replace").strip()
+    if not out:
+        raise InvalidPythonVersion(f"{path} is not a valid python path")
+    return out
+
+
+async def probe_python_async(path: str | Path) -> dict[str, Any]:
+    """
+    Asynchronous version of :func:`probe_python`, running the interpreter as an
+    asyncio subprocess.
+
+    Args:
+        path: Path to the Python executable.
+
+    Returns:
+        A JSON-serializable dictionary describing the interpreter.
+
+    Raises:
+        InvalidPythonVersion: If the path is not a valid Python executable.
+    """
+    return _parse_probe_output(path, await _run_python_async(path, PROBE_SCRIPT))
+
+
+def _parse_probe_output(path: str | Path, out: str) -> dict[str, Any]:
+    """
+    Turn the output of ``PROBE_SCRIPT`` into the dictionary returned by
+    :func:`probe_python`.
+    """
+    import json
+
+    try:
+        data = json.loads(out)
+    except ValueError:
+        data = None
+    if not isinstance(data, dict):
+        # Interpreters without ``json`` print a bare version string instead
+        return {"version": out.split()[0]}
+
+    try:
+        major, minor, micro, releaselevel, serial = data.pop("version_info")
+    except (KeyError, TypeError, ValueError):
+        raise InvalidPythonVersion(f"{path} reported an invalid version")
+    version = f"{major}.{minor}.{micro}"
+    if releaselevel in RELEASE_LEVELS:
+        version = f"{version}{RELEASE_LEVELS[releaselevel]}{serial}"
+    data["version"] = version
+    # Builds from a development checkout report e.g. "3.14.0a1+"
+    data["dev"] = str(data.pop("sys_version", "")).endswith("+")
+    return data
+
+
 def parse_python_version(version_str: str) -> dict[str, Any]:
     """
     Parse a Python version string into a dictionary of version components.
@@ -159,6 +353,320 @@ def parse_python_version(version_str: str) -> dict[str, Any]:
     }
 
 
+def _version_hint(match: re.Match[str] | None) -> tuple[int | None, int | None]:
+    if match is None:
+        return None, None
+    minor = match.group("minor")
+    return int(match.group("major")), int(minor) if minor is not None else None
+
+
+def guess_version_from_name(name: str) -> tuple[int | None, int | None]:
+    """
+    Guess the Python version an executable provides from its file name.
+
+    This is only a hint for deciding which candidates are worth running: it is
+    read from names like ``python3.11``, ``python3`` or ``pypy3.10``, and never
+    from what the file contains.
+
+    Args:
+        name: The file name of a Python executable.
+
+    Returns:
+        A ``(major, minor)`` tuple, where either part is None if the name doesn't
+        spell it out.
+    """
+    from .path_utils import EXE_MATCHER
+
+    match = EXE_MATCHER.match(name.lower())
+    if not match:
+        return None, None
+    suffix = match.group(1)[len(match.group("implementation")) :]
+    return _version_hint(name_hint_re.match(suffix))
+
+
+def guess_version_from_dir_name(name: str) -> tuple[int | None, int | None]:
+    """
+    Guess the Python version installed in a pyenv or asdf version directory from
+    the directory's name.
+
+    Distribution names that don't start with the language version, such as
+    ``anaconda3-2023.03`` or ``graalpy-23.1.0``, give no hint.
+
+    Args:
+        name: The name of the version directory.
+
+    Returns:
+        A ``(major, minor)`` tuple, or ``(None, None)`` if there is no hint.
+    """
+    return _version_hint(dir_hint_re.match(name))
+
+
+def version_hint_matches(
+    hint: tuple[int | None, int | None],
+    major: int | None = None,
+    minor: int | None = None,
+) -> bool:
+    """
+    Check whether a version hint is compatible with a version query.
+
+    Args:
+        hint: A ``(major, minor)`` hint, as returned by :func:`guess_version_from_name`.
+        major: The major version being looked for.
+        minor: The minor version being looked for.
+
+    Returns:
+        False if the hint rules the query out, True otherwise.
+    """
+    hint_major, hint_minor = hint
+    return (major is None or hint_major is None or hint_major == major) and (
+        minor is None or hint_minor is None or hint_minor == minor
+    )
+
+
+def guess_install_metadata(version_dir: Path) -> dict[str, Any] | None:
+    """
+    Describe the Python installed in a pyenv or asdf version directory from the
+    directory's layout alone, without running it.
+
+    The version comes from the directory's name when it states one exactly, as
+    in ``3.11.7``. Names that only state the language version, as in
+    ``3.14-dev``, ``3.13t`` or ``pypy3.10-7.3.15``, and distributions such as
+    ``anaconda3-2024.02``, whose language version is read from ``lib/pythonX.Y``,
+    need the install's ``patchlevel.h`` for the rest. Other names, such as those
+    of virtualenvs, give nothing.
+
+    Args:
+        version_dir: The install's version directory.
+
+    Returns:
+        A dictionary shaped like the one :func:`probe_python` returns, or None if
+        the layout doesn't say which Python it holds.
+    """
+    name = version_dir.name
+    match = install_dir_re.match(name)
+    threaded = False
+    dev = False
+    implementation = "cpython"
+    if match and match.group("pypy"):
+        version = match.group("language")
+        implementation = "pypy"
+    elif match:
+        version = match.group("version")
+        threaded = bool(match.group("threaded"))
+        dev = bool(match.group("dev"))
+    elif name.lower().startswith(DISTRIBUTION_PREFIXES):
+        try:
+            with os.scandir(version_dir / "lib") as entries:
+                lib_matches = [lib_dir_re.match(entry.name) for entry in entries]
+        except OSError:
+            return None
+        lib_matches = [m for m in lib_matches if m]
+        if len(lib_matches) != 1:
+            return None
+        version = lib_matches[0].group("version")
+        threaded = bool(lib_matches[0].group("threaded"))
+    else:
+        return None
+
+    if version.count(".") == 1 and implementation == "pypy":
+        header = version_dir / "include" / f"pypy{version}" / "patchlevel.h"
+        try:
+            patchlevel = _patchlevel_version(_read_patchlevel(header), version)
+        except OSError:
+            return None
+        if patchlevel is None:
+            return None
+        version, dev = patchlevel[0], dev or patchlevel[1]
+    elif version.count(".") == 1:
+        major, minor = version.split(".")
+        metadata = guess_prefix_metadata(version_dir, (int(major), int(minor)))
+        if metadata is None or metadata["gil_disabled"] is not threaded:
+            return None
+        metadata["dev"] = dev or metadata["dev"]
+        return metadata
+
+    return {
+        "version": version,
+        "implementation": implementation,
+        "abiflags": "t" if threaded else None,
+        "prefix": str(version_dir),
+        "base_prefix": str(version_dir),
+        "gil_disabled": threaded,
+        "dev": dev,
+    }
+
+
+def _read_pyvenv_cfg(path: Path) -> dict[str, str]:
+    values = {}
+    with open(path, encoding="utf-8") as fh:
+        for line in fh:
+            key, sep, value = line.partition("=")
+            if sep:
+                values[key.strip().lower()] = value.strip()
+    return values
+
+
+def guess_venv_metadata(venv_root: Path) -> dict[str, Any] | None:
+    """
+    Describe the Python of a virtual environment from its ``pyvenv.cfg``, without
+    running it.
+
+    The version recorded by ``venv``, ``virtualenv`` or ``uv`` is only trusted if
+    ``pyvenv.cfg`` is at least as new as the base interpreter it names: a base
+    interpreter upgraded in place since the environment was created may no
+    longer be the version recorded.
+
+    Args:
+        venv_root: The root directory of the virtual environment.
+
+    Returns:
+        A dictionary shaped like the one :func:`probe_python` returns, or None if
+        the environment's interpreter has to be run.
+    """
+    cfg_path = venv_root / "pyvenv.cfg"
+    try:
+        cfg = _read_pyvenv_cfg(cfg_path)
+        cfg_mtime = os.stat(cfg_path).st_mtime_ns
+    except (OSError, UnicodeDecodeError):
+        return None
+
+    parts = (cfg.get("version_info") or cfg.get("version") or "").split(".")
+    if len(parts) < 2 or not all(part.isdigit() for part in parts[:3]):
+        return None
+    version = ".".join(parts[:3])
+    # virtualenv records the whole of sys.version_info, e.g. 3.13.0.candidate.2
+    if len(parts) == 5 and parts[3] in RELEASE_LEVELS:
+        version = f"{version}{RELEASE_LEVELS[parts[3]]}{parts[4]}"
+
+    home = cfg.get("home")
+    if not home:
+        return None
+    if cfg.get("executable"):
+        base_candidates = [cfg["executable"]]
+    else:
+        suffix = ".exe" if os.name == "nt" else ""
+        names = [f"python{parts[0]}.{parts[1]}", f"python{parts[0]}", "python"]
+        base_candidates = [os.path.join(home, name + suffix) for name in names]
+    for base_executable in base_candidates:
+        try:
+            base_mtime = os.stat(base_executable).st_mtime_ns
+        except OSError:
+            continue
+        if cfg_mtime < base_mtime:
+            return None
+        break
+    else:
+        return None
+
+    implementation = cfg.get("implementation")
+    return {
+        "version": version,
+        "implementation": implementation.lower() if implementation else None,
+        "prefix": str(venv_root),
+        # ``home`` is the base interpreter's bin directory, except on Windows
+        "base_prefix": home if os.name == "nt" else os.path.dirname(home),
+    }
+
+
+def _read_patchlevel(path: Path) -> dict[str, str]:
+    with open(path, encoding="utf-8", errors="replace") as fh:
+        return dict(patchlevel_re.findall(fh.read()))
+
+
+def _patchlevel_version(
+    defines: dict[str, str], language_version: str
+) -> tuple[str, bool] | None:
+    """
+    Read the full version, and whether it's a development build, from the
+    macros of a ``patchlevel.h`` expected to be for ``language_version``.
+    """
+    try:
+        version = "{}.{}.{}".format(
+            int(defines["PY_MAJOR_VERSION"]),
+            int(defines["PY_MINOR_VERSION"]),
+            int(defines["PY_MICRO_VERSION"]),
+        )
+        release_level = PATCHLEVEL_RELEASE_LEVELS[defines["PY_RELEASE_LEVEL"]]
+        serial = int(defines["PY_RELEASE_SERIAL"])
+    except (KeyError, ValueError):
+        return None
+    if version[: version.rindex(".")] != language_version:
+        return None
+    if release_level:
+        version = f"{version}{release_level}{serial}"
+    # Builds from a development checkout define e.g. "3.14.0a1+"
+    return version, defines.get("PY_VERSION", "").strip('"').endswith("+")
+
+
+def guess_prefix_metadata(
+    prefix: Path, minor_hint: tuple[int, int] | None = None
+) -> dict[str, Any] | None:
+    """
+    Describe the CPython installed in a prefix from the files ``make install``
+    puts next to ``bin``, without running it.
+
+    The version, release level and development marker come from
+    ``include/pythonX.Y<abiflags>/patchlevel.h``, and the ABI flags from that
+    directory's name. A matching ``lib/pythonX.Y/_sysconfigdata_<abiflags>_*.py``
+    must exist too, so that stray headers don't pass for an install.
+
+    Args:
+        prefix: The install prefix, e.g. ``/opt/python-3.12``.
+        minor_hint: The ``(major, minor)`` version the interpreter is believed to
+            be, used to choose between several installs sharing the prefix.
+
+    Returns:
+        A dictionary shaped like the one :func:`probe_python` returns, or None if
+        the prefix doesn't hold exactly one matching install.
+    """
+    try:
+        with os.scandir(prefix / "include") as entries:
+            include_matches = [include_dir_re.match(entry.name) for entry in entries]
+    except OSError:
+        return None
+    include_matches = [m for m in include_matches if m]
+    if minor_hint is not None:
+        hinted_version = "{}.{}".format(*minor_hint)
+        include_matches = [
+            m for m in include_matches if m.group("version") == hinted_version
+        ]
+    if len(include_matches) != 1:
+        return None
+    match = include_matches[0]
+    abiflags = match.group("abiflags")
+    gil_disabled = "t" in abiflags
+
+    lib_name = f"python{match.group('version')}{'t' if gil_disabled else ''}"
+    try:
+        with os.scandir(prefix / "lib" / lib_name) as entries:
+            has_sysconfigdata = any(
+                entry.name.startswith(f"_sysconfigdata_{abiflags}_")
+                and entry.name.endswith(".py")
+                for entry in entries
+            )
+        defines = _read_patchlevel(prefix / "include" / match.group(0) / "patchlevel.h")
+    except OSError:
+        return None
+    if not has_sysconfigdata:
+        return None
+
+    patchlevel = _patchlevel_version(defines, match.group("version"))
+    if patchlevel is None:
+        return None
+    version, dev = patchlevel
+
+    return {
+        "version": version,
+        "implementation": "cpython",
+        "abiflags": abiflags,
+        "prefix": str(prefix),
+        "base_prefix": str(prefix),
+        "gil_disabled": gil_disabled,
+        "debug": "d" in abiflags,
+        "dev": dev,
+    }
+
+
 def guess_company(path: str) -> str | None:
     """
     Given a path to python, guess the company who created it.
@@ -0,0 +1,150 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import os
+from typing import TYPE_CHECKING
+from unittest import mock
+
+import pytest
+
+from pythonfinder import AsyncFinder, Finder
+from pythonfinder.exceptions import InvalidPythonVersion
+from pythonfinder.finders import PathFinder
+from pythonfinder.utils.version_utils import probe_python_async
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+pytestmark = pytest.mark.skipif(os.name == "nt", reason="Requires POSIX shell scripts")
+
+
+def _make_fake_python(directory: Path, name: str, version: str) -> Path:
+    """Write a script that answers the probe like an interpreter of the given version."""
+    major, minor, micro = (int(part) for part in version.split("."))
+    output = json.dumps(
+        {
+            "version_info": [major, minor, micro, "final", 0],
+            "sys_version": version,
+            "implementation": "cpython",
+            "architecture": "64bit",
+        }
+    )
+    directory.mkdir(parents=True, exist_ok=True)
+    path = directory / name
+    path.write_text(f"#!/bin/sh\necho '{output}'\n")
+    path.chmod(0o755)
+    return path
+
+
+def _async_finder(*paths: Path, **kwargs) -> AsyncFinder:
+    finder = Finder(global_search=False, **kwargs)
+    finder.finders = [PathFinder(paths=list(paths), probe_store=finder.probe_store)]
+    return AsyncFinder(finder=finder, max_workers=kwargs.get("max_workers"))
+
+
+def test_probe_python_async(tmp_path):
+    """Test that probe_python_async parses the probe output like probe_python."""
+    python = _make_fake_python(tmp_path, "python3.9", "3.9.7")
+    metadata = asyncio.run(probe_python_async(python))
+    assert metadata["version"] == "3.9.7"
+    assert metadata["architecture"] == "64bit"
+    assert metadata["dev"] is False
+
+    with pytest.raises(InvalidPythonVersion):
+        asyncio.run(probe_python_async(tmp_path / "missing"))
+
+
+def test_find_all_python_versions(tmp_path):
+    """Test that the async API finds, matches and sorts like the synchronous one."""
+    _make_fake_python(tmp_path, "python3.8", "3.8.10")
+    _make_fake_python(tmp_path, "python3.9", "3.9.7")
+    _make_fake_python(tmp_path, "python2.7", "2.7.18")
+    async_finder = _async_finder(tmp_path)
+
+    pythons = asyncio.run(async_finder.find_all_python_versions(3))
+    assert [p.version_str for p in pythons] == ["3.9.7", "3.8.10"]
+
+    best = asyncio.run(async_finder.find_python_version("3.8"))
+    assert best.path == tmp_path / "python3.8"
+
+    assert asyncio.run(async_finder.find_python_version(4)) is None
+    assert [p.path for p in async_finder.finder.find_all_python_versions(3)] == [
+        p.path for p in pythons
+    ]
+
+
+def test_probes_are_bounded_and_shared(tmp_path):
+    """Test that probes run concurrently up to max_workers, once per interpreter."""
+    for minor in range(8):
+        _make_fake_python(tmp_path, f"python3.{minor}", f"3.{minor}.0")
+    async_finder = _async_finder(tmp_path, max_workers=3)
+    running = 0
+    peak = 0
+    calls = []
+
+    async def probe(path):
+        nonlocal running, peak
+        calls.append(path)
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+        return {"version": f"3.{path.name[-1]}.0"}
+
+    async def search():
+        return await asyncio.gather(
+            async_finder.find_all_python_versions(),
+            async_finder.find_all_python_versions(3),
+        )
+
+    with mock.patch("pythonfinder.async_finder.probe_python_async", side_effect=probe):
+        everything, threes = asyncio.run(search())
+
+    assert len(everything) == len(threes) == 8
+    assert len(calls) == 8
+    assert 1 < peak <= 3
+
+    # The synchronous finder reuses what the async one found
+    with mock.patch("pythonfinder.finders.path_finder.probe_python") as sync_probe:
+        assert len(async_finder.finder.find_all_python_versions()) == 8
+    sync_probe.assert_not_called()
+
+
+def test_unsupported_interpreters(tmp_path):
+    """Test that failing probes are skipped or raised according to ignore_unsupported."""
+    broken = tmp_path / "python3.9"
+    broken.write_text("#!/bin/sh\nexit 1\n")
+    broken.chmod(0o755)
+
+    assert asyncio.run(_async_finder(tmp_path).find_all_python_versions()) == []
+
+    strict = _async_finder(tmp_path)
+    strict.finders[0].ignore_unsupported = False
+    with pytest.raises(InvalidPythonVersion):
+        asyncio.run(strict.find_all_python_versions())
+
+
+def test_which(tmp_path):
+    """Test that which is answered by the wrapped finder."""
+    async_finder = AsyncFinder(global_search=False)
+    with mock.patch.object(
+        async_finder.finder, "which", return_value=tmp_path / "python"
+    ) as which:
+        assert asyncio.run(async_finder.which("python")) == tmp_path / "python"
+    which.assert_called_once_with("python")
+
+
+def test_find_many(tmp_path):
+    """Test that find_many answers each query like find_python_version."""
+    _make_fake_python(tmp_path, "python3.8", "3.8.10")
+    _make_fake_python(tmp_path, "python3.9", "3.9.7")
+    async_finder = _async_finder(tmp_path)
+
+    results = asyncio.run(async_finder.find_many(["3.8", 3, "3.7"]))
+    assert results == {
+        "3.8": async_finder.finder.find_python_version("3.8"),
+        3: async_finder.finder.find_python_version(3),
+        "3.7": None,
+    }
+    assert results[3].path == tmp_path / "python3.9"
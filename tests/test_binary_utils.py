@@ -0,0 +1,152 @@
+from __future__ import annotations
+
+import platform
+import struct
+import sys
+from pathlib import Path
+from unittest import mock
+
+import pytest
+
+from pythonfinder.models.python_info import PythonInfo
+from pythonfinder.utils.binary_utils import (
+    get_binary_architecture,
+    sniff_python_version,
+)
+
+
+def _elf_header(elf_class: int, byte_order: str, machine: int) -> bytes:
+    data = 1 if byte_order == "<" else 2
+    ident = b"\x7fELF" + bytes([elf_class, data, 1]) + b"\0" * 9
+    return ident + struct.pack(f"{byte_order}HH", 2, machine) + b"\0" * 44
+
+
+def _pe_header(machine: int, optional_magic: int) -> bytes:
+    dos_header = b"MZ" + b"\0" * 58 + struct.pack("<I", 0x80)
+    coff_header = b"PE\0\0" + struct.pack("<H", machine) + b"\0" * 18
+    return dos_header.ljust(0x80, b"\0") + coff_header + struct.pack("<H", optional_magic)
+
+
+@pytest.mark.parametrize(
+    "header, expected",
+    [
+        (_elf_header(2, "<", 62), ("64bit", "x86_64")),
+        (_elf_header(1, "<", 3), ("32bit", "x86")),
+        (_elf_header(2, ">", 21), ("64bit", "ppc64")),
+        (_elf_header(2, "<", 183), ("64bit", "aarch64")),
+        (_elf_header(2, "<", 9999), ("64bit", "unknown")),
+        (b"\xcf\xfa\xed\xfe" + struct.pack("<i", 0x0100000C), ("64bit", "arm64")),
+        (b"\xce\xfa\xed\xfe" + struct.pack("<i", 7), ("32bit", "x86")),
+        (_pe_header(0x8664, 0x20B), ("64bit", "x86_64")),
+        (_pe_header(0x014C, 0x10B), ("32bit", "x86")),
+    ],
+)
+def test_get_binary_architecture(tmp_path, header, expected):
+    """Test that executable headers are decoded without running anything."""
+    executable = tmp_path / "python"
+    executable.write_bytes(header)
+    assert get_binary_architecture(executable) == expected
+
+
+def test_get_binary_architecture_universal(tmp_path):
+    """Test that universal Mach-O binaries report the slice for this machine."""
+    slices = [(0x01000007, 3), (0x0100000C, 0)]
+    header = b"\xca\xfe\xba\xbe" + struct.pack(">I", len(slices))
+    for cputype, subtype in slices:
+        header += struct.pack(">iiIII", cputype, subtype, 0, 0, 0)
+    executable = tmp_path / "python"
+    executable.write_bytes(header)
+
+    with mock.patch("platform.machine", return_value="arm64"):
+        assert get_binary_architecture(executable) == ("64bit", "arm64")
+    with mock.patch("platform.machine", return_value="ppc"):
+        assert get_binary_architecture(executable) == ("64bit", "x86_64")
+
+
+def test_get_binary_architecture_unknown(tmp_path):
+    """Test that unrecognized or unreadable files are reported as unknown."""
+    script = tmp_path / "python"
+    script.write_text('#!/bin/sh\nexec python3 "$@"\n')
+    assert get_binary_architecture(script) is None
+
+    java_class = tmp_path / "Main.class"
+    java_class.write_bytes(b"\xca\xfe\xba\xbe\0\0\0\x34")
+    assert get_binary_architecture(java_class) is None
+
+    assert get_binary_architecture(tmp_path / "missing") is None
+    assert get_binary_architecture(tmp_path) is None
+
+
+def test_get_binary_architecture_running_interpreter():
+    """Test the reader against the running interpreter."""
+    arch = get_binary_architecture(sys.executable)
+    if arch is not None:
+        assert arch[0] == f"{struct.calcsize('P') * 8}bit"
+
+
+def test_python_info_architecture_falls_back_for_unknown_formats(tmp_path):
+    """Test that platform.architecture is only consulted for unknown formats."""
+    executable = tmp_path / "python"
+    executable.write_bytes(_elf_header(1, "<", 3))
+    python_info = PythonInfo(path=executable, version_str="3.8.0", major=3)
+
+    with mock.patch(
+        "pythonfinder.models.python_info.platform.architecture",
+        wraps=platform.architecture,
+    ) as architecture:
+        assert python_info.matches(arch="32")
+        architecture.assert_not_called()
+
+        script = tmp_path / "python3"
+        script.write_text("#!/bin/sh\n")
+        python_info = PythonInfo(path=Path(script), version_str="3.8.0", major=3)
+        python_info._get_architecture()
+        architecture.assert_called()
+
+
+def test_sniff_python_version(tmp_path):
+    """Test that the version string compiled into an interpreter is found."""
+    executable = tmp_path / "python3"
+    executable.write_bytes(
+        _elf_header(2, "<", 62)
+        + b"\0/opt/python/3.11.7\0Python %s\0"
+        + b"13.11.2\0"
+        + b"3.10.4\0"
+    )
+    assert sniff_python_version(executable, (3, 11)) == {
+        "version": "3.11.7",
+        "dev": False,
+        "architecture": "64bit",
+        "machine": "x86_64",
+    }
+    # Without a hint or a libpython to go by, the version can't be narrowed down
+    assert sniff_python_version(executable) is None
+
+    dev_build = tmp_path / "python3.13"
+    dev_build.write_bytes(b"\x7fELF\0" + b"3.13.0a1+\0")
+    assert sniff_python_version(dev_build, (3, 13))["dev"] is True
+
+
+def test_sniff_python_version_from_libpython(tmp_path):
+    """Test that embedding executables are identified through their libpython."""
+    bin_dir = tmp_path / "bin"
+    lib_dir = tmp_path / "lib"
+    bin_dir.mkdir()
+    lib_dir.mkdir()
+    executable = bin_dir / "python"
+    executable.write_bytes(b"\x7fELF\0libpython3.12.so.1.0\0libc.so.6\0")
+    (lib_dir / "libpython3.12.so.1.0").write_bytes(b"\0usr/local/3.12.1\0")
+
+    assert sniff_python_version(executable)["version"] == "3.12.1"
+
+
+def test_sniff_python_version_ambiguous(tmp_path):
+    """Test that nothing is guessed when the version strings disagree or are missing."""
+    executable = tmp_path / "python3"
+    executable.write_bytes(b"\x7fELF\0" + b"3.9.1\0" + b"3.9.2\0")
+    assert sniff_python_version(executable, (3, 9)) is None
+
+    empty = tmp_path / "python3.9"
+    empty.write_bytes(b"")
+    assert sniff_python_version(empty, (3, 9)) is None
+    assert sniff_python_version(tmp_path / "missing", (3, 9)) is None
@@ -0,0 +1,323 @@
+from __future__ import annotations
+
+import os
+import threading
+import time
+from pathlib import Path
+from unittest import mock
+
+import pytest
+
+from pythonfinder import Finder
+from pythonfinder.cache import LRUCache, ProbeCache, ProbeStore
+from pythonfinder.finders.path_finder import PathFinder
+
+
+def _make_executable(path, contents="#!/bin/sh\n"):
+    path.write_text(contents)
+    path.chmod(0o755)
+    return path
+
+
+@pytest.mark.skipif(os.name == "nt", reason="Requires symlinks")
+def test_probe_cache_roundtrip(tmp_path):
+    """Test that ProbeCache stores and returns probe data for an unchanged file."""
+    cache = ProbeCache(tmp_path / "cache")
+    python = _make_executable(tmp_path / "python3")
+
+    assert cache.get(python) is None
+    cache.set(python, {"version": "3.8.0"})
+    assert cache.get(python) == {"version": "3.8.0"}
+
+    # Entries are keyed by the real path, so aliases share them
+    alias = tmp_path / "python"
+    alias.symlink_to(python)
+    assert cache.get(alias) == {"version": "3.8.0"}
+
+    cache.clear()
+    assert cache.get(python) is None
+
+
+def test_probe_cache_invalidated_by_file_change(tmp_path):
+    """Test that ProbeCache ignores entries once the file identity changes."""
+    cache = ProbeCache(tmp_path / "cache")
+    python = _make_executable(tmp_path / "python3")
+    cache.set(python, {"version": "3.8.0"})
+
+    _make_executable(tmp_path / "python3", "#!/bin/sh\necho replaced\n")
+    assert cache.get(python) is None
+
+    # A missing file has no entry, and writing one is a no-op
+    missing = tmp_path / "missing"
+    cache.set(missing, {"version": "3.8.0"})
+    assert cache.get(missing) is None
+
+
+def test_probe_cache_ignores_corrupt_entries(tmp_path):
+    """Test that unreadable cache entries are treated as misses."""
+    cache = ProbeCache(tmp_path / "cache")
+    python = _make_executable(tmp_path / "python3")
+    cache.set(python, {"version": "3.8.0"})
+
+    (entry,) = (tmp_path / "cache").glob("*.json")
+    entry.write_text("not json")
+    assert cache.get(python) is None
+
+
+@pytest.mark.skipif(os.name == "nt", reason="Relies on the executable bit")
+def test_path_finder_uses_probe_cache(tmp_path):
+    """Test that PathFinder only spawns an interpreter the cache has not seen."""
+    cache = ProbeCache(tmp_path / "cache")
+    python = _make_executable(tmp_path / "python3")
+
+    with mock.patch(
+        "pythonfinder.finders.path_finder.probe_python",
+        return_value={"version": "3.8.0", "architecture": "64bit"},
+    ) as probe:
+        for _ in range(2):
+            finder = PathFinder(paths=[tmp_path], probe_cache=cache)
+            (python_info,) = finder.find_all_python_versions()
+            assert python_info.path == python
+            assert python_info.version_str == "3.8.0"
+            assert python_info.architecture == "64bit"
+        assert probe.call_count == 1
+
+
+@pytest.mark.skipif(os.name == "nt", reason="Requires symlinks")
+def test_probe_cache_keyed_by_venv(tmp_path):
+    """Test that virtual environments sharing a base interpreter get their own entry."""
+    cache = ProbeCache(tmp_path / "cache")
+    (tmp_path / "base").mkdir()
+    base = _make_executable(tmp_path / "base" / "python3")
+    venvs = []
+    for name in ("venv-a", "venv-b"):
+        bin_dir = tmp_path / name / "bin"
+        bin_dir.mkdir(parents=True)
+        (tmp_path / name / "pyvenv.cfg").write_text("home = base\n")
+        (bin_dir / "python3").symlink_to(base)
+        venvs.append(tmp_path / name)
+
+    def probe(path):
+        prefix = str(Path(path).parent.parent)
+        return {"version": "3.8.0", "prefix": prefix, "base_prefix": str(tmp_path)}
+
+    with mock.patch(
+        "pythonfinder.finders.path_finder.probe_python", side_effect=probe
+    ) as probe_python:
+        for _ in range(2):
+            for venv in venvs:
+                finder = PathFinder(paths=[venv / "bin"], probe_cache=cache)
+                (python_info,) = finder.find_all_python_versions()
+                assert python_info.prefix == str(venv)
+        assert probe_python.call_count == 2
+
+    assert cache.get(base) is None
+    assert cache.get(base, venvs[0])["prefix"] == str(venvs[0])
+
+
+def test_finder_probe_cache_option(tmp_path):
+    """Test that Finder enables, relocates and disables the probe cache."""
+    with mock.patch.dict(os.environ, {"PYTHONFINDER_CACHE_DIR": str(tmp_path)}):
+        finder = Finder(global_search=False, probe_cache=True)
+        assert finder.probe_cache.cache_dir == tmp_path / "probes"
+        assert finder.system_finder.probe_cache is finder.probe_cache
+        assert finder.pyenv_finder.probe_cache is finder.probe_cache
+
+    finder = Finder(global_search=False, probe_cache=tmp_path / "elsewhere")
+    assert finder.probe_cache.cache_dir == tmp_path / "elsewhere"
+
+    finder = Finder(global_search=False, probe_cache=False)
+    assert finder.probe_cache is None
+    assert finder.system_finder.probe_cache is None
+
+
+def test_probe_store_probes_each_key_once():
+    """Test that concurrent requests for one key share the first probe."""
+    store = ProbeStore()
+    calls = []
+
+    def probe():
+        calls.append(1)
+        time.sleep(0.05)
+        return {"version": "3.8.0"}
+
+    results = []
+    threads = [
+        threading.Thread(target=lambda: results.append(store.probe("key", probe)))
+        for _ in range(4)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(calls) == 1
+    assert results == [{"version": "3.8.0"}] * 4
+    assert "key" in store
+    assert len(store) == 1
+
+    store.clear()
+    assert "key" not in store
+
+
+def test_probe_store_shares_failures_and_aliases():
+    """Test that failed probes are stored and aliases accumulate per key."""
+    store = ProbeStore()
+    probe = mock.Mock(side_effect=ValueError("broken"))
+    for _ in range(2):
+        with pytest.raises(ValueError, match="broken"):
+            store.probe("key", probe)
+    assert probe.call_count == 1
+
+    aliases = store.add_alias("key", Path("/usr/bin/python3"))
+    assert store.add_alias("key", Path("/usr/bin/python")) is aliases
+    store.add_alias("key", Path("/usr/bin/python"))
+    assert aliases == [Path("/usr/bin/python3"), Path("/usr/bin/python")]
+
+    store.forget("key")
+    assert "key" not in store
+    assert store.add_alias("key", Path("/usr/bin/python")) == [Path("/usr/bin/python")]
+
+
+def test_probe_store_retries_failures_after_ttl():
+    """Test that a failed probe is only remembered for failure_ttl seconds."""
+    store = ProbeStore(failure_ttl=60)
+    probe = mock.Mock(side_effect=[ValueError("timed out"), {"version": "3.8.0"}])
+    with pytest.raises(ValueError, match="timed out"):
+        store.probe("key", probe)
+    assert "key" in store
+
+    with mock.patch("time.monotonic", return_value=time.monotonic() + 61):
+        assert "key" not in store
+        assert store.probe("key", probe) == {"version": "3.8.0"}
+        assert store.probe("key", probe) == {"version": "3.8.0"}
+    assert probe.call_count == 2
+
+
+def test_probe_store_forgets_interrupted_probes():
+    """Test that a probe interrupted by a BaseException isn't left pending."""
+    store = ProbeStore()
+    with pytest.raises(KeyboardInterrupt):
+        store.probe("key", mock.Mock(side_effect=KeyboardInterrupt))
+    assert "key" not in store
+    assert store.probe("key", lambda: {"version": "3.8.0"}) == {"version": "3.8.0"}
+
+
+@pytest.mark.skipif(os.name == "nt", reason="Relies on the executable bit")
+def test_finders_share_probe_store(tmp_path):
+    """Test that finders sharing a store spawn a directory's interpreter once."""
+    python = _make_executable(tmp_path / "python3")
+    store = ProbeStore()
+    first = PathFinder(paths=[tmp_path], probe_store=store)
+    second = PathFinder(paths=[tmp_path], probe_store=store)
+
+    with mock.patch(
+        "pythonfinder.finders.path_finder.probe_python",
+        return_value={"version": "3.8.0"},
+    ) as probe:
+        assert [p.path for p in first.find_all_python_versions()] == [python]
+        assert [p.path for p in second.find_all_python_versions()] == [python]
+    assert probe.call_count == 1
+
+    finder = Finder(global_search=False)
+    assert finder.pyenv_finder.probe_store is finder.probe_store
+    assert finder.asdf_finder.probe_store is finder.probe_store
+    assert finder.system_finder.probe_store is finder.probe_store
+
+
+def test_lru_cache_evicts_least_recently_used():
+    """Test that a full LRUCache evicts the entry used longest ago and counts it."""
+    cache = LRUCache(maxsize=2)
+    cache["a"] = 1
+    cache["b"] = 2
+    assert cache["a"] == 1
+    cache["c"] = 3
+    assert "b" not in cache
+    assert cache.get("b") is None
+    assert sorted(cache.items()) == [("a", 1), ("c", 3)]
+
+    stats = cache.stats
+    assert (stats.hits, stats.misses, stats.evictions) == (1, 1, 1)
+    assert (stats.size, stats.maxsize) == (2, 2)
+
+    with pytest.raises(ValueError):
+        LRUCache(maxsize=0)
+
+
+def test_lru_cache_ttl():
+    """Test that entries older than the ttl are dropped."""
+    cache = LRUCache(ttl=10)
+    with mock.patch("pythonfinder.cache.time.monotonic", return_value=100.0):
+        cache["a"] = 1
+    with mock.patch("pythonfinder.cache.time.monotonic", return_value=105.0):
+        assert cache["a"] == 1
+    with mock.patch("pythonfinder.cache.time.monotonic", return_value=110.0):
+        assert "a" not in cache
+        assert cache.get("a") is None
+    assert cache.stats.expirations == 1
+    assert len(cache) == 0
+
+
+def test_probe_store_with_bounded_cache():
+    """Test that a ProbeStore backed by an LRUCache forgets old results."""
+    store = ProbeStore(cache=LRUCache(maxsize=2))
+    probe = mock.Mock(return_value={"version": "3.8.0"})
+    for key in ("a", "b", "c", "a"):
+        store.probe(key, probe)
+    assert probe.call_count == 4
+    assert len(store) == 2
+    assert store.cache.stats.evictions == 2
+
+
+@pytest.mark.skipif(os.name == "nt", reason="Relies on the executable bit")
+def test_finder_cache_size(tmp_path):
+    """Test that cache_size bounds what a Finder and its finders remember."""
+    for minor in range(5):
+        _make_executable(tmp_path / f"python3.{minor}")
+    finder = Finder(path=str(tmp_path), global_search=False, cache_size=3, verify=True)
+    assert finder.cache_stats() == {"probe_store": finder.probe_store.cache.stats}
+
+    with mock.patch("pythonfinder.environment.PYENV_INSTALLED", False), mock.patch(
+        "pythonfinder.environment.ASDF_INSTALLED", False
+    ), mock.patch(
+        "pythonfinder.finders.path_finder.probe_python",
+        side_effect=lambda path: {"version": f"{path.name[-3:]}.0"},
+    ) as probe:
+        assert len(finder.find_all_python_versions()) == 5
+        assert probe.call_count == 5
+
+    stats = finder.cache_stats()
+    assert stats["probe_store"].size == 3
+    assert stats["system_finder"].size == 3
+    assert stats["system_finder"].evictions == 2
+    assert isinstance(finder.system_finder._python_versions, LRUCache)
+    assert finder.system_finder._python_versions is not (
+        finder.pyenv_finder._python_versions
+    )
+
+    assert Finder(global_search=False).cache_stats() == {}
+
+
+def test_py_launcher_finder_cache(tmp_path):
+    """Test that the py launcher finder keeps what it found in its cache."""
+    from pythonfinder.finders.py_launcher_finder import PyLauncherFinder
+    from pythonfinder.models.python_info import PythonInfo
+
+    python = tmp_path / "python.exe"
+    cache = LRUCache(maxsize=4)
+    finder = PyLauncherFinder(python_cache=cache)
+    finder._available = True
+    python_info = PythonInfo(path=python, version_str="3.11.9", major=3, minor=11)
+    with mock.patch.object(
+        finder, "_get_py_launcher_versions", return_value=[("3.11", str(python), "*")]
+    ), mock.patch.object(
+        finder, "_create_python_info_from_py_launcher", return_value=python_info
+    ) as create:
+        assert list(finder._iter_pythons()) == [python_info]
+        assert list(finder._iter_pythons()) == [python_info]
+        assert create.call_count == 1
+        assert cache.stats.hits == 1
+
+        finder.invalidate(python)
+        assert list(finder._iter_pythons()) == [python_info]
+        assert create.call_count == 2
@@ -0,0 +1,123 @@
+from __future__ import annotations
+
+import os
+import subprocess
+import sys
+import textwrap
+from unittest import mock
+
+import pytest
+
+from pythonfinder import environment
+
+# The modules `import pythonfinder` has always needed; the time they take isn't
+# counted against its budget
+IMPORT_TIME_BASELINE = (
+    "dataclasses, fnmatch, pathlib, platform, shutil, subprocess, packaging.version"
+)
+# Time `import pythonfinder` may take on top of importing those, in microseconds, as
+# reported by `-X importtime`. It's a small margin over the ~10ms the package's own
+# modules take, so that eagerly importing a module only some searches need is
+# caught; the modules known to be heavy are also checked by test_import_does_no_io.
+IMPORT_TIME_BUDGET_US = 25_000
+# Timings are noisy, so the fastest of this many imports of each is compared
+IMPORT_TIME_RUNS = 15
+
+
+def _run_python(
+    code: str, *args: str, env: dict[str, str] | None = None
+) -> subprocess.CompletedProcess:
+    return subprocess.run(
+        [sys.executable, *args, "-c", textwrap.dedent(code)],
+        capture_output=True,
+        text=True,
+        timeout=60,
+        env=env,
+    )
+
+
+def test_lazy_values_are_memoized():
+    """Test that PATH searches happen on first access only."""
+    environment.is_pyenv_installed.cache_clear()
+    try:
+        with mock.patch("shutil.which", return_value="/usr/bin/pyenv") as which:
+            assert environment.PYENV_INSTALLED is True
+            assert environment.PYENV_INSTALLED is True
+        which.assert_called_once_with("pyenv")
+    finally:
+        environment.is_pyenv_installed.cache_clear()
+
+    with pytest.raises(AttributeError):
+        environment.NOT_AN_ATTRIBUTE  # noqa: B018
+
+
+def test_import_does_no_io():
+    """Test that importing pythonfinder does no I/O and defers optional modules."""
+    result = _run_python(
+        """
+        import platform, shutil, sys
+
+        def fail(*args, **kwargs):
+            raise AssertionError("called at import time")
+
+        shutil.which = platform.architecture = fail
+        import pythonfinder
+        from pythonfinder import environment
+        lazy = ("asyncio", "concurrent.futures", "hashlib", "json", "mmap", "tempfile")
+        for module in lazy:
+            assert module not in sys.modules, module
+        """
+    )
+    assert result.returncode == 0, result.stderr
+
+
+def _import_time(modules: str, env: dict[str, str]) -> int:
+    """Get the cumulative time importing some modules takes, in microseconds."""
+    names = {name.strip() for name in modules.split(",")}
+    result = _run_python(f"import {modules}", "-X", "importtime", env=env)
+    assert result.returncode == 0, result.stderr
+    total = 0
+    for line in result.stderr.splitlines():
+        _, _, fields = line.partition(":")
+        fields = fields.split("|")
+        # Only count the modules imported directly, which include their imports
+        if len(fields) == 3 and fields[2].startswith(" ") and fields[2][1:] in names:
+            total += int(fields[1])
+    return total
+
+
+def test_import_time_budget():
+    """Test that `import pythonfinder` stays within its import time budget."""
+    # Compiling the sources isn't part of the budget, so write their bytecode first
+    env = {k: v for k, v in os.environ.items() if k != "PYTHONDONTWRITEBYTECODE"}
+    assert _run_python("import pythonfinder", env=env).returncode == 0
+
+    baseline = []
+    timings = []
+    for _ in range(IMPORT_TIME_RUNS):
+        baseline.append(_import_time(IMPORT_TIME_BASELINE, env))
+        timings.append(_import_time("pythonfinder", env))
+    assert min(baseline) > 0
+    assert min(timings) - min(baseline) < IMPORT_TIME_BUDGET_US
+
+
+def test_get_python_paths(monkeypatch, tmp_path):
+    """Test that get_python_paths adds pyenv and asdf paths when they are installed."""
+    (tmp_path / "pyenv" / "versions" / "3.9.18").mkdir(parents=True)
+    monkeypatch.setattr(environment, "PYENV_ROOT", tmp_path / "pyenv")
+    monkeypatch.setattr(environment, "ASDF_DATA_DIR", str(tmp_path / "asdf"))
+    monkeypatch.setenv("PATH", "/usr/bin")
+    environment.is_pyenv_installed.cache_clear()
+    environment.is_asdf_installed.cache_clear()
+    try:
+        with mock.patch("shutil.which", return_value=None):
+            assert environment.get_python_paths() == ["/usr/bin"]
+        with mock.patch("shutil.which", return_value="/usr/bin/pyenv"):
+            environment.is_pyenv_installed.cache_clear()
+            assert environment.get_python_paths() == [
+                "/usr/bin",
+                str(tmp_path / "pyenv" / "versions" / "3.9.18" / "bin"),
+            ]
+    finally:
+        environment.is_pyenv_installed.cache_clear()
+        environment.is_asdf_installed.cache_clear()
@@ -1,12 +1,15 @@
 from __future__ import annotations
 
 import os
+from contextlib import contextmanager
 from pathlib import Path
+from unittest import mock
 
 import pytest
 
 from pythonfinder import Finder
 from pythonfinder.models.python_info import PythonInfo
+from pythonfinder.models.version_index import VersionIndex
 
 
 @pytest.fixture
@@ -47,6 +50,22 @@ def test_finder_pyenv_only_initialization():
     assert finder.finders == [finder.pyenv_finder]
 
 
+def test_finder_construction_does_no_io(tmp_path):
+    """Test that finders and their search paths are only set up on first use."""
+
+    def no_io(*args, **kwargs):
+        raise AssertionError("Finder() touched the filesystem")
+
+    with mock.patch("os.stat", no_io), mock.patch("os.lstat", no_io), mock.patch(
+        "os.scandir", no_io
+    ), mock.patch("os.listdir", no_io):
+        finder = Finder(path=str(tmp_path), system=True, probe_cache=tmp_path)
+        assert len(finder.finders) >= 3
+
+    assert tmp_path in finder.system_finder.paths
+    assert finder.finders[0] is finder.pyenv_finder
+
+
 def test_which_method():
     """Test the which method to find an executable."""
     finder = Finder(system=True, global_search=True)
@@ -151,3 +170,309 @@ def test_find_all_python_versions_deduplication():
     if all_versions:
         paths = [version.path for version in all_versions]
         assert len(paths) == len(set(paths))
+
+
+def test_iter_python_versions_is_lazy_and_deduplicated():
+    """Test that iter_python_versions walks finders in order and skips duplicate paths."""
+    finder = Finder(system=True, global_search=True)
+    shared = PythonInfo(
+        path=Path("/usr/bin/python3"), version_str="3.8.0", major=3, minor=8
+    )
+    first = [
+        shared,
+        PythonInfo(path=Path("/opt/python3"), version_str="3.9.0", major=3, minor=9),
+    ]
+    second = mock.MagicMock(
+        side_effect=AssertionError("later finders must not be searched")
+    )
+
+    with mock.patch.object(
+        finder.pyenv_finder, "iter_python_versions", return_value=iter(first)
+    ), mock.patch.object(
+        finder.asdf_finder, "iter_python_versions", return_value=iter([shared])
+    ), mock.patch.object(
+        finder.system_finder, "iter_python_versions", second
+    ):
+        iterator = finder.iter_python_versions(3)
+        assert [next(iterator), next(iterator)] == first
+
+    with mock.patch.object(
+        finder.pyenv_finder, "iter_python_versions", return_value=iter(first)
+    ), mock.patch.object(
+        finder.asdf_finder, "iter_python_versions", return_value=iter([shared])
+    ), mock.patch.object(
+        finder.system_finder, "iter_python_versions", return_value=iter([])
+    ):
+        assert list(finder.iter_python_versions(3)) == first
+
+
+def test_refresh_and_invalidate():
+    """Test that refresh and invalidate reach every finder that was built."""
+    finder = Finder(global_search=False)
+    finder.refresh()
+    assert "finders" not in finder.__dict__
+
+    finders = [f for f in finder.finders if f is not None]
+    with mock.patch.object(finder.probe_store, "clear") as clear:
+        with mock.patch.object(finders[0], "invalidate") as first, mock.patch.object(
+            finders[-1], "invalidate"
+        ) as last:
+            finder.invalidate("/usr/bin/python3")
+            first.assert_called_once_with("/usr/bin/python3")
+            last.assert_called_once_with("/usr/bin/python3")
+
+            finder.refresh()
+            first.assert_called_with()
+            last.assert_called_with()
+        clear.assert_called_once_with()
+
+
+def test_py_launcher_revalidates_cached_pythons(tmp_path):
+    """Test that the py launcher finder notices an interpreter being replaced."""
+    from pythonfinder.finders.py_launcher_finder import PyLauncherFinder
+
+    executable = tmp_path / "python.exe"
+    executable.write_text("3.11.8")
+    finder = PyLauncherFinder()
+    finder._available = True
+    launcher_versions = [("3.11", str(executable), "*")]
+    with mock.patch.object(
+        finder, "_get_py_launcher_versions", return_value=launcher_versions
+    ), mock.patch(
+        "pythonfinder.utils.version_utils.probe_python",
+        side_effect=lambda path: {"version": Path(path).read_text()},
+    ) as probe:
+        assert [p.version_str for p in finder._iter_pythons()] == ["3.11.8"]
+        assert [p.version_str for p in finder._iter_pythons()] == ["3.11.8"]
+        assert probe.call_count == 1
+
+        executable.unlink()
+        executable.write_text("3.11.9")
+        assert [p.version_str for p in finder._iter_pythons()] == ["3.11.9"]
+        assert probe.call_count == 2
+
+
+def _python(path, version, company=None):
+    """Build the PythonInfo of an interpreter at path, without probing it."""
+    from packaging.version import Version
+
+    major, minor, patch = (int(part) for part in version.split("."))
+    return PythonInfo(
+        path=Path(path),
+        version_str=version,
+        major=major,
+        minor=minor,
+        patch=patch,
+        company=company,
+        version=Version(version),
+    )
+
+
+@contextmanager
+def _finding(finder, pyenv=(), system=()):
+    """Make a Finder's pyenv, asdf and system finders find the given Pythons."""
+
+    def found(pythons):
+        return mock.Mock(side_effect=lambda *args: iter(pythons))
+
+    with mock.patch.object(
+        finder.pyenv_finder, "iter_python_versions", found(pyenv)
+    ), mock.patch.object(
+        finder.asdf_finder, "iter_python_versions", found([])
+    ), mock.patch.object(
+        finder.system_finder, "iter_python_versions", found(system)
+    ):
+        yield
+
+
+def test_spec_queries():
+    """Test that spec narrows results with a PEP 440 specifier set."""
+    finder = Finder(global_search=False)
+    pyenv = [
+        _python("/pyenv/python3.8.18", "3.8.18"),
+        _python("/pyenv/python3.13.0", "3.13.0"),
+    ]
+    system = [
+        _python("/usr/bin/python3.9.2", "3.9.2"),
+        _python("/usr/bin/python3.11.2", "3.11.2"),
+        _python("/usr/bin/python3.12.1", "3.12.1"),
+    ]
+
+    with _finding(finder, pyenv, system):
+        pythons = finder.find_all_python_versions(spec=">=3.9,<3.13")
+        assert [p.version_str for p in pythons] == ["3.12.1", "3.11.2", "3.9.2"]
+        pythons = finder.find_all_python_versions(3, spec="<3.10")
+        assert [p.version_str for p in pythons] == ["3.9.2", "3.8.18"]
+        # Finders are still tried in priority order
+        assert finder.find_python_version(spec=">=3.8").version_str == "3.13.0"
+        assert finder.find_python_version(spec=">=3.9,<3.13").version_str == "3.12.1"
+        assert finder.find_python_version(spec=">=4") is None
+
+        # Each query's index is built once, until the Pythons found change
+        with mock.patch(
+            "pythonfinder.models.version_index.VersionIndex", wraps=VersionIndex
+        ) as index:
+            pythons = finder.find_all_python_versions(spec="<3.12")
+            assert [p.version_str for p in pythons] == ["3.11.2", "3.9.2", "3.8.18"]
+            assert finder.find_python_version(spec="<3.9").version_str == "3.8.18"
+            assert index.call_count == 0
+            finder.probe_store.generation += 1
+            pythons = finder.find_all_python_versions(spec="==3.11.*")
+            assert [p.version_str for p in pythons] == ["3.11.2"]
+            assert index.call_count == 1
+
+
+def test_find_many(tmp_path):
+    """Test that find_many answers every query from one probe per interpreter."""
+    from pythonfinder.finders import PathFinder
+
+    versions = {
+        "python2.7": "2.7.18",
+        "python3.8": "3.8.18",
+        "python3.9": "3.9.18",
+        "pypy3.9": "3.9.16",
+        os.path.join("free-threaded", "python3"): "3.9.17",
+    }
+    for name in versions:
+        path = tmp_path / name
+        path.parent.mkdir(exist_ok=True)
+        path.touch()
+        path.chmod(0o755)
+
+    def probe(path):
+        name = os.path.relpath(path, tmp_path)
+        probes.append(name)
+        return {
+            "version": versions[name],
+            "implementation": "pypy" if name.startswith("pypy") else "cpython",
+            "gil_disabled": name.startswith("free-threaded"),
+        }
+
+    probes = []
+    finder = Finder(global_search=False)
+    finder.finders = [
+        PathFinder(
+            paths=[tmp_path, tmp_path / "free-threaded"], probe_store=finder.probe_store
+        )
+    ]
+    with mock.patch("pythonfinder.finders.path_finder.probe_python", side_effect=probe):
+        results = finder.find_many(["3.9", "3.8", "3.9t", "pypy3", 2, "3.7", "3.9"])
+
+    assert {query: p and p.path for query, p in results.items()} == {
+        "3.9": tmp_path / "python3.9",
+        "3.8": tmp_path / "python3.8",
+        "3.9t": tmp_path / "free-threaded" / "python3",
+        "pypy3": tmp_path / "pypy3.9",
+        2: tmp_path / "python2.7",
+        "3.7": None,
+    }
+    assert sorted(probes) == sorted(versions)
+
+
+def test_find_many_free_threaded(tmp_path):
+    """Test that a query ending in t only matches free-threaded builds."""
+    from pythonfinder.finders import PathFinder
+
+    gil_python = tmp_path / "python3"
+    free_threaded_python = tmp_path / "free-threaded" / "python3"
+    for path in (gil_python, free_threaded_python):
+        path.parent.mkdir(exist_ok=True)
+        path.touch()
+        path.chmod(0o755)
+
+    def probe(path):
+        free_threaded = path == free_threaded_python
+        return {
+            "version": "3.13.0" if free_threaded else "3.13.1",
+            "gil_disabled": free_threaded,
+        }
+
+    finder = Finder(global_search=False)
+    finder.finders = [
+        PathFinder(
+            paths=[tmp_path, free_threaded_python.parent],
+            probe_store=finder.probe_store,
+        )
+    ]
+    with mock.patch("pythonfinder.finders.path_finder.probe_python", side_effect=probe):
+        results = finder.find_many(["3.13", "3.13t"])
+        assert results["3.13"] == finder.find_python_version("3.13")
+        assert results["3.13"].path == gil_python
+        assert results["3.13t"].path == free_threaded_python
+        assert results["3.13t"].gil_disabled
+
+
+def test_memoized_results(tmp_path):
+    """Test that repeated searches are answered from memory until Pythons change."""
+    from pythonfinder.finders import PathFinder
+
+    def add_python(name, version):
+        path = tmp_path / name
+        path.touch()
+        path.chmod(0o755)
+        versions[name] = version
+        # Make the directory's listing reusable right away
+        os.utime(tmp_path, ns=(1_000_000_000, 1_000_000_000))
+
+    def probe(path):
+        return {"version": versions[os.path.basename(path)]}
+
+    versions = {}
+    add_python("python3.8", "3.8.18")
+    finder = Finder(global_search=False, memoize=True)
+    finder.finders = [PathFinder(paths=[tmp_path], probe_store=finder.probe_store)]
+
+    with mock.patch("pythonfinder.finders.path_finder.probe_python", side_effect=probe):
+        assert finder.find_python_version(3).path.name == "python3.8"
+        assert [p.version_str for p in finder.find_all_python_versions(3)] == ["3.8.18"]
+        generation = finder.generation
+        with mock.patch.object(PathFinder, "_iter_candidates") as iter_candidates:
+            assert finder.find_python_version(3).path.name == "python3.8"
+            assert [p.version_str for p in finder.find_all_python_versions(3)] == [
+                "3.8.18"
+            ]
+        iter_candidates.assert_not_called()
+        assert finder.generation == generation
+
+        # Pythons installed or removed since are noticed from their directory
+        add_python("python3.9", "3.9.18")
+        assert finder.find_python_version(3).path.name == "python3.9"
+        assert [p.version_str for p in finder.find_all_python_versions(3)] == [
+            "3.9.18",
+            "3.8.18",
+        ]
+        assert finder.generation > generation
+
+        (tmp_path / "python3.9").unlink()
+        assert finder.find_python_version(3).path.name == "python3.8"
+
+
+@pytest.mark.parametrize("sort_by_path", [False, True])
+def test_find_python_versions_limit(sort_by_path):
+    """Test that limit picks the same Pythons, in the same order, as a full sort."""
+    pyenv = [
+        _python("/pyenv/3.9/bin/python3", "3.9.18"),
+        _python("/usr/bin/python3", "3.11.2"),
+        _python("/pyenv/3.12/bin/python3", "3.12.1"),
+        _python("/pyenv/3.9/bin/python", "3.9.18"),
+    ]
+    system = [
+        _python("/usr/bin/python3", "3.11.2", company="PythonCore"),
+        _python("/usr/bin/python3.8", "3.8.18"),
+        _python("/usr/local/bin/python3", "3.12.1"),
+    ]
+
+    finder = Finder(global_search=False, sort_by_path=sort_by_path)
+    with _finding(finder, pyenv, system):
+        expected = finder.find_all_python_versions(3)
+        assert len(expected) == 6
+        for limit in range(len(expected) + 2):
+            assert finder.find_python_versions(3, limit=limit) == expected[:limit]
+            assert [p.company for p in finder.find_python_versions(3, limit=limit)] == [
+                p.company for p in expected[:limit]
+            ]
+        assert finder.find_python_versions(3) == expected
+        assert (
+            finder.find_python_versions(3, spec=">=3.11", limit=2)
+            == [p for p in expected if p.minor >= 11][:2]
+        )
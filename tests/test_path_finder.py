@@ -1,11 +1,14 @@
 from __future__ import annotations
 
 import os
+import struct
+import sys
 from pathlib import Path
 from unittest import mock
 
 import pytest
 
+from pythonfinder.exceptions import InvalidPythonVersion
 from pythonfinder.finders.path_finder import PathFinder
 from pythonfinder.models.python_info import PythonInfo
 
@@ -41,7 +44,8 @@ def test_create_python_info():
     # Test with valid Python path
     with mock.patch("pythonfinder.finders.path_finder.path_is_python", return_value=True):
         with mock.patch(
-            "pythonfinder.finders.path_finder.get_python_version", return_value="3.8.0"
+            "pythonfinder.finders.path_finder.probe_python",
+            return_value={"version": "3.8.0"},
         ):
             with mock.patch(
                 "pythonfinder.finders.path_finder.parse_python_version",
@@ -94,7 +98,7 @@ def test_create_python_info():
         # With ignore_unsupported=True
         finder = PathFinder(ignore_unsupported=True)
         with mock.patch(
-            "pythonfinder.finders.path_finder.get_python_version",
+            "pythonfinder.finders.path_finder.probe_python",
             side_effect=Exception("Test exception"),
         ):
             python_info = finder._create_python_info(Path("/usr/bin/python"))
@@ -103,13 +107,52 @@ def test_create_python_info():
         # With ignore_unsupported=False
         finder = PathFinder(ignore_unsupported=False)
         with mock.patch(
-            "pythonfinder.finders.path_finder.get_python_version",
+            "pythonfinder.finders.path_finder.probe_python",
             side_effect=Exception("Test exception"),
         ):
             with pytest.raises(Exception, match="Test exception"):
                 finder._create_python_info(Path("/usr/bin/python"))
 
 
+def test_create_python_info_from_probe_metadata():
+    """Test that a single probe populates every field, including the architecture."""
+    finder = PathFinder()
+    metadata = {
+        "version": "3.13.0rc2",
+        "implementation": "cpython",
+        "architecture": "64bit",
+        "machine": "x86_64",
+        "abiflags": "td",
+        "prefix": "/opt/python",
+        "base_prefix": "/opt/python",
+        "gil_disabled": True,
+        "debug": True,
+        "dev": False,
+    }
+
+    with mock.patch("pythonfinder.finders.path_finder.path_is_python", return_value=True):
+        with mock.patch(
+            "pythonfinder.finders.path_finder.probe_python", return_value=metadata
+        ):
+            python_info = finder._create_python_info(Path("/opt/python/bin/python3.13t"))
+
+    assert python_info.version_str == "3.13.0rc2"
+    assert (python_info.major, python_info.minor, python_info.patch) == (3, 13, 0)
+    assert python_info.is_prerelease is True
+    assert python_info.is_debug is True
+    assert python_info.implementation == "cpython"
+    assert python_info.abiflags == "td"
+    assert python_info.prefix == "/opt/python"
+    assert python_info.base_prefix == "/opt/python"
+    assert python_info.gil_disabled is True
+
+    with mock.patch(
+        "pythonfinder.models.python_info.platform.architecture"
+    ) as architecture:
+        assert python_info.matches(major=3, arch="64")
+        architecture.assert_not_called()
+
+
 def test_iter_pythons(simple_path_finder):
     """Test that _iter_pythons correctly iterates over Python executables."""
     # Mock the paths
@@ -140,11 +183,15 @@ def test_iter_pythons(simple_path_finder):
         patch=0,
     )
 
-    # Mock the _create_python_info method
+    # Mock the _create_python_info method; probes may run on worker threads, so
+    # map each path to its PythonInfo instead of relying on call order
+    python_infos = {
+        info.path: info for info in (python_info1, python_info2, python_info3)
+    }
     with mock.patch.object(
         simple_path_finder,
         "_create_python_info",
-        side_effect=[python_info1, python_info2, python_info3],
+        side_effect=python_infos.get,
     ):
         # Mock the path_is_python function
         with mock.patch(
@@ -176,6 +223,68 @@ def test_iter_pythons(simple_path_finder):
                         assert simple_path_finder._python_versions[path3] == python_info3
 
 
+@pytest.mark.parametrize("max_workers", [1, 4])
+def test_iter_pythons_preserves_order(max_workers):
+    """Test that concurrent probing yields results in search order, probing each path once."""
+    paths = [Path(f"/usr/bin/python3.{minor}") for minor in range(10)]
+    finder = PathFinder(paths=[Path("/usr/bin")], max_workers=max_workers)
+    calls = []
+
+    def create_python_info(path, probe=None):
+        calls.append(path)
+        return PythonInfo(path=path, version_str="3.0.0", major=3)
+
+    with mock.patch.object(
+        finder, "_create_python_info", side_effect=create_python_info
+    ), mock.patch.object(finder, "_iter_candidates", return_value=paths + paths[:2]):
+        pythons = list(finder._iter_pythons())
+        assert [p.path for p in pythons] == paths + paths[:2]
+        assert sorted(calls) == sorted(paths)
+
+        # A second pass is served from the cache without probing again
+        assert [p.path for p in finder._iter_pythons()] == paths + paths[:2]
+        assert len(calls) == len(paths)
+
+
+def test_iter_pythons_stops_probing_early():
+    """Test that abandoning the iterator does not probe every remaining candidate."""
+    paths = [Path(f"/usr/bin/python3.{minor}") for minor in range(20)]
+    finder = PathFinder(paths=[Path("/usr/bin")], max_workers=2)
+    calls = []
+
+    def create_python_info(path, probe=None):
+        calls.append(path)
+        return PythonInfo(path=path, version_str="3.0.0", major=3)
+
+    with mock.patch.object(
+        finder, "_create_python_info", side_effect=create_python_info
+    ), mock.patch.object(finder, "_iter_candidates", return_value=iter(paths)):
+        iterator = finder._iter_pythons()
+        assert next(iterator).path == paths[0]
+        iterator.close()
+        assert len(calls) <= 3
+
+
+def test_iter_python_versions_is_lazy():
+    """Test that iter_python_versions filters in discovery order and stops probing with the consumer."""
+    paths = [Path(f"/usr/bin/python3.{minor}") for minor in range(10)]
+    finder = PathFinder(paths=[Path("/usr/bin")], max_workers=1)
+    calls = []
+
+    def create_python_info(path, probe=None):
+        calls.append(path)
+        minor = int(path.name.rsplit(".", 1)[1])
+        return PythonInfo(path=path, version_str=f"3.{minor}.0", major=3, minor=minor)
+
+    with mock.patch.object(
+        finder, "_create_python_info", side_effect=create_python_info
+    ), mock.patch.object(finder, "_iter_candidates", return_value=iter(paths)):
+        iterator = finder.iter_python_versions("3.2")
+        assert next(iterator).path == paths[2]
+        iterator.close()
+        assert calls == paths[:3]
+
+
 def test_find_all_python_versions(simple_path_finder):
     """Test that find_all_python_versions correctly finds all Python versions."""
     # Mock the PythonInfo objects
@@ -242,7 +351,7 @@ def test_find_all_python_versions(simple_path_finder):
 
 def test_find_python_version(simple_path_finder):
     """Test that find_python_version correctly finds a Python version."""
-    # Mock the find_all_python_versions method
+    # Mock the iter_python_versions method
     python_info = PythonInfo(
         path=Path("/usr/bin/python3"),
         version_str="3.8.0",
@@ -251,8 +360,17 @@ def test_find_python_version(simple_path_finder):
         patch=0,
     )
 
+    older = PythonInfo(
+        path=Path("/usr/bin/python3.8"),
+        version_str="3.8.0rc1",
+        major=3,
+        minor=8,
+        patch=0,
+        is_prerelease=True,
+    )
+
     with mock.patch.object(
-        simple_path_finder, "find_all_python_versions", return_value=[python_info]
+        simple_path_finder, "iter_python_versions", return_value=[older, python_info]
     ):
         # Find a Python version
         result = simple_path_finder.find_python_version(major=3, minor=8)
@@ -260,15 +378,13 @@ def test_find_python_version(simple_path_finder):
         # Check that we got the correct Python version
         assert result == python_info
 
-        # Check that find_all_python_versions was called with the correct parameters
-        simple_path_finder.find_all_python_versions.assert_called_once_with(
+        # Check that iter_python_versions was called with the correct parameters
+        simple_path_finder.iter_python_versions.assert_called_once_with(
             3, 8, None, None, None, None, None
         )
 
     # Test with no matching Python versions
-    with mock.patch.object(
-        simple_path_finder, "find_all_python_versions", return_value=[]
-    ):
+    with mock.patch.object(simple_path_finder, "iter_python_versions", return_value=[]):
         result = simple_path_finder.find_python_version(major=4)
         assert result is None
 
@@ -352,3 +468,436 @@ def test_which(simple_path_finder):
 
                     # Check that we got the correct path with .exe extension
                     assert result == Path("/usr/bin/python.exe")
+
+
+@pytest.mark.skipif(os.name == "nt", reason="Requires symlinks")
+@pytest.mark.parametrize("max_workers", [1, 4])
+def test_aliases_are_probed_once(tmp_path, max_workers):
+    """Test that symlinks to the same interpreter share a single probe."""
+    bin_dir = tmp_path / "bin"
+    bin_dir.mkdir()
+    real_python = bin_dir / "python3.9"
+    real_python.write_text("#!/bin/sh\n")
+    real_python.chmod(0o755)
+    for alias in ("python", "python3"):
+        (bin_dir / alias).symlink_to(real_python)
+
+    # An interpreter symlinked into a virtualenv reports a different prefix
+    venv_bin = tmp_path / "venv" / "bin"
+    venv_bin.mkdir(parents=True)
+    (tmp_path / "venv" / "pyvenv.cfg").write_text(f"home = {bin_dir}\n")
+    (venv_bin / "python").symlink_to(real_python)
+
+    finder = PathFinder(paths=[bin_dir, venv_bin], max_workers=max_workers)
+    with mock.patch(
+        "pythonfinder.finders.path_finder.probe_python",
+        return_value={"version": "3.9.1"},
+    ) as probe:
+        pythons = finder.find_all_python_versions()
+
+    assert probe.call_count == 2
+    assert {p.path for p in pythons} == {
+        bin_dir / "python",
+        bin_dir / "python3",
+        real_python,
+        venv_bin / "python",
+    }
+    system_python = next(p for p in pythons if p.path == real_python)
+    assert sorted(system_python.aliases) == sorted(
+        [bin_dir / "python", bin_dir / "python3", real_python]
+    )
+    venv_python = next(p for p in pythons if p.path == venv_bin / "python")
+    assert venv_python.aliases == [venv_bin / "python"]
+
+
+@pytest.mark.skipif(os.name == "nt", reason="Requires symlinks")
+def test_alias_probe_failures_are_shared(tmp_path):
+    """Test that a failed probe is not retried for every alias."""
+    real_python = tmp_path / "python3.9"
+    real_python.write_text("#!/bin/sh\n")
+    real_python.chmod(0o755)
+    (tmp_path / "python3").symlink_to(real_python)
+
+    finder = PathFinder(paths=[tmp_path], max_workers=1)
+    with mock.patch(
+        "pythonfinder.finders.path_finder.probe_python",
+        side_effect=InvalidPythonVersion("broken"),
+    ) as probe:
+        assert finder.find_all_python_versions() == []
+    assert probe.call_count == 1
+
+
+def _make_executables(directory, *names):
+    directory.mkdir(parents=True, exist_ok=True)
+    for name in names:
+        executable = directory / name
+        executable.write_text("#!/bin/sh\n")
+        executable.chmod(0o755)
+
+
+def _make_binaries(directory, *names):
+    """Write executables with the ELF header of an x86_64 program."""
+    directory.mkdir(parents=True, exist_ok=True)
+    for name in names:
+        executable = directory / name
+        executable.write_bytes(
+            b"\x7fELF\x02\x01\x01" + bytes(9) + struct.pack("<HH", 2, 62) + bytes(44)
+        )
+        executable.chmod(0o755)
+
+
+@pytest.mark.skipif(os.name == "nt", reason="Requires POSIX executables")
+def test_directory_listings_are_reused(tmp_path):
+    """Test that unchanged directories are not listed again."""
+    from pythonfinder.utils.path_utils import filter_pythons
+
+    bin_dir = tmp_path / "bin"
+    _make_executables(bin_dir, "python3.9")
+    os.utime(bin_dir, (1_000_000_000, 1_000_000_000))
+    finder = PathFinder(paths=[bin_dir], max_workers=1)
+
+    with mock.patch(
+        "pythonfinder.finders.path_finder.probe_python",
+        return_value={"version": "3.9.1"},
+    ), mock.patch(
+        "pythonfinder.finders.path_finder.filter_pythons", wraps=filter_pythons
+    ) as listing:
+        assert len(finder.find_all_python_versions()) == 1
+        assert len(finder.find_all_python_versions(3, 9)) == 1
+        assert listing.call_count == 1
+
+        _make_executables(bin_dir, "python3.8")
+        assert len(finder.find_all_python_versions()) == 2
+        # Just modified, so listed again until its timestamps settle
+        assert len(finder.find_all_python_versions()) == 2
+        assert listing.call_count == 3
+
+        os.utime(bin_dir, (1_000_000_001, 1_000_000_001))
+        finder.find_all_python_versions()
+        finder.find_all_python_versions()
+        assert listing.call_count == 4
+
+
+@pytest.mark.skipif(os.name == "nt", reason="Requires POSIX executables")
+def test_cached_results_are_revalidated(tmp_path):
+    """Test that only interpreters changed since they were probed are probed again."""
+    _make_executables(tmp_path, "python3.8", "python3.9")
+    (tmp_path / "python3").symlink_to("python3.9")
+    finder = PathFinder(paths=[tmp_path], max_workers=2, verify=True)
+    probes = []
+
+    def probe(path):
+        # Each probe of an interpreter reports the next patch release
+        name = os.path.basename(os.path.realpath(path))
+        probes.append(name)
+        return {"version": f"{name[-3:]}.{probes.count(name)}"}
+
+    def versions():
+        return sorted(
+            (p.path.name, p.version_str) for p in finder.find_all_python_versions()
+        )
+
+    with mock.patch("pythonfinder.finders.path_finder.probe_python", side_effect=probe):
+        expected = [("python3", "3.9.1"), ("python3.8", "3.8.1"), ("python3.9", "3.9.1")]
+        assert versions() == expected
+        assert versions() == expected
+        assert len(probes) == 2
+
+        # Reinstalled in place: both paths to it are probed again, once
+        (tmp_path / "python3.9").write_text("#!/bin/sh\n# rebuilt\n")
+        expected = [("python3", "3.9.2"), ("python3.8", "3.8.1"), ("python3.9", "3.9.2")]
+        assert versions() == expected
+        assert len(probes) == 3
+
+        finder.invalidate(tmp_path / "python3.8")
+        assert ("python3.8", "3.8.2") in versions()
+        assert len(probes) == 4
+        finder.invalidate()
+        expected = [("python3", "3.9.3"), ("python3.8", "3.8.3"), ("python3.9", "3.9.3")]
+        assert versions() == expected
+
+
+@pytest.mark.skipif(os.name == "nt", reason="Requires POSIX executables")
+def test_invalidate_retries_failed_probes(tmp_path):
+    """Test that invalidating a path whose probe failed probes it again."""
+    _make_executables(tmp_path, "python3")
+    finder = PathFinder(paths=[tmp_path], max_workers=1)
+
+    with mock.patch(
+        "pythonfinder.finders.path_finder.probe_python",
+        side_effect=[InvalidPythonVersion("timed out"), {"version": "3.9.1"}],
+    ) as probe:
+        assert finder.find_all_python_versions() == []
+        assert finder.find_all_python_versions() == []
+        assert probe.call_count == 1
+
+        finder.invalidate(tmp_path / "python3")
+        assert [p.version_str for p in finder.find_all_python_versions()] == ["3.9.1"]
+        assert probe.call_count == 2
+
+
+def test_invalidate_rediscovers_paths(tmp_path):
+    """Test that invalidating everything lists pyenv versions again."""
+    from pythonfinder.finders import PyenvFinder
+
+    _make_executables(tmp_path / "versions" / "3.11.7" / "bin", "python")
+    paths = [tmp_path / "elsewhere"]
+    with mock.patch("pythonfinder.environment.PYENV_INSTALLED", True):
+        finder = PyenvFinder(root=tmp_path)
+        assert finder.paths == [tmp_path / "versions" / "3.11.7" / "bin"]
+        _make_executables(tmp_path / "versions" / "3.12.1" / "bin", "python")
+        finder.invalidate()
+        assert len(finder.paths) == 2
+
+        finder.paths = paths
+        finder.invalidate()
+        assert finder.paths == paths
+
+
+@pytest.mark.skipif(os.name == "nt", reason="Requires POSIX executables")
+def test_version_hints_prune_and_order_probes(tmp_path):
+    """Test that a version query only probes candidates whose names allow it, most specific first."""
+    _make_executables(
+        tmp_path, "python", "python2.7", "python3", "python3.8", "python3.9"
+    )
+    finder = PathFinder(paths=[tmp_path], max_workers=1)
+    probed = []
+
+    def probe(path):
+        probed.append(path.name)
+        return {"version": "3.9.1" if path.name != "python3.8" else "3.8.2"}
+
+    with mock.patch("pythonfinder.finders.path_finder.probe_python", side_effect=probe):
+        iterator = finder.iter_python_versions(3, 9)
+        assert next(iterator).path == tmp_path / "python3.9"
+        assert probed == ["python3.9"]
+        assert [p.path.name for p in iterator] == ["python3", "python"]
+        assert "python3.8" not in probed and "python2.7" not in probed
+
+        # Without a version to look for, every candidate is probed
+        finder.find_all_python_versions()
+        assert sorted(probed) == [
+            "python",
+            "python2.7",
+            "python3",
+            "python3.8",
+            "python3.9",
+        ]
+
+
+@pytest.mark.skipif(os.name == "nt", reason="Requires POSIX executables")
+def test_version_hints_only_reorder_version_queries(tmp_path):
+    """Test that Pythons come out in discovery order unless a version is asked for."""
+    _make_executables(tmp_path, "python", "python3", "python3.9")
+    finder = PathFinder(paths=[tmp_path], max_workers=1)
+    listed = [path.name for path in finder._iter_candidates()]
+
+    with mock.patch(
+        "pythonfinder.finders.path_finder.probe_python",
+        return_value={"version": "3.9.1"},
+    ):
+        assert [p.path.name for p in finder.iter_python_versions()] == listed
+        assert [p.path.name for p in finder.iter_python_versions(3, 9)] == [
+            "python3.9",
+            "python3",
+            "python",
+        ]
+        # Equally good matches are told apart by the order they were found in
+        assert finder.find_python_version(3, 9).path.name == "python3.9"
+        assert finder.find_python_version().path.name == listed[0]
+
+
+@pytest.mark.skipif(os.name == "nt", reason="Requires symlinks")
+def test_version_hints_follow_symlinks(tmp_path):
+    """Test that symlinks are hinted by the name of the file they point to."""
+    _make_executables(tmp_path, "python3.13")
+    (tmp_path / "python3.1").symlink_to(tmp_path / "python3.13")
+    finder = PathFinder(paths=[tmp_path], max_workers=1)
+
+    with mock.patch(
+        "pythonfinder.finders.path_finder.probe_python",
+        return_value={"version": "3.13.5"},
+    ):
+        assert finder.find_all_python_versions(3, 13)
+        assert not finder.find_all_python_versions(3, 1)
+
+
+@pytest.mark.skipif(os.name == "nt", reason="Requires POSIX executables")
+def test_version_hints_skip_install_dirs(tmp_path):
+    """Test that install directories named for another version are not searched."""
+    from pythonfinder.finders import PyenvFinder
+
+    versions_dir = tmp_path / "versions"
+    for version in ("3.8.18", "3.9.18", "anaconda3-2023.03"):
+        _make_executables(versions_dir / version / "bin", "python", "python3")
+
+    finder = PyenvFinder(root=tmp_path, max_workers=1, verify=True)
+    probed = []
+
+    def probe(path):
+        probed.append(path.parent.parent.name)
+        return {"version": "3.9.18"}
+
+    with mock.patch("pythonfinder.environment.PYENV_INSTALLED", True), mock.patch(
+        "pythonfinder.finders.path_finder.probe_python", side_effect=probe
+    ):
+        finder.find_all_python_versions(3, 9)
+    assert sorted(set(probed)) == ["3.9.18", "anaconda3-2023.03"]
+
+
+@pytest.mark.skipif(os.name == "nt", reason="Requires POSIX executables")
+def test_pyenv_versions_identified_from_layout(tmp_path):
+    """Test that pyenv installs named for their version are not run unless verifying."""
+    from pythonfinder.finders import PyenvFinder
+
+    versions_dir = tmp_path / "versions"
+    _make_binaries(versions_dir / "3.11.7" / "bin", "python", "python3")
+    pypy = versions_dir / "pypy3.10-7.3.15"
+    _make_binaries(pypy / "bin", "pypy3")
+    anaconda = versions_dir / "anaconda3-2024.02"
+    _make_binaries(anaconda / "bin", "python")
+    # Entry point scripts installed next to the interpreter are run, not trusted
+    _make_executables(anaconda / "bin", "anaconda")
+    for include_dir, version in (
+        (pypy / "include" / "pypy3.10", (3, 10, 14)),
+        (anaconda / "include" / "python3.11", (3, 11, 7)),
+    ):
+        include_dir.mkdir(parents=True)
+        (include_dir / "patchlevel.h").write_text(
+            "#define PY_MAJOR_VERSION {}\n#define PY_MINOR_VERSION {}\n"
+            "#define PY_MICRO_VERSION {}\n"
+            "#define PY_RELEASE_LEVEL PY_RELEASE_LEVEL_FINAL\n"
+            "#define PY_RELEASE_SERIAL 0\n".format(*version)
+        )
+    lib_dir = anaconda / "lib" / "python3.11"
+    lib_dir.mkdir(parents=True)
+    (lib_dir / "_sysconfigdata__linux_x86_64-linux-gnu.py").touch()
+    _make_executables(versions_dir / "myenv" / "bin", "python")
+
+    def probe(path):
+        if path.name == "anaconda":
+            raise InvalidPythonVersion("not a Python interpreter")
+        return {"version": "3.12.1"}
+
+    with mock.patch("pythonfinder.environment.PYENV_INSTALLED", True), mock.patch(
+        "pythonfinder.finders.path_finder.probe_python", side_effect=probe
+    ) as probe:
+        pythons = PyenvFinder(root=tmp_path, max_workers=1).find_all_python_versions()
+        assert sorted(call.args[0].name for call in probe.call_args_list) == [
+            "anaconda",
+            "python",
+        ]
+        by_dir = {p.path.parent.parent.name: p for p in pythons}
+        assert by_dir["myenv"].verified is True
+        assert by_dir["3.11.7"].version_str == "3.11.7"
+        assert by_dir["3.11.7"].verified is False
+        assert by_dir["pypy3.10-7.3.15"].implementation == "pypy"
+        assert by_dir["pypy3.10-7.3.15"].version_str == "3.10.14"
+        assert by_dir["anaconda3-2024.02"].version_str == "3.11.7"
+        assert "anaconda" not in [p.path.name for p in pythons]
+
+        probe.reset_mock()
+        pythons = PyenvFinder(
+            root=tmp_path, max_workers=1, verify=True
+        ).find_all_python_versions()
+        assert probe.call_count == 6
+        assert all(p.verified for p in pythons)
+
+
+def test_venv_interpreters_identified_from_pyvenv_cfg(tmp_path):
+    """Test that a fresh virtual environment is described by its pyvenv.cfg."""
+    import venv
+
+    venv.create(tmp_path / "venv", with_pip=False, symlinks=os.name != "nt")
+    bin_dir = tmp_path / "venv" / ("Scripts" if os.name == "nt" else "bin")
+
+    with mock.patch("pythonfinder.finders.path_finder.probe_python") as probe:
+        pythons = PathFinder(paths=[bin_dir], max_workers=1).find_all_python_versions()
+    probe.assert_not_called()
+    assert pythons
+    for python_info in pythons:
+        assert python_info.verified is False
+        assert (python_info.major, python_info.minor, python_info.patch) == (
+            sys.version_info[:3]
+        )
+        assert python_info.prefix == str(tmp_path / "venv")
+
+    with mock.patch(
+        "pythonfinder.finders.path_finder.probe_python",
+        return_value={"version": "3.9.1"},
+    ) as probe:
+        pythons = PathFinder(
+            paths=[bin_dir], max_workers=1, verify=True
+        ).find_all_python_versions()
+    assert probe.called
+    assert all(p.verified for p in pythons)
+
+
+@pytest.mark.skipif(os.name == "nt", reason="Requires POSIX executables")
+def test_prefix_installs_identified_from_patchlevel(tmp_path):
+    """Test that interpreters installed with their headers are not run unless verifying."""
+    prefix = tmp_path / "opt" / "python"
+    _make_binaries(prefix / "bin", "python3.9")
+    (prefix / "bin" / "python3").symlink_to("python3.9")
+    # Entry point scripts installed next to the interpreter are run, not trusted
+    _make_executables(prefix / "bin", "anaconda")
+    include_dir = prefix / "include" / "python3.9d"
+    include_dir.mkdir(parents=True)
+    (include_dir / "patchlevel.h").write_text(
+        "#define PY_MAJOR_VERSION 3\n#define PY_MINOR_VERSION 9\n"
+        "#define PY_MICRO_VERSION 0\n#define PY_RELEASE_LEVEL PY_RELEASE_LEVEL_BETA\n"
+        '#define PY_RELEASE_SERIAL 4\n#define PY_VERSION "3.9.0b4"\n'
+    )
+    (prefix / "lib" / "python3.9").mkdir(parents=True)
+    (prefix / "lib" / "python3.9" / "_sysconfigdata_d_linux_x86_64-linux-gnu.py").touch()
+
+    def probe(path):
+        if path.name == "anaconda":
+            raise InvalidPythonVersion("not a Python interpreter")
+        return {"version": "3.9.0"}
+
+    with mock.patch(
+        "pythonfinder.finders.path_finder.probe_python", side_effect=probe
+    ) as probe:
+        pythons = PathFinder(
+            paths=[prefix / "bin"], max_workers=1
+        ).find_all_python_versions()
+        assert [call.args[0].name for call in probe.call_args_list] == ["anaconda"]
+        assert [p.path.name for p in pythons] == ["python3", "python3.9"]
+        for python_info in pythons:
+            assert python_info.version_str == "3.9.0b4"
+            assert python_info.is_prerelease is True
+            assert python_info.is_debug is True
+            assert python_info.verified is False
+            assert sorted(p.name for p in python_info.aliases) == ["python3", "python3.9"]
+
+        pythons = PathFinder(
+            paths=[prefix / "bin"], max_workers=1, verify=True
+        ).find_all_python_versions()
+        assert probe.call_count == 3
+        assert pythons[0].version_str == "3.9.0"
+
+
+@pytest.mark.skipif(os.name == "nt", reason="Requires POSIX executables")
+def test_sniff_binaries(tmp_path):
+    """Test that sniff_binaries reads versions from executables instead of running them."""
+    python = tmp_path / "python3.9"
+    python.write_bytes(b"\x7fELF\0Python %s\0" + b"3.9.18\0")
+    python.chmod(0o755)
+
+    with mock.patch(
+        "pythonfinder.finders.path_finder.probe_python",
+        return_value={"version": "3.9.17"},
+    ) as probe:
+        (python_info,) = PathFinder(
+            paths=[tmp_path], max_workers=1, sniff_binaries=True
+        ).find_all_python_versions()
+        probe.assert_not_called()
+        assert python_info.version_str == "3.9.18"
+        assert python_info.verified is False
+
+        (python_info,) = PathFinder(
+            paths=[tmp_path], max_workers=1
+        ).find_all_python_versions()
+        probe.assert_called_once()
+        assert python_info.version_str == "3.9.17"
@@ -1,10 +1,15 @@
 from __future__ import annotations
 
 import os
+from fnmatch import fnmatch
 from pathlib import Path
 from unittest import mock
 
 from pythonfinder.utils.path_utils import (
+    EXE_MATCHER,
+    MATCH_RULES,
+    MATCH_RULES_MATCHER,
+    PYTHON_IMPLEMENTATIONS,
     ensure_path,
     exists_and_is_accessible,
     filter_pythons,
@@ -120,8 +125,8 @@ def test_path_is_known_executable():
 
 def test_looks_like_python():
     """Test that looks_like_python correctly identifies Python executables."""
-    # Mock the fnmatch function to always return True for Python executables
-    with mock.patch("fnmatch.fnmatch", return_value=True):
+    # Mock the rule matcher to always match Python executables
+    with mock.patch("pythonfinder.utils.path_utils.MATCH_RULES_MATCHER"):
         # Test with valid Python names
         assert looks_like_python("python")
         assert looks_like_python("python3")
@@ -148,6 +153,53 @@ def test_looks_like_python():
     assert not looks_like_python("ruby")
 
 
+def test_looks_like_python_matches_fnmatch_rules():
+    """Test that the compiled matcher agrees with matching every rule with fnmatch."""
+    names = [
+        f"{prefix}{impl}{suffix}{ext}"
+        for impl in PYTHON_IMPLEMENTATIONS
+        for prefix in ("", "x", "py")
+        for suffix in (
+            "",
+            "3",
+            "w",
+            "3.8",
+            "3.12",
+            "3.8m",
+            "3.8d",
+            "3-3.8",
+            "3-3.8.1",
+            "3.8-3.8.1",
+            "3.8-debug",
+            "3-config",
+            "3.8-config",
+            "-build",
+            "\n",
+        )
+        for ext in ("", ".exe", ".py", ".sh", ".txt", ".EXE")
+    ]
+    names += ["pip", "pip3", "pythonpypy", "Python3", "PYTHON", "python3.8.exe.exe"]
+    for name in names:
+        expected = bool(
+            any(name.lower().startswith(impl) for impl in PYTHON_IMPLEMENTATIONS)
+            and EXE_MATCHER.match(name)
+            and any(fnmatch(name, rule) for rule in MATCH_RULES)
+        )
+        assert looks_like_python(name) is expected, name
+
+
+def test_match_rules_matcher_agrees_with_fnmatch():
+    """Test that the compiled matcher matches the names each rule does, and only those."""
+    names = set()
+    for rule in MATCH_RULES:
+        for star, char in (("", "3"), ("py-", "m"), ("x", ".")):
+            name = rule.replace("*", star).replace("?", char)
+            names.update((name, name[:-1], f"{name}w"))
+    for name in names:
+        expected = any(fnmatch(name, rule) for rule in MATCH_RULES)
+        assert (MATCH_RULES_MATCHER.match(name) is not None) is expected, name
+
+
 def test_path_is_python():
     """Test that path_is_python correctly identifies Python executable paths."""
     # Test with valid Python path
@@ -178,7 +230,7 @@ def test_path_is_python():
             assert not path_is_python(Path("/usr/bin/not-python"))
 
 
-def test_filter_pythons():
+def test_filter_pythons(tmp_path):
     """Test that filter_pythons correctly filters Python executables."""
     # Test with a file
     with mock.patch("pythonfinder.utils.path_utils.path_is_python", return_value=True):
@@ -188,32 +240,35 @@ def test_filter_pythons():
         assert pythons[0] == path
 
     # Test with a directory
-    with mock.patch("pathlib.Path.is_dir", return_value=True):
-        with mock.patch(
-            "pathlib.Path.iterdir",
-            return_value=[
-                Path("/usr/bin/python"),
-                Path("/usr/bin/python3"),
-                Path("/usr/bin/not-python"),
-            ],
-        ):
-            with mock.patch(
-                "pythonfinder.utils.path_utils.path_is_python",
-                side_effect=[True, True, False],
-            ):
-                path = Path("/usr/bin")
-                pythons = list(filter_pythons(path))
-                assert len(pythons) == 2
-                assert Path("/usr/bin/python") in pythons
-                assert Path("/usr/bin/python3") in pythons
-                assert Path("/usr/bin/not-python") not in pythons
+    with mock.patch("pythonfinder.utils.path_utils.is_executable", return_value=True):
+        path = tmp_path / "bin"
+        path.mkdir()
+        for name in ("python", "python3", "not-python", "pip"):
+            (path / name).touch()
+        (path / "python3.9").mkdir()
+        pythons = list(filter_pythons(path))
+        assert sorted(pythons) == [path / "python", path / "python3"]
 
     # Test with permission error
-    with mock.patch("pathlib.Path.is_dir", return_value=True):
-        with mock.patch("pathlib.Path.iterdir", side_effect=PermissionError):
-            path = Path("/usr/bin")
-            pythons = list(filter_pythons(path))
-            assert len(pythons) == 0
+    with mock.patch("os.scandir", side_effect=PermissionError):
+        path = Path("/usr/bin")
+        pythons = list(filter_pythons(path))
+        assert len(pythons) == 0
+
+
+def test_filter_pythons_checks_names_before_access(tmp_path):
+    """Test that only python-like entries cost an access check."""
+    for index in range(50):
+        (tmp_path / f"tool-{index}").touch()
+    for name in ("python", "python3"):
+        (tmp_path / name).touch()
+
+    with mock.patch(
+        "pythonfinder.utils.path_utils.os.access", return_value=True
+    ) as access:
+        pythons = list(filter_pythons(tmp_path))
+    assert sorted(pythons) == [tmp_path / "python", tmp_path / "python3"]
+    assert access.call_count == 2
 
 
 def test_exists_and_is_accessible():
@@ -180,6 +180,19 @@ def test_python_info_version_sort():
     assert sorted_versions[7] == python_info5  # Dev release is always last
 
 
+def test_python_info_version_sort_is_cached():
+    """Test that version_sort is computed once and recomputed when its fields change."""
+    python_info = PythonInfo(
+        path=Path("/usr/bin/python3"), version_str="3.8.0", major=3, minor=8, patch=0
+    )
+    assert python_info.version_sort is python_info.version_sort
+
+    python_info.is_prerelease = True
+    assert python_info.version_sort == (0, 3, 8, 0, 1)
+    python_info.aliases = [python_info.path]
+    assert python_info.version_sort == (0, 3, 8, 0, 1)
+
+
 def test_python_info_matches():
     """Test the matches method."""
     python_info = PythonInfo(
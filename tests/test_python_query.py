@@ -0,0 +1,83 @@
+from __future__ import annotations
+
+from pathlib import Path
+from unittest import mock
+
+import pytest
+
+from pythonfinder.finders import PathFinder
+from pythonfinder.models import PythonInfo, PythonQuery, python_query
+
+
+@pytest.mark.parametrize(
+    "args, expected",
+    [
+        (("3.9.1rc1",), PythonQuery(3, 9, 1, True, False, None, None)),
+        (("3.11-64",), PythonQuery(3, 11, None, False, False, "64bit", None)),
+        (("anaconda3-5.3.0",), PythonQuery(name="anaconda3-5.3.0")),
+        (("pypy3",), PythonQuery(name="pypy3")),
+        ((3, 9), PythonQuery(3, 9)),
+        (("3", 9), PythonQuery("3", 9)),
+        ((), PythonQuery()),
+    ],
+)
+def test_parse(args, expected):
+    """Test that queries are parsed like the finders parse their arguments."""
+    assert PythonQuery.parse(*args) == expected
+    assert PythonQuery.parse(expected) is expected
+
+
+def test_query_is_hashable_and_unpacks_in_argument_order():
+    """Test that queries can key a cache and be unpacked into search arguments."""
+    query = PythonQuery.parse("3.9.1rc1")
+    assert {query: 1}[PythonQuery.parse("3.9.1rc1")] == 1
+    assert tuple(query) == (3, 9, 1, True, False, None, None)
+    with pytest.raises(AttributeError):
+        query.major = 2
+
+
+def test_version_strings_are_parsed_once():
+    """Test that parsing a version string again reuses the earlier result."""
+    python_query.parse_major.cache_clear()
+    for _ in range(3):
+        PythonQuery.parse("3.10.4")
+    assert python_query.parse_major.cache_info().misses == 1
+
+    # The public method hands out copies of the cached dictionary
+    finder = PathFinder(paths=[])
+    finder.parse_major("3.10.4")["major"] = 2
+    assert finder.parse_major("3.10.4")["major"] == 3
+
+
+def test_finders_accept_queries(tmp_path):
+    """Test that finders and PythonInfo.matches use a query without parsing it."""
+    python_info = PythonInfo(
+        path=tmp_path / "python3.9",
+        version_str="3.9.7",
+        major=3,
+        minor=9,
+        patch=7,
+        name="python3.9",
+    )
+    assert python_info.matches(PythonQuery.parse("3.9"))
+    assert not python_info.matches(PythonQuery.parse("3.9.8"))
+    assert python_info.matches(PythonQuery(3, name="python3"), minor=8)
+
+    finder = PathFinder(paths=[])
+    query = PythonQuery.parse("3.9")
+    with mock.patch.object(
+        PathFinder, "_iter_pythons", return_value=iter([python_info])
+    ) as iter_pythons, mock.patch.object(
+        python_query, "parse_major", side_effect=AssertionError
+    ):
+        assert finder.find_python_version(query) is python_info
+    iter_pythons.assert_called_once_with(3, 9)
+
+
+def test_python_info_name_match():
+    """Test that a named query matches on the interpreter's name."""
+    python_info = PythonInfo(
+        path=Path("/usr/bin/pypy3"), version_str="3.9.16", major=3, name="pypy3"
+    )
+    assert python_info.matches(PythonQuery.parse("pypy"))
+    assert not python_info.matches(PythonQuery.parse("anaconda3"))
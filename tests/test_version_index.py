@@ -0,0 +1,79 @@
+from __future__ import annotations
+
+from pathlib import Path
+from unittest import mock
+
+import pytest
+from packaging.specifiers import SpecifierSet
+from packaging.version import Version
+
+from pythonfinder.models import PythonInfo, VersionIndex
+
+VERSIONS = ["2.7.18", "3.8.18", "3.9.18", "3.10.13", "3.12.1", "3.13.0rc2", "3.13.0"]
+
+
+def _python_info(version: str) -> PythonInfo:
+    parsed = Version(version)
+    return PythonInfo(
+        path=Path(f"/usr/bin/python{version}"),
+        version_str=version,
+        major=parsed.major,
+        minor=parsed.minor,
+        patch=parsed.micro,
+        is_prerelease=parsed.is_prerelease,
+        version=parsed,
+    )
+
+
+@pytest.fixture
+def index():
+    pythons = [_python_info(version) for version in reversed(VERSIONS)]
+    pythons.append(PythonInfo(path=Path("/usr/bin/python"), version_str="?", major=3))
+    return VersionIndex(pythons)
+
+
+def test_filter(index):
+    """Test that a range query finds the Pythons it names, lowest version first."""
+    assert [p.version_str for p in index.filter(">=3.9,<3.13")] == [
+        "3.9.18",
+        "3.10.13",
+        "3.12.1",
+    ]
+    assert [p.version_str for p in index.filter(SpecifierSet("==3.10.13"))] == ["3.10.13"]
+    assert index.filter(">=4") == []
+    assert len(index) == len(VERSIONS)
+
+
+@pytest.mark.parametrize(
+    "spec",
+    [
+        ">3.9.18",
+        "<=3.8.18",
+        "<3.10",
+        "==3.*,!=3.12.1",
+        "~=3.9.0",
+        "~=3.9",
+        ">=3.13.0rc1",
+        "===3.9.18",
+        ">=2.7,<3,>3.9",
+        "",
+    ],
+)
+@pytest.mark.parametrize("prereleases", [None, True, False])
+def test_filter_agrees_with_packaging(index, spec, prereleases):
+    """Test that narrowing by bisection never changes what a specifier set accepts."""
+    expected = [
+        version
+        for version in VERSIONS
+        if SpecifierSet(spec).contains(version, prereleases=prereleases)
+    ]
+    assert [p.version_str for p in index.filter(spec, prereleases)] == expected
+
+
+def test_filter_checks_only_the_bounded_range(index):
+    """Test that range bounds are found by bisection, not by testing every version."""
+    with mock.patch.object(
+        SpecifierSet, "contains", autospec=True, return_value=True
+    ) as contains:
+        index.filter(">=3.9,<3.12")
+    assert contains.call_count == 2
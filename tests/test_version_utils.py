@@ -1,6 +1,9 @@
 from __future__ import annotations
 
+import os
+import struct
 import subprocess
+import sys
 from unittest import mock
 
 import pytest
@@ -10,9 +13,16 @@ from pythonfinder.exceptions import InvalidPythonVersion
 from pythonfinder.utils.version_utils import (
     get_python_version,
     guess_company,
+    guess_install_metadata,
+    guess_prefix_metadata,
+    guess_venv_metadata,
+    guess_version_from_dir_name,
+    guess_version_from_name,
     parse_asdf_version_order,
     parse_pyenv_version_order,
     parse_python_version,
+    probe_python,
+    version_hint_matches,
 )
 
 
@@ -48,6 +58,48 @@ def test_get_python_version():
             get_python_version("/usr/bin/python")
 
 
+def test_probe_python():
+    """Test that probe_python turns the probe output into version metadata."""
+    process_mock = mock.MagicMock()
+    process_mock.communicate.return_value = (
+        '{"version_info": [3, 13, 0, "candidate", 2], "sys_version": "3.13.0rc2+",'
+        ' "implementation": "cpython", "architecture": "64bit", "abiflags": "t",'
+        ' "gil_disabled": true, "debug": false}',
+        "",
+    )
+
+    with mock.patch("subprocess.Popen", return_value=process_mock):
+        metadata = probe_python("/usr/bin/python3.13t")
+    assert metadata["version"] == "3.13.0rc2"
+    assert metadata["dev"] is True
+    assert metadata["implementation"] == "cpython"
+    assert metadata["architecture"] == "64bit"
+    assert metadata["gil_disabled"] is True
+    assert "version_info" not in metadata
+    assert parse_python_version(metadata["version"])["is_prerelease"] is True
+
+    # Interpreters without json report a bare version string
+    process_mock.communicate.return_value = ("2.5.6\n", "")
+    with mock.patch("subprocess.Popen", return_value=process_mock):
+        assert probe_python("/usr/bin/python2.5") == {"version": "2.5.6"}
+
+    # Malformed metadata is rejected
+    process_mock.communicate.return_value = ('{"version_info": null}', "")
+    with mock.patch("subprocess.Popen", return_value=process_mock):
+        with pytest.raises(InvalidPythonVersion):
+            probe_python("/usr/bin/python")
+
+
+def test_probe_python_real_interpreter():
+    """Test the probe script against the running interpreter."""
+    metadata = probe_python(sys.executable)
+    assert parse_python_version(metadata["version"])["major"] == sys.version_info[0]
+    assert metadata["prefix"] == sys.prefix
+    assert metadata["base_prefix"] == sys.base_prefix
+    assert metadata["abiflags"] == getattr(sys, "abiflags", "")
+    assert metadata["architecture"] == f"{struct.calcsize('P') * 8}bit"
+
+
 def test_parse_python_version():
     """Test that parse_python_version correctly parses Python version strings."""
     # Test standard version
@@ -149,6 +201,225 @@ def test_guess_company():
     assert guess_company("/usr/bin/Anaconda3") == "anaconda"
 
 
+@pytest.mark.parametrize(
+    "name, hint",
+    [
+        ("python3.11", (3, 11)),
+        ("python3.8m", (3, 8)),
+        ("python3", (3, None)),
+        ("python", (None, None)),
+        ("pypy3.10", (3, 10)),
+        ("Python2.7.exe", (2, 7)),
+        ("jython", (None, None)),
+        ("ruby", (None, None)),
+    ],
+)
+def test_guess_version_from_name(name, hint):
+    """Test that guess_version_from_name reads the version spelled in an executable name."""
+    assert guess_version_from_name(name) == hint
+
+
+@pytest.mark.parametrize(
+    "name, hint",
+    [
+        ("3.11.4", (3, 11)),
+        ("3.13-dev", (3, 13)),
+        ("3.13t", (3, 13)),
+        ("pypy3.10-7.3.12", (3, 10)),
+        ("pypy-5.7.1", (None, None)),
+        ("anaconda3-2023.03", (None, None)),
+        ("graalpy-23.1.0", (None, None)),
+    ],
+)
+def test_guess_version_from_dir_name(name, hint):
+    """Test that guess_version_from_dir_name only trusts names led by the language version."""
+    assert guess_version_from_dir_name(name) == hint
+
+
+@pytest.mark.parametrize(
+    "name, version, implementation, gil_disabled, dev",
+    [
+        ("3.11.7", "3.11.7", "cpython", False, False),
+        ("3.13.0rc2", "3.13.0rc2", "cpython", False, False),
+        ("3.13.1t", "3.13.1", "cpython", True, False),
+        ("3.13.1-dev", "3.13.1", "cpython", False, True),
+    ],
+)
+def test_guess_install_metadata(
+    tmp_path, name, version, implementation, gil_disabled, dev
+):
+    """Test that install directories named for their version are identified."""
+    metadata = guess_install_metadata(tmp_path / name)
+    assert metadata["version"] == version
+    assert metadata["implementation"] == implementation
+    assert metadata["gil_disabled"] is gil_disabled
+    assert metadata["dev"] is dev
+    assert metadata["prefix"] == str(tmp_path / name)
+
+
+def _make_prefix(prefix, version, abiflags="", level="FINAL", serial=0, suffix=""):
+    major, minor, micro = version.split(".")
+    include_dir = prefix / "include" / f"python{major}.{minor}{abiflags}"
+    include_dir.mkdir(parents=True)
+    (include_dir / "patchlevel.h").write_text(
+        f"#define PY_MAJOR_VERSION\t\t{major}\n"
+        f"#define PY_MINOR_VERSION\t\t{minor}\n"
+        f"#define PY_MICRO_VERSION\t\t{micro}\n"
+        f"#define PY_RELEASE_LEVEL\tPY_RELEASE_LEVEL_{level}\n"
+        f"#define PY_RELEASE_SERIAL\t{serial}\n"
+        f'#define PY_VERSION      \t\t"{version}{suffix}"\n'
+    )
+    lib_dir = prefix / "lib" / f"python{major}.{minor}{'t' if 't' in abiflags else ''}"
+    lib_dir.mkdir(parents=True, exist_ok=True)
+    (lib_dir / f"_sysconfigdata_{abiflags}_linux_x86_64-linux-gnu.py").write_text("")
+
+
+def test_guess_install_metadata_from_patchlevel(tmp_path):
+    """Test that names without a micro version are completed from patchlevel.h."""
+    dev = tmp_path / "3.14-dev"
+    assert guess_install_metadata(dev) is None
+    _make_prefix(dev, "3.14.0", level="ALPHA", serial=1, suffix="+")
+    metadata = guess_install_metadata(dev)
+    assert metadata["version"] == "3.14.0a1"
+    assert metadata["dev"] is True
+
+    # The headers have to be for the build the name promises
+    _make_prefix(tmp_path / "3.13t", "3.13.1")
+    assert guess_install_metadata(tmp_path / "3.13t") is None
+    threaded = tmp_path / "free-threaded" / "3.13t"
+    _make_prefix(threaded, "3.13.1", abiflags="t")
+    metadata = guess_install_metadata(threaded)
+    assert metadata["version"] == "3.13.1"
+    assert metadata["gil_disabled"] is True
+
+    pypy = tmp_path / "pypy3.10-7.3.15"
+    assert guess_install_metadata(pypy) is None
+    (pypy / "include" / "pypy3.10").mkdir(parents=True)
+    (pypy / "include" / "pypy3.10" / "patchlevel.h").write_text(
+        "#define PY_MAJOR_VERSION 3\n#define PY_MINOR_VERSION 10\n"
+        "#define PY_MICRO_VERSION 14\n#define PY_RELEASE_LEVEL PY_RELEASE_LEVEL_FINAL\n"
+        '#define PY_RELEASE_SERIAL 0\n#define PY_VERSION "3.10.14"\n'
+    )
+    metadata = guess_install_metadata(pypy)
+    assert metadata["version"] == "3.10.14"
+    assert metadata["implementation"] == "pypy"
+    assert metadata["dev"] is False
+
+
+def test_guess_install_metadata_from_lib_dir(tmp_path):
+    """Test that distributions are identified from their lib directory, if unambiguous."""
+    anaconda = tmp_path / "anaconda3-2024.02"
+    assert guess_install_metadata(anaconda) is None
+    (anaconda / "lib" / "python3.11").mkdir(parents=True)
+    (anaconda / "lib" / "pkgconfig").mkdir()
+    # The language version alone doesn't say which release is installed
+    assert guess_install_metadata(anaconda) is None
+    _make_prefix(anaconda, "3.11.7")
+    assert guess_install_metadata(anaconda)["version"] == "3.11.7"
+    (anaconda / "lib" / "python3.12").mkdir()
+    assert guess_install_metadata(anaconda) is None
+
+    for name in ("myenv", "3.11-env", "system", "pypy-5.7.1"):
+        assert guess_install_metadata(tmp_path / name) is None
+
+
+def _make_venv(tmp_path, cfg_lines, base_mtime_offset=-10):
+    home = tmp_path / "base" / "bin"
+    home.mkdir(parents=True)
+    base_python = home / "python3.11"
+    base_python.write_text("")
+    venv_root = tmp_path / "venv"
+    venv_root.mkdir()
+    cfg = venv_root / "pyvenv.cfg"
+    cfg.write_text("\n".join([f"home = {home}", *cfg_lines]) + "\n")
+    cfg_mtime = cfg.stat().st_mtime
+    os.utime(base_python, (cfg_mtime + base_mtime_offset,) * 2)
+    return venv_root, base_python
+
+
+def test_guess_venv_metadata(tmp_path):
+    """Test that pyvenv.cfg is read when it is newer than its base interpreter."""
+    venv_root, _ = _make_venv(tmp_path, ["version = 3.11.4"])
+    metadata = guess_venv_metadata(venv_root)
+    assert metadata["version"] == "3.11.4"
+    assert metadata["prefix"] == str(venv_root)
+    if os.name != "nt":
+        assert metadata["base_prefix"] == str(tmp_path / "base")
+
+
+def test_guess_venv_metadata_virtualenv_format(tmp_path):
+    """Test that virtualenv's version_info and implementation keys are understood."""
+    venv_root, _ = _make_venv(
+        tmp_path,
+        ["implementation = CPython", "version_info = 3.11.0.candidate.2"],
+    )
+    metadata = guess_venv_metadata(venv_root)
+    assert metadata["version"] == "3.11.0rc2"
+    assert metadata["implementation"] == "cpython"
+
+
+def test_guess_venv_metadata_untrusted(tmp_path):
+    """Test that stale, incomplete or orphaned pyvenv.cfg files are not trusted."""
+    venv_root, base_python = _make_venv(
+        tmp_path, ["version = 3.11.4"], base_mtime_offset=10
+    )
+    # The base interpreter changed after the environment was created
+    assert guess_venv_metadata(venv_root) is None
+
+    os.utime(base_python, (0, 0))
+    assert guess_venv_metadata(venv_root) is not None
+    base_python.unlink()
+    assert guess_venv_metadata(venv_root) is None
+
+    (venv_root / "pyvenv.cfg").write_text("home = /usr/bin\n")
+    assert guess_venv_metadata(venv_root) is None
+    assert guess_venv_metadata(tmp_path / "missing") is None
+
+
+def test_guess_prefix_metadata(tmp_path):
+    """Test that installs are identified from patchlevel.h and their ABI flags."""
+    _make_prefix(tmp_path / "release", "3.12.1")
+    metadata = guess_prefix_metadata(tmp_path / "release")
+    assert metadata["version"] == "3.12.1"
+    assert metadata["abiflags"] == ""
+    assert metadata["debug"] is metadata["dev"] is metadata["gil_disabled"] is False
+    assert metadata["prefix"] == str(tmp_path / "release")
+
+    _make_prefix(tmp_path / "rc", "3.13.0", "td", level="GAMMA", serial=2, suffix="rc2+")
+    metadata = guess_prefix_metadata(tmp_path / "rc")
+    assert metadata["version"] == "3.13.0rc2"
+    assert metadata["abiflags"] == "td"
+    assert metadata["debug"] is metadata["dev"] is metadata["gil_disabled"] is True
+
+
+def test_guess_prefix_metadata_ambiguous(tmp_path):
+    """Test that prefixes without exactly one complete install give nothing."""
+    _make_prefix(tmp_path, "3.11.7")
+    _make_prefix(tmp_path, "3.12.1")
+    assert guess_prefix_metadata(tmp_path) is None
+    assert guess_prefix_metadata(tmp_path, (3, 11))["version"] == "3.11.7"
+    assert guess_prefix_metadata(tmp_path, (3, 10)) is None
+
+    headers_only = tmp_path / "headers"
+    _make_prefix(headers_only, "3.12.1")
+    for sysconfigdata in (headers_only / "lib" / "python3.12").iterdir():
+        sysconfigdata.unlink()
+    assert guess_prefix_metadata(headers_only) is None
+    assert guess_prefix_metadata(tmp_path / "missing") is None
+
+
+def test_version_hint_matches():
+    """Test that version hints only rule out versions they contradict."""
+    assert version_hint_matches((3, 11), 3, 11)
+    assert version_hint_matches((3, 11), 3)
+    assert version_hint_matches((3, None), 3, 11)
+    assert version_hint_matches((None, None), 2, 7)
+    assert version_hint_matches((3, 11))
+    assert not version_hint_matches((3, 8), 3, 11)
+    assert not version_hint_matches((2, None), 3)
+    assert not version_hint_matches((3, 8), minor=11)
+
+
 def test_parse_pyenv_version_order():
     """Test that parse_pyenv_version_order correctly parses pyenv version order."""
     # Test with existing file